@@ -0,0 +1,231 @@
+# Season Summary awards for race-v17.py.
+# Every award is a small rule over one SeasonStats snapshot (arrays by
+# driver ID / team ID), so a full evaluation is a handful of vectorized
+# passes instead of one Python loop over the grid per award card. Rules
+# register themselves with @award(title) and are evaluated in that order.
+from collections import Counter, namedtuple
+
+import numpy as np
+
+# points / wins / podiums / headstarts   by driver ID
+# team_points / team_wins / team_podiums by team ID
+# ratings        standings.driver_ratings() by driver ID
+# pairs          (teams, 2) driver IDs of each team
+# ranking        driver IDs in championship order
+# podiums_by_race (races, 3) driver IDs of each podium, P1 first
+SeasonStats = namedtuple("SeasonStats", [
+    "races", "points", "wins", "podiums", "ratings", "headstarts",
+    "team_points", "team_wins", "team_podiums", "pairs", "driver_team", "ranking", "podiums_by_race"])
+
+AWARDS = {}
+
+
+def award(title):
+    # Register rule(stats) -> tuple or None under a card title
+    def register(rule):
+        AWARDS[title] = rule
+        return rule
+    return register
+
+
+def season_stats(standings, headstarts, race_summaries, team_drivers):
+    podiums_by_race = np.array([summary.drivers for summary in race_summaries], dtype=np.intp).reshape(-1, 3)
+    return SeasonStats(
+        races=standings.n_races,
+        points=standings.driver_points,
+        wins=standings.driver_wins,
+        podiums=standings.driver_podiums,
+        ratings=standings.ratings,
+        headstarts=np.asarray(headstarts),
+        team_points=standings.team_points,
+        team_wins=standings.team_wins,
+        team_podiums=standings.team_podiums,
+        pairs=np.array(team_drivers, dtype=np.intp).reshape(len(team_drivers), -1),
+        driver_team=standings.driver_team,
+        ranking=standings.driver_ranking,
+        podiums_by_race=podiums_by_race,
+    )
+
+
+def evaluate_awards(stats):
+    # {title: result or None} for every registered award
+    return {title: rule(stats) for title, rule in AWARDS.items()}
+
+
+def _pick(candidates, *keys):
+    # First of candidates (an index array, in tie-break order) maximising
+    # keys lexicographically; None when there are no candidates.
+    for key in keys:
+        if not candidates.size:
+            return None
+        values = key[candidates]
+        candidates = candidates[values == values.max()]
+    return int(candidates[0]) if candidates.size else None
+
+
+@award("Race Winner King")
+def race_winner_king(s):
+    d = int(np.argmax(s.wins))
+    return (d, s.wins[d], s.points[d]) if s.wins[d] > 0 else None
+
+
+@award("Podium Master")
+def podium_master(s):
+    d = int(np.argmax(s.podiums))
+    return (d, s.podiums[d], s.points[d]) if s.podiums[d] > 0 else None
+
+
+@award("Constructor Champion")
+def constructor_champion(s):
+    t = int(np.argmax(s.team_points))
+    return (t, s.team_points[t], s.team_wins[t], s.team_podiums[t]) if s.team_points[t] > 0 else None
+
+
+@award("Mr. Reliable")
+def mr_reliable(s):
+    # Most points without a win
+    d = _pick(np.flatnonzero((s.wins == 0) & (s.points > 0)), s.points)
+    return None if d is None else (d, s.points[d], s.podiums[d])
+
+
+@award("Highest Rated")
+def highest_rated(s):
+    d = int(np.argmax(s.ratings))
+    return d, s.ratings[d], s.points[d]
+
+
+@award("Rising Star")
+def rising_star(s):
+    d = _pick(np.flatnonzero((s.points > 0) & (s.points < 50)), s.points)
+    return None if d is None else (d, s.points[d])
+
+
+@award("Most Improved Team")
+def most_improved_team(s):
+    # Team with most wins over the last three races
+    if len(s.podiums_by_race) < 3:
+        return None
+    t, wins = Counter(s.driver_team[s.podiums_by_race[-3:, 0]].tolist()).most_common(1)[0]
+    return t, wins, s.team_wins[t]
+
+
+@award("Point Scoring Machine")
+def point_scoring_machine(s):
+    d = _pick(np.flatnonzero(s.points > 0), s.points)
+    return None if d is None else (d, s.points[d] / s.races, s.points[d])
+
+
+def _points_per_headstart(s):
+    d = _pick(np.flatnonzero(s.points > 0), s.points / s.headstarts)
+    return None if d is None else (d, s.points[d] / s.headstarts[d], s.points[d], s.headstarts[d])
+
+
+award("Underdog Hero")(_points_per_headstart)
+award("Overachiever")(_points_per_headstart)
+
+
+@award("Best Partnership")
+def best_partnership(s):
+    # Smallest points gap between teammates in a scoring team
+    pair_points = s.points[s.pairs]
+    gap = np.abs(pair_points[:, 0] - pair_points[:, 1])
+    total = pair_points.sum(axis=1)
+    t = _pick(np.flatnonzero(total > 0), -gap)
+    return None if t is None else (t, gap[t], total[t])
+
+
+@award("Giant Killer")
+def giant_killer(s):
+    # Driver outscoring a teammate who has the bigger headstart
+    p = s.points[s.pairs]
+    h = s.headstarts[s.pairs]
+    first = (h[:, 0] < h[:, 1]) & (p[:, 0] > p[:, 1])
+    second = (h[:, 1] < h[:, 0]) & (p[:, 1] > p[:, 0])
+    winner = np.where(second, 1, 0)
+    rows = np.arange(len(p))
+    won = p[rows, winner]
+    lost = p[rows, 1 - winner]
+    ratio = np.divide(won, lost, out=np.ones(len(p)), where=lost > 0)
+    t = _pick(np.flatnonzero(first | second), ratio)
+    return None if t is None else (int(s.pairs[t, winner[t]]), t, ratio[t], won[t], lost[t])
+
+
+@award("Comeback King")
+def comeback_king(s):
+    # Podium score (3/2/1 for P1/P2/P3); ties go to the earliest podium
+    if not len(s.podiums_by_race):
+        return None
+    n = len(s.points)
+    flat = s.podiums_by_race.ravel()
+    score = np.bincount(flat, weights=np.tile([3, 2, 1], len(s.podiums_by_race)), minlength=n).astype(np.int64)
+    first_seen = np.full(n, len(flat))
+    np.minimum.at(first_seen, flat, np.arange(len(flat)))
+    d = _pick(np.flatnonzero(score > 0), score, -first_seen)
+    return d, score[d], s.wins[d]
+
+
+@award("Speed Demon")
+def speed_demon(s):
+    d = _pick(np.flatnonzero((s.headstarts >= 7) & (s.points > 20)), s.points)
+    return None if d is None else (d, s.headstarts[d], s.points[d])
+
+
+@award("Dark Horse")
+def dark_horse(s):
+    d = _pick(np.flatnonzero((s.headstarts <= 3) & ((s.points > 30) | (s.wins > 0))), s.wins, s.points)
+    return None if d is None else (d, s.points[d], s.wins[d], s.headstarts[d])
+
+
+@award("Veteran Excellence")
+def veteran_excellence(s):
+    # Best points per race from 2nd to 6th in the championship
+    chasers = s.ranking[1:6]
+    d = _pick(chasers[s.points[chasers] > 0], s.points)
+    return None if d is None else (d, s.points[d] / s.races, s.points[d], s.podiums[d])
+
+
+@award("Lucky Charm")
+def lucky_charm(s):
+    d = _pick(np.flatnonzero((s.points > 15) & (s.wins == 0) & (s.podiums <= 1)), s.points)
+    return None if d is None else (d, s.points[d])
+
+
+@award("Perfect Storm")
+def perfect_storm(s):
+    # Both drivers on 20+ points and 60+ between them
+    pair_points = s.points[s.pairs]
+    low = pair_points.min(axis=1)
+    total = pair_points.sum(axis=1)
+    t = _pick(np.flatnonzero((low > 20) & (total > 60)), low)
+    return None if t is None else (t, total[t], low[t])
+
+
+@award("Breakthrough Driver")
+def breakthrough_driver(s):
+    # First race winner of the season
+    if not len(s.podiums_by_race):
+        return None
+    d = int(s.podiums_by_race[0, 0])
+    return d, s.wins[d]
+
+
+@award("Team Harmony")
+def team_harmony(s):
+    # Teammates' points closest to equal (min / max), then the higher minimum
+    pair_points = s.points[s.pairs]
+    low = pair_points.min(axis=1)
+    high = pair_points.max(axis=1)
+    total = pair_points.sum(axis=1)
+    balance = np.divide(low, high, out=np.zeros(len(pair_points)), where=high > 0)
+    t = _pick(np.flatnonzero(total > 0), balance, low)
+    return None if t is None else (t, balance[t], total[t], low[t])
+
+
+@award("Championship Contender")
+def championship_contender(s):
+    # Top five with 25+ points and 2+ podiums, by 3/win + 2/podium + 0.1/point
+    top = s.ranking[:5]
+    top = top[(s.points[top] > 25) & (s.podiums[top] >= 2)]
+    score = s.wins * 3 + s.podiums * 2 + s.points * 0.1
+    d = _pick(top, score)
+    return None if d is None else (d, score[d], s.points[d], s.wins[d], s.podiums[d])
@@ -0,0 +1,24 @@
+# Plotly figures serialised once, for the chart caches in race-v17.py /
+# race-v18.py. st.plotly_chart turns a Figure into a plain dict (a deep copy)
+# and then into JSON on every call, and validates a dict it is handed from
+# scratch; a FigureSpec hands it the JSON-ready spec built when the chart was
+# cached, so drawing a cached chart only costs the final json dump.
+import json
+
+import plotly.graph_objects as go
+
+
+class FigureSpec(go.Figure):
+    # Stands in for the figure it was built from; only to_dict() is
+    # answered from the cached spec, so the figure must not be modified
+    def __init__(self, figure):
+        super().__init__()
+        self._spec = json.loads(figure.to_json())
+
+    def to_dict(self):
+        return self._spec
+
+
+def figure_spec(figure):
+    # None (no chart to draw) passes through
+    return None if figure is None else FigureSpec(figure)
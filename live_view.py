@@ -0,0 +1,145 @@
+# Helpers for the live race view in race-v17.py / race-v18.py.
+import os
+import time
+
+import numpy as np
+import streamlit.components.v1 as components
+
+from race_engine import FINISH_LINE
+
+# Speed multipliers offered in the UI; 1× is the original one tick per second
+RACE_SPEEDS = {"1×": 1, "5×": 5, "50×": 50}
+
+# Rows drawn in the live race views; larger fields show the leading rows only
+LIVE_VIEW_ROWS = 20
+
+# Browser-side renderer for the live race rows (live_race_frontend/index.html)
+_live_race = components.declare_component(
+    "live_race", path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "live_race_frontend"))
+
+
+class FrameScheduler:
+    # Decouples the simulation tick rate from the render frame rate.
+    # Ticks come due every tick_seconds / speed seconds of wall time; frames
+    # are drawn at most max_fps times per second. When rendering falls
+    # behind, every tick that came due is still simulated, but only the
+    # latest state is drawn and the intermediate frames are dropped.
+    def __init__(self, speed=1, max_fps=5, tick_seconds=1.0, clock=None, sleep=None):
+        self.clock = clock or time.monotonic
+        self.sleep = sleep or time.sleep
+        self.tick_seconds = tick_seconds / speed
+        self.frame_seconds = 1.0 / max_fps
+        self.started = self.clock()
+        self.last_frame = self.started
+        self.ticks = 0
+        self.pending = 0
+
+    def ticks_due(self):
+        # Same arithmetic as wait(), so a tick wait() slept for is always due
+        now = self.clock()
+        due = 0
+        while self.started + (self.ticks + due + 1) * self.tick_seconds <= now:
+            due += 1
+        return due
+
+    def tick_done(self):
+        self.ticks += 1
+        self.pending += 1
+
+    def frame_due(self):
+        return self.pending > 0 and self.clock() - self.last_frame >= self.frame_seconds
+
+    def frame_rendered(self):
+        self.pending = 0
+        self.last_frame = self.clock()
+
+    def wait(self):
+        # Sleep until the next tick comes due, or until the next frame may be
+        # drawn if simulated ticks are still waiting to be shown.
+        wake = self.started + (self.ticks + 1) * self.tick_seconds
+        if self.pending:
+            wake = min(wake, self.last_frame + self.frame_seconds)
+        delay = wake - self.clock()
+        if delay > 0:
+            self.sleep(delay)
+
+
+class LiveRaceFeed:
+    # Per-frame payload for the live_race component. The browser keeps the
+    # row markup and each driver's name and colours, so a frame only carries
+    # the visible running order, its progress and the finished count; a
+    # driver's style is sent the first time they reach the visible rows.
+    # A remounted component has lost the styles and reports it by setting a
+    # new value (report); every visible style is then sent again.
+    # last is the latest payload, re-sent while no new tick has been
+    # simulated.
+    __slots__ = ("_styled", "frame_ms", "last", "report")
+
+    def __init__(self, frame_seconds):
+        self._styled = set()
+        self.frame_ms = int(1000 * frame_seconds)
+        self.last = None
+        self.report = None
+
+    def frame(self, leaderboard, progress, style, report=None, limit=LIVE_VIEW_ROWS):
+        # style(i) -> [name, team, color, light color] for grid index i;
+        # report is the component's current value
+        if report != self.report:
+            self.report = report
+            self._styled.clear()
+        order = leaderboard.order[:limit].tolist()
+        new = {i: style(i) for i in order if i not in self._styled}
+        self._styled.update(new)
+        payload = {
+            "order": order,
+            "progress": np.asarray(progress)[order].tolist(),
+            "n_finished": min(leaderboard.n_finished, len(order)),
+            "drivers": {str(i): s for i, s in new.items()},
+            "frame_ms": self.frame_ms,
+        }
+        self.last = payload
+        return payload
+
+
+def live_race(payload, key):
+    # Draws one frame of the live race view; calls with the same key update
+    # the rows already in the browser instead of re-creating them. The
+    # component's value (st.session_state[key]) changes whenever it is
+    # missing driver styles.
+    _live_race(**payload, key=key, default=None)
+
+
+class Leaderboard:
+    # Live running order as grid indices: the finished prefix in finishing
+    # order, then the drivers still racing by progress (ties by grid index).
+    # The order is kept between ticks. A tick moves every driver by at most
+    # MAX_INCREMENT, so the previous order is nearly sorted and re-sorting
+    # it is close to linear.
+    __slots__ = ("order", "n_finished")
+
+    def __init__(self, n_drivers):
+        self.order = np.arange(n_drivers)
+        self.n_finished = 0
+
+    def finish(self, indices):
+        # Append newly finished drivers (already in finishing order) to the
+        # finished prefix and drop them from the racing part.
+        indices = np.asarray(indices, dtype=self.order.dtype)
+        if not indices.size:
+            return
+        crossed = np.zeros(len(self.order), dtype=bool)
+        crossed[indices] = True
+        racing = self.order[self.n_finished:]
+        self.order = np.concatenate([self.order[:self.n_finished], indices, racing[~crossed[racing]]])
+        self.n_finished += indices.size
+
+    def update(self, progress):
+        # Re-order the racing drivers after a tick; progress is indexed by grid slot.
+        racing = self.order[self.n_finished:]
+        keys = (FINISH_LINE - np.asarray(progress)[racing]).astype(np.int64) * len(self.order) + racing
+        self.order[self.n_finished:] = racing[np.argsort(keys, kind="stable")]
+
+    def rows(self, limit=None):
+        # (position, grid index, finished) for the leading rows
+        for pos, i in enumerate(self.order[:limit].tolist(), 1):
+            yield pos, i, pos <= self.n_finished
@@ -0,0 +1,72 @@
+# Driver and team colours shared by race-v17.py / race-v18.py.
+# Team colours are parsed once when the palette is built; every variant a
+# view needs (base, light and dark, as CSS hsl() strings, RGB and hex) is
+# precomputed per driver ID, so rendering only indexes into it.
+from types import MappingProxyType
+
+import numpy as np
+
+# Lightness shift of each teammate from the team colour, in grid order
+TEAMMATE_SHIFTS = (5, -5)
+# Lightness shift of the light / dark variants from a driver's base colour
+LIGHT_SHIFT = 20
+DARK_SHIFT = -20
+
+
+def parse_hsl(color):
+    # "hsl(h, s%, l%)" -> (h, s, l) as floats
+    hue, saturation, lightness = color.strip()[4:-1].split(',')
+    return float(hue), float(saturation.strip().rstrip('%')), float(lightness.strip().rstrip('%'))
+
+
+def hsl_to_rgb(hsl):
+    # (n, 3) array of hue in degrees, saturation and lightness in percent
+    # -> (n, 3) uint8 RGB
+    h, s, l = hsl[:, 0:1], hsl[:, 1:2] / 100, hsl[:, 2:3] / 100
+    a = s * np.minimum(l, 1 - l)
+    k = (np.array([0, 8, 4]) + h / 30) % 12
+    rgb = l - a * np.clip(np.minimum(k - 3, 9 - k), -1, 1)
+    return np.rint(rgb * 255).astype(np.uint8)
+
+
+def _css(hsl):
+    return tuple(f"hsl({h}, {s}%, {l}%)" for h, s, l in hsl.tolist())
+
+
+def _hex(rgb):
+    return tuple(f"#{r:02x}{g:02x}{b:02x}" for r, g, b in rgb.tolist())
+
+
+class Palette:
+    # Colours by driver ID (grid order, team by team as in teams_drivers):
+    #   base / light / dark               CSS hsl() strings
+    #   base_rgb / light_rgb / dark_rgb   (drivers, 3) uint8 arrays
+    #   base_hex / light_hex / dark_hex   "#rrggbb" strings
+    # and by name, as read-only mappings for Plotly's color_discrete_map:
+    #   driver_colors                     driver name -> base
+    #   team_colors                       team name -> team colour as given
+    __slots__ = ("base", "light", "dark", "base_rgb", "light_rgb", "dark_rgb",
+                 "base_hex", "light_hex", "dark_hex", "driver_colors", "team_colors")
+
+    def __init__(self, teams_drivers, team_colors):
+        team_hsl = np.array([parse_hsl(team_colors[team]) for team in teams_drivers], dtype=float)
+        team_of = np.repeat(np.arange(len(team_hsl)), [len(drivers) for drivers in teams_drivers.values()])
+        shifts = np.concatenate([TEAMMATE_SHIFTS[:len(drivers)] for drivers in teams_drivers.values()])
+
+        base = team_hsl[team_of]
+        base[:, 2] = np.clip(base[:, 2] + shifts, 0, 100)
+        light = base.copy()
+        light[:, 2] = np.minimum(95, base[:, 2] + LIGHT_SHIFT)
+        dark = base.copy()
+        dark[:, 2] = np.maximum(5, base[:, 2] + DARK_SHIFT)
+
+        self.base, self.light, self.dark = _css(base), _css(light), _css(dark)
+        self.base_rgb, self.light_rgb, self.dark_rgb = hsl_to_rgb(base), hsl_to_rgb(light), hsl_to_rgb(dark)
+        self.base_hex, self.light_hex, self.dark_hex = _hex(self.base_rgb), _hex(self.light_rgb), _hex(self.dark_rgb)
+
+        drivers = [driver for team_drivers in teams_drivers.values() for driver in team_drivers]
+        self.driver_colors = MappingProxyType(dict(zip(drivers, self.base)))
+        self.team_colors = MappingProxyType({team: team_colors[team] for team in teams_drivers})
+
+    def __len__(self):
+        return len(self.base)
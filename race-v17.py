@@ -1,9 +1,21 @@
 import streamlit as st
-import random
-import time
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import numpy as np
+
+from race_engine import (
+    OUTCOME_STREAM, PRESET_STREAM, TITLE_ODDS_STREAM, RaceState, finish_position_probabilities,
+    instant_race, new_season_seed, points_lookup, race_rng, stream_rng
+)
+from figure_spec import figure_spec
+from live_view import LIVE_VIEW_ROWS, RACE_SPEEDS, FrameScheduler, Leaderboard, LiveRaceFeed, live_race
+from race_history import RaceHistory
+from palette import Palette
+from roster import GRID_SIZES, Roster, stress_grid
+from season_sim import simulate_season_totals, title_odds
+from standings import Standings
+from awards import evaluate_awards, season_stats
 
 st.title("Formula 1 Racing 🏎️🏁🚥🏆")
 st.set_page_config(page_title="Formula 1 Racing", page_icon="🏎️", layout="wide")
@@ -108,144 +120,35 @@ st.markdown("""
         color: #000000;
     }
     
-    .driver-row {
-        background: rgba(255, 255, 255, 0.95);
-        border-radius: 12px;
-        padding: 15px;
-        margin: 8px 0;
-        display: flex;
-        align-items: center;
-        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
-        transition: all 0.3s ease;
-        border-left: 5px solid var(--driver-color);
-    }
-    
-    .driver-row:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(0, 0, 0, 0.15);
-    }
-    
-    .driver-info {
-        min-width: 150px;
-        display: flex;
-        flex-direction: column;
-    }
-    
-    .progress-container {
-        flex: 1;
-        margin: 0 20px;
-        position: relative;
+    .results-table {
+        max-height: 750px;
+        overflow: auto;
+        border-radius: 10px;
+        background-color: white;
     }
-    
-    .custom-progress-bar {
+    .results-table table {
+        border-collapse: collapse;
         width: 100%;
-        height: 25px;
-        background: linear-gradient(90deg, #ecf0f1 0%, #bdc3c7 100%);
-        border-radius: 15px;
-        overflow: hidden;
-        position: relative;
-        box-shadow: inset 0 2px 4px rgba(0, 0, 0, 0.1);
-    }
-    
-    .progress-fill {
-        height: 100%;
-        background: linear-gradient(90deg, var(--driver-color) 0%, var(--driver-color-light) 100%);
-        border-radius: 15px;
-        position: relative;
-        transition: width 0.5s ease-out;
-        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.2);
-    }
-    
-    .progress-fill::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 50%;
-        background: linear-gradient(90deg, 
-            rgba(255,255,255,0.3) 0%, 
-            rgba(255,255,255,0.1) 50%, 
-            rgba(255,255,255,0.3) 100%);
-        border-radius: 15px 15px 0 0;
-    }
-    
-    .progress-text {
-        position: absolute;
-        top: 50%;
-        left: 50%;
-        transform: translate(-50%, -50%);
-        font-weight: bold;
-        font-size: 12px;
-        color: #000000;
-        text-shadow: 0 1px 2px rgba(0, 0, 0, 0.3);
-        z-index: 10;
-    }
-    
-    .progress-status {
-        min-width: 100px;
-        text-align: right;
-        display: flex;
-        flex-direction: column;
-        align-items: flex-end;
-    }
-    
-    .status-text {
-        font-weight: bold;
         font-size: 14px;
         color: #000000;
     }
-    
-    .status-subtext {
-        font-size: 11px;
-        color: #000000;
-        margin-top: 2px;
-    }
-    
-    .finished-row {
-        background: rgba(255, 255, 255, 0.95);
-        color: #000000;
-    }
-    
-    .finished-row .driver-name,
-    .finished-row .team-name,
-    .finished-row .status-text,
-    .finished-row .progress-text {
-        color: #000000;
-        text-shadow: 0 1px 2px rgba(0, 0, 0, 0.3);
-    }
-    
-    .position-indicator {
-        font-size: 18px;
-        font-weight: bold;
-        margin-right: 10px;
-        min-width: 40px;
+    .results-table th, .results-table td {
+        padding: 6px 10px;
+        border: 1px solid #e6e9ef;
         text-align: center;
-        color: #000000;
-    }
-    
-    .racing-animation {
-        animation: pulse 2s infinite;
+        white-space: nowrap;
     }
-    
-    @keyframes pulse {
-        0% { box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1); }
-        50% { box-shadow: 0 6px 25px rgba(102, 126, 234, 0.3); }
-        100% { box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1); }
+    .results-table thead th {
+        position: sticky;
+        top: 0;
+        background-color: #f0f2f6;
     }
+    .results-table .pos-1 { background-color: #FFD700; font-weight: bold; }
+    .results-table .pos-2 { background-color: #C0C0C0; font-weight: bold; }
+    .results-table .pos-3 { background-color: #CD7F32; font-weight: bold; }
+    .results-table .pos-points { background-color: #E6F3FF; }
+    .results-table .pos-none { background-color: #FFF0E6; }
     
-    .speed-indicator {
-        position: absolute;
-        right: 10px;
-        top: 50%;
-        transform: translateY(-50%);
-        background: rgba(0, 0, 0, 0.1);
-        border-radius: 10px;
-        padding: 2px 8px;
-        font-size: 10px;
-        font-weight: bold;
-        color: #000000;
-    }
     </style>
 """, unsafe_allow_html=True)
 
@@ -277,340 +180,476 @@ team_colors = {
     "Williams": "hsl(201, 99.6%, 32.2%)"
 }
 
-# Driver colors (unchanged)
-driver_colors = {}
-for team, drivers_list in teams_drivers.items():
-    color_parts = team_colors[team].replace('hsl(', '').replace(')', '').split(',')
-    hue = float(color_parts[0])
-    saturation = float(color_parts[1].replace('%', ''))
-    lightness = float(color_parts[2].replace('%', ''))
-    driver_colors[drivers_list[0]] = f"hsl({hue}, {saturation}%, {min(100, lightness + 5)}%)"
-    driver_colors[drivers_list[1]] = f"hsl({hue}, {saturation}%, {max(0, lightness - 5)}%)"
-
-# Flatten drivers list (unchanged)
-drivers = []
-for team, driver_list in teams_drivers.items():
-    for driver in driver_list:
-        drivers.append({"driver": driver, "team": team})
+# Streamlit drops the state of widgets that were not rendered in a run, and
+# only the open view is rendered; re-assigning these keeps them while their
+# view is hidden
+for key in ("grid_size", "race_mode", "race_speed", "max_fps", "tuning_team"):
+    if key in st.session_state:
+        st.session_state[key] = st.session_state[key]
+
+# Larger synthetic fields for stress-testing replace the F1 grid
+grid_size = GRID_SIZES[st.session_state.get("grid_size", next(iter(GRID_SIZES)))]
+if grid_size:
+    teams_drivers, team_colors = stress_grid(grid_size)
+
+# Driver colors (±5% lightness around the team color): each team color is
+# parsed once per grid and every variant is kept by driver ID
+if 'palette' not in st.session_state:
+    st.session_state.palette = Palette(teams_drivers, team_colors)
+palette = st.session_state.palette
+
+# Integer IDs for every driver and team; driver IDs are grid indices
+roster = Roster(teams_drivers)
+N_DRIVERS = len(roster)
 
 # Points system (unchanged)
 points_system = {1: 25, 2: 18, 3: 15, 4: 12, 5: 10, 6: 8, 7: 6, 8: 4, 9: 2, 10: 1}
 
 # Initialize session state (unchanged)
-if 'progress_values' not in st.session_state:
-    st.session_state.progress_values = [0] * 20
+if 'race_state' not in st.session_state:
+    st.session_state.race_state = RaceState([0] * N_DRIVERS)
 if 'finish_order' not in st.session_state:
     st.session_state.finish_order = []
-if 'total_team_points' not in st.session_state:
-    st.session_state.total_team_points = {team: 0 for team in teams_drivers}
-if 'total_driver_points' not in st.session_state:
-    st.session_state.total_driver_points = {driver['driver']: 0 for driver in drivers}
-if 'team_wins' not in st.session_state:
-    st.session_state.team_wins = {team: 0 for team in teams_drivers}
-if 'team_podiums' not in st.session_state:
-    st.session_state.team_podiums = {team: 0 for team in teams_drivers}
-if 'driver_wins' not in st.session_state:
-    st.session_state.driver_wins = {driver['driver']: 0 for driver in drivers}
-if 'driver_podiums' not in st.session_state:
-    st.session_state.driver_podiums = {driver['driver']: 0 for driver in drivers}
+if 'standings' not in st.session_state:
+    st.session_state.standings = Standings(points_system, roster.driver_team, roster.n_teams)
 if 'race_finished' not in st.session_state:
     st.session_state.race_finished = False
 if 'races_completed' not in st.session_state:
     st.session_state.races_completed = 0
 if 'race_summaries' not in st.session_state:
     st.session_state.race_summaries = []
+if 'race_history' not in st.session_state:
+    st.session_state.race_history = RaceHistory(N_DRIVERS)
+if 'results_table' not in st.session_state:
+    st.session_state.results_table = None
+if 'results_table_view' not in st.session_state:
+    st.session_state.results_table_view = {}
 if 'race_started' not in st.session_state:
     st.session_state.race_started = False
 if 'driver_headstarts' not in st.session_state:
-    st.session_state.driver_headstarts = {driver['driver']: 1 for driver in drivers}
+    st.session_state.driver_headstarts = {driver: 1 for driver in roster.drivers}
+if 'season_length' not in st.session_state:
+    st.session_state.season_length = 24
+if 'title_odds_cache' not in st.session_state:
+    st.session_state.title_odds_cache = {}
+if 'outcome_cache' not in st.session_state:
+    st.session_state.outcome_cache = {}
+if 'awards_cache' not in st.session_state:
+    st.session_state.awards_cache = {}
+if 'figure_cache' not in st.session_state:
+    st.session_state.figure_cache = {}
+if 'max_fps' not in st.session_state:
+    st.session_state.max_fps = 5
+if 'season_seed' not in st.session_state:
+    st.session_state.season_seed = new_season_seed()
+if 'preset_draws' not in st.session_state:
+    st.session_state.preset_draws = 0
+
+# Points, wins, podiums and rankings by driver/team ID; updated in place
+standings = st.session_state.standings
+
+# Number of sampled seasons behind the title probability panel; larger
+# fields get fewer samples so each panel costs about the same as the F1 grid.
+# 100,000 seasons of 24 races x 20 drivers take about 0.55 s
+TITLE_ODDS_SAMPLES = 100_000
+TITLE_ODDS_CELLS = TITLE_ODDS_SAMPLES * 24 * 20
+
+# Individual tuning shows one team at a time above this many teams
+TUNING_MAX_TEAMS = 10
+
+# Standings lists draw a card per row up to this many rows and put the
+# rest of a larger field in one table; teammate battles are drawn for
+# the leading BATTLE_MAX_TEAMS teams
+STANDINGS_MAX_ROWS = 20
+BATTLE_MAX_TEAMS = 10
+
+# The race results table is coloured by finishing position up to this many
+# race cells (drivers x races); larger tables are shown as a plain dataframe
+RESULTS_TABLE_STYLED_CELLS = 20_000
+
+# The exact outcome solver is cubic in the field size; above this it is
+# replaced by sampled races
+EXACT_OUTCOME_MAX_DRIVERS = 100
+OUTCOME_SAMPLE_CELLS = 20_000_000
 
 # Functions (unchanged)
-def calculate_driver_rating(driver):
-    points = st.session_state.total_driver_points[driver]
-    wins = st.session_state.driver_wins[driver]
-    podiums = st.session_state.driver_podiums[driver]
-    races = st.session_state.races_completed
-    
-    if races == 0:
-        return 5.0
-    
-    max_possible_points = races * 25
-    points_ratio = min(points / max_possible_points, 1.0) if max_possible_points > 0 else 0
-    win_ratio = wins / races if races > 0 else 0
-    podium_ratio = podiums / races if races > 0 else 0
-    
-    rating = (points_ratio * 5.0) + (win_ratio * 3.0) + (podium_ratio * 2.0)
-    return min(max(rating, 0.0), 10.0)
-
-def get_current_leaderboard():
-    finished_drivers = []
-    racing_drivers = []
-    
-    for driver_info in st.session_state.finish_order:
-        finished_drivers.append({
-            'driver': driver_info['driver'],
-            'team': driver_info['team'],
-            'progress': 100,
-            'finished': True
+def reset_season():
+    # A new field invalidates every per-driver entry, so start over
+    for key in list(st.session_state):
+        if key != "grid_size":
+            del st.session_state[key]
+
+def commit_race_results(finish_order, headstarts, instant):
+    # Shared by the animated and instant race paths; finish_order is a list
+    # of driver IDs, headstarts the headstart of every driver ID the race
+    # was run with
+    st.session_state.finish_order = finish_order
+    st.session_state.race_finished = True
+    st.session_state.races_completed += 1
+    st.session_state.race_started = False
+    
+    # CRITICAL: Store complete race results BEFORE they get lost
+    st.session_state.race_history.append(
+        finish_order, st.session_state.races_completed, st.session_state.season_seed, headstarts, instant
+    )
+    
+    standings.apply(finish_order)
+    
+    if len(finish_order) >= 3:
+        st.session_state.race_summaries.append(roster.summary(st.session_state.races_completed, finish_order))
+
+def live_row_style(i):
+    # [name, team, color, light color] for grid index i, sent to the live
+    # race component once per driver
+    return [roster.drivers[i], roster.driver_team_names[i], palette.base[i], palette.light[i]]
+
+def run_instant_race():
+    # Sample every finish tick in one draw instead of animating the ticks
+    headstarts = [st.session_state.driver_headstarts.get(driver, 1) for driver in roster.drivers]
+    rng = race_rng(st.session_state.season_seed, st.session_state.races_completed + 1)
+    commit_race_results(instant_race(headstarts, rng).tolist(), headstarts, instant=True)
+
+def points_battle_figure():
+    # Top 20 of the drivers' championship as a horizontal bar chart
+    top_drivers = standings.ranked_drivers(20)
+    driver_chart_data = []
+    for pos, (d, points) in enumerate(top_drivers, 1):
+        driver = roster.drivers[d]
+        team = roster.driver_team_names[d]
+        wins = standings.driver_wins[d]
+        podiums = standings.driver_podiums[d]
+        driver_chart_data.append({
+            "Driver": f"{driver}",
+            "Full_Name": f"P{pos} - {driver}",
+            "Points": points,
+            "Team": team,
+            "Wins": wins,
+            "Podiums": podiums,
+            "Position": pos,
+            "Championship_Gap": top_drivers[0][1] - points
         })
     
-    finished_driver_names = [d['driver'] for d in st.session_state.finish_order]
-    for i, driver_info in enumerate(drivers):
-        if driver_info['driver'] not in finished_driver_names:
-            racing_drivers.append({
-                'driver': driver_info['driver'],
-                'team': driver_info['team'],
-                'progress': st.session_state.progress_values[i],
-                'finished': False,
-                'index': i
+    if not driver_chart_data:
+        return None
+    driver_df_chart = pd.DataFrame(driver_chart_data)
+    
+    # Create enhanced horizontal bar chart
+    fig = px.bar(
+        driver_df_chart,
+        x="Points",
+        y="Full_Name",
+        color="Team",
+        text="Points",
+        color_discrete_map=palette.team_colors,
+        orientation='h',
+        title="Championship Standings - Points Battle"
+    )
+    
+    # Enhanced styling with better layout - DEFAULT FONT
+    fig.update_traces(
+        textposition="outside", 
+        texttemplate="%{text} pts",
+        marker_line_width=3,
+        marker_line_color="rgba(0,0,0,0.4)",
+        textfont=dict(size=12, color="black")
+    #     hovertemplate="%{customdata[1]}<br>" +
+    #                   "Points: %{x}<br>" +
+    #                   "Team: %{customdata[3]}<br>" +
+    #                   "Wins: %{customdata[0]}<br>" +
+    #                   "Podiums: %{customdata[1]}<br>" +
+    #                   "Gap to Leader: %{customdata[2]} pts<br>" +
+    #                   "<extra></extra>",
+    #     customdata=driver_df_chart[['Wins', 'Podiums', 'Championship_Gap', 'Team']].values
+     )
+    
+    # Enhanced layout with better proportions and styling - DEFAULT FONT
+    fig.update_layout(
+        height=650,  # Increased height for better visibility
+        width=None,   # Let it use full container width
+        xaxis_title="Championship Points",
+        yaxis_title="",
+        title={
+            'text': "Championship Standings - Points Battle",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 18, 'color': '#2c3e50'}
+        },
+        plot_bgcolor='rgba(248, 249, 250, 0.95)',
+        paper_bgcolor='rgba(248, 249, 250, 0.95)',
+        xaxis=dict(
+            gridcolor='rgba(128, 128, 128, 0.2)',
+            gridwidth=1,
+            showgrid=True,
+            zeroline=True,
+            zerolinecolor='rgba(128, 128, 128, 0.4)',
+            zerolinewidth=2,
+            tickfont=dict(size=11, color='#2c3e50'),
+            title_font=dict(size=14, color='#2c3e50')
+        ),
+        yaxis=dict(
+            categoryorder='total ascending',
+            tickfont=dict(size=11, color='#2c3e50'),
+            showgrid=False
+        ),
+        margin=dict(l=20, r=60, t=60, b=40),
+        showlegend=False
+    )
+    
+    # Add subtle animations and interactions
+    fig.update_traces(
+        marker=dict(
+            line=dict(width=2),
+            opacity=0.85
+        )
+    )
+    return fig
+
+def constructors_pie_figure():
+    # Constructors' points share of the scoring teams
+    team_df_chart = pd.DataFrame([
+        {"Team": roster.teams[t], "Points": points}
+        for t, points in standings.ranked_teams() if points > 0
+    ])
+    fig = px.pie(
+        team_df_chart,
+        values="Points",
+        names="Team",
+        color="Team",
+        color_discrete_map=palette.team_colors
+    )
+    fig.update_traces(textposition="outside", textinfo="label+value")
+    fig.update_layout(
+        height=600,
+        legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5),
+        font=dict(color="#000000"),
+        plot_bgcolor='rgba(240, 242, 246, 0.95)',
+        paper_bgcolor='rgba(240, 242, 246, 0.95)'
+    )
+    return fig
+
+def team_contributions_figure():
+    # Points of each scoring team stacked by driver
+    contributing_teams = []
+    team_contribution_data = []
+    for t, team_points in standings.ranked_teams():
+        if team_points > 0:
+            driver1, driver2 = roster.team_drivers[t]
+            contributing_teams.append(t)
+            
+            team_contribution_data.append({
+                "Team": roster.teams[t],
+                roster.drivers[driver1]: standings.driver_points[driver1],
+                roster.drivers[driver2]: standings.driver_points[driver2],
+                "Total": team_points
             })
     
-    racing_drivers.sort(key=lambda x: x['progress'], reverse=True)
-    return finished_drivers + racing_drivers
+    contrib_df = pd.DataFrame(team_contribution_data)
+    fig_bar = px.bar(
+        contrib_df,
+        x="Team",
+        y=[col for col in contrib_df.columns if col not in ["Team", "Total"]],
+        title="Points Contribution by Team Members",
+        labels={"value": "Points", "variable": "Driver"},
+        text_auto=True
+    )
+    
+    for i, trace in enumerate(fig_bar.data):
+        team_idx = i // 2
+        driver_idx = i % 2
+        d = roster.team_drivers[contributing_teams[team_idx]][driver_idx]
+        trace.marker.color = palette.base[d]
+        trace.name = roster.drivers[d]
+    
+    fig_bar.update_layout(
+        height=500,
+        xaxis_title="Team",
+        yaxis_title="Points",
+        legend_title="Driver",
+        barmode="stack",
+        font=dict(color="#000000"),
+        plot_bgcolor='rgba(240, 242, 246, 0.95)',
+        paper_bgcolor='rgba(240, 242, 246, 0.95)'
+    )
+    fig_bar.update_traces(textposition="inside", textfont_size=10)
+    return fig_bar
+
+def cached_figure(name, build):
+    # Chart figures only change when a race is committed, so each one is
+    # kept, already serialised, with the standings version (races applied)
+    # it was built from
+    cached = st.session_state.figure_cache.get(name)
+    if cached is None or cached[0] != standings.n_races:
+        cached = (standings.n_races, figure_spec(build()))
+        st.session_state.figure_cache[name] = cached
+    return cached[1]
 
-# Create tabs - removed "Driver Ratings" tab
-tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+def results_table_html(df, position_classes):
+    # The results table as one HTML block; every race cell carries the CSS
+    # class of its finishing position instead of an inline style
+    positions = df.iloc[:, 2:].to_numpy()
+    header = ''.join(f'<th>{column}</th>' for column in df.columns)
+    rows = []
+    for row, driver, team, classes, places in zip(
+        df.index.tolist(), df['Driver'], df['Team'], position_classes[positions].tolist(), positions.tolist()
+    ):
+        cells = ''.join(f'<td class="{c}">{p}</td>' for c, p in zip(classes, places))
+        rows.append(f'<tr><th>{row}</th><td>{driver}</td><td>{team}</td>{cells}</tr>')
+    return (
+        f'<div class="results-table"><table><thead><tr><th></th>{header}</tr></thead>'
+        f'<tbody>{"".join(rows)}</tbody></table></div>'
+    )
+
+# Views - removed "Driver Ratings" tab. st.tabs runs the body of every tab
+# on each rerun, so the views are picked with a radio and only the open
+# one is rendered
+VIEWS = [
     "Race & Results",
     "Drivers' Championship",
     "Constructors' Championship",
     "Team & Driver Stats",
     "Driver Upgrades",
     "Season Summary"
-])
+]
+view = st.radio("View", VIEWS, horizontal=True, key="view", label_visibility="collapsed")
+# True when the previous run showed another view; whatever that view left in
+# the browser (the live race rows) has been unmounted since
+view_entered = st.session_state.get("shown_view") != view
+st.session_state.shown_view = view
 
 # Tab 1: Race & Results (unchanged from original, affected by CSS updates)
 # Tab 1: Race & Results (with proper race storage)
-with tab1:
+if view == VIEWS[0]:
+    race_mode = st.radio(
+        "Race mode",
+        ["🎬 Animated", "⚡ Instant"],
+        horizontal=True,
+        key="race_mode",
+        help="Instant races skip the animation and sample the result in one draw"
+    )
+    speed_col, fps_col = st.columns(2)
+    with speed_col:
+        st.radio(
+            "Simulation speed",
+            list(RACE_SPEEDS),
+            horizontal=True,
+            key="race_speed",
+            help="Ticks per second of the animated race (1× is one tick per second)"
+        )
+    with fps_col:
+        st.slider(
+            "Max render FPS",
+            min_value=1,
+            max_value=30,
+            key="max_fps",
+            help="Frames are skipped when ticks arrive faster than this"
+        )
+
     if st.button("🏁 Start Race"):
-        st.session_state.progress_values = [0] * 20
-        for i, driver_info in enumerate(drivers):
-            driver = driver_info['driver']
-            headstart = st.session_state.driver_headstarts.get(driver, 1)
-            st.session_state.progress_values[i] = min(100, headstart)
+        if race_mode == "⚡ Instant":
+            run_instant_race()
+            st.rerun()
+        # Headstarts are fixed for the race even if they are tuned mid-race
+        st.session_state.race_headstarts = [st.session_state.driver_headstarts.get(driver, 1) for driver in roster.drivers]
+        # Progress, finished mask and finish ticks for the whole grid
+        st.session_state.race_state = RaceState(st.session_state.race_headstarts)
         st.session_state.finish_order = []
         st.session_state.race_finished = False
         st.session_state.race_started = True
+        # Each race draws from its own stream of the season seed, so it can be
+        # replayed on its own with race_engine.replay_race()
+        st.session_state.race_rng = race_rng(st.session_state.season_seed, st.session_state.races_completed + 1)
+        # Running order as grid indices, maintained from tick to tick
+        st.session_state.live_leaderboard = Leaderboard(N_DRIVERS)
+        st.session_state.live_leaderboard.update(st.session_state.race_state.progress)
+        st.session_state.pop("live_settings", None)
         st.rerun()
 
+    with st.expander("🎲 Season Seed"):
+        season_seed = st.number_input(
+            "Season seed",
+            min_value=0,
+            max_value=2**32 - 1,
+            value=st.session_state.season_seed,
+            step=1,
+            key="season_seed_input"
+        )
+        st.session_state.season_seed = int(season_seed)
+        st.caption(f"Race {st.session_state.races_completed + 1} will run on stream (seed {st.session_state.season_seed}, race {st.session_state.races_completed + 1}).")
+
+    with st.expander("🏟️ Grid"):
+        st.selectbox(
+            "Field size",
+            list(GRID_SIZES),
+            key="grid_size",
+            on_change=reset_season,
+            help="Larger synthetic fields for stress-testing; changing the field starts a new season"
+        )
+        st.caption(f"{N_DRIVERS:,} drivers in {len(teams_drivers):,} teams")
+
+    if race_mode == "⚡ Instant":
+        races_remaining = max(0, st.session_state.season_length - st.session_state.races_completed)
+        if st.button(f"⏩ Run Remaining Season ({races_remaining} races)", disabled=races_remaining == 0):
+            for _ in range(races_remaining):
+                run_instant_race()
+            st.rerun()
+
     if st.session_state.race_started and not st.session_state.race_finished:
-        st.markdown('<div class="race-container">', unsafe_allow_html=True)
         st.markdown("### 🏎️ Live Race Progress")
-        
-        progress_placeholders = []
-        current_leaderboard = get_current_leaderboard()
-        
-        for pos, driver_info in enumerate(current_leaderboard, 1):
-            progress = driver_info['progress']
-            driver = driver_info['driver']
-            team = driver_info['team']
-            is_finished = driver_info.get('finished', False)
-            
-            base_color = driver_colors.get(driver, '#3498db')
-            if base_color.startswith('hsl'):
-                hsl_parts = base_color.replace('hsl(', '').replace(')', '').split(',')
-                hue = hsl_parts[0].strip()
-                saturation = hsl_parts[1].strip()
-                lightness = float(hsl_parts[2].replace('%', '').strip())
-                lighter_lightness = min(95, lightness + 20)
-                light_color = f"hsl({hue}, {saturation}, {lighter_lightness}%)"
-            else:
-                light_color = base_color
-            
-            position_emoji = "🥇" if pos == 1 else "🥈" if pos == 2 else "🥉" if pos == 3 else f"P{pos}"
-            
-            if is_finished:
-                status_text = "🏁 FINISHED"
-                status_subtext = "Race Complete"
-                row_class = "finished-row"
-                animation_class = ""
-            else:
-                status_text = f"{progress:.1f}%"
-                status_subtext = "Racing..."
-                row_class = ""
-                animation_class = "racing-animation" if progress > 50 else ""
-            
-            speed_kmh = int(200 + (progress / 100) * 150 + (pos * -5))
-            
-            progress_html = f'''
-            <div class="driver-row {row_class} {animation_class}" 
-                 style="--driver-color: {base_color}; --driver-color-light: {light_color};">
-                <div class="position-indicator">{position_emoji}</div>
-                <div class="driver-info">
-                    <div class="driver-name">{driver}</div>
-                    <div class="team-name">{team}</div>
-                </div>
-                <div class="progress-container">
-                    <div class="custom-progress-bar">
-                        <div class="progress-fill" style="width: {progress}%;">
-                            <div class="speed-indicator">{speed_kmh} km/h</div>
-                        </div>
-                        <div class="progress-text">{progress:.1f}%</div>
-                    </div>
-                </div>
-                <div class="progress-status">
-                    <div class="status-text">{status_text}</div>
-                    <div class="status-subtext">{status_subtext}</div>
-                </div>
-            </div>
-            '''
-            
-            placeholder = st.empty()
-            placeholder.markdown(progress_html, unsafe_allow_html=True)
-            progress_placeholders.append((placeholder, driver_info))
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+        if N_DRIVERS > LIVE_VIEW_ROWS:
+            st.caption(f"Showing the leading {LIVE_VIEW_ROWS} of {N_DRIVERS:,} drivers")
 
-        time.sleep(1)
+        # Simulation ticks run at the chosen speed; frames are drawn at most
+        # max_fps times per second and skipped while rendering falls behind.
+        # Both outlive page reruns and restart only when the settings change.
+        live_settings = (st.session_state.race_speed, st.session_state.max_fps)
+        if st.session_state.get("live_settings") != live_settings:
+            st.session_state.live_settings = live_settings
+            st.session_state.live_scheduler = FrameScheduler(
+                speed=RACE_SPEEDS[st.session_state.race_speed],
+                max_fps=st.session_state.max_fps
+            )
+            st.session_state.live_feed = None
+        # No faster than max_fps, and no faster than ticks come due
+        scheduler = st.session_state.live_scheduler
+        frame_seconds = max(scheduler.frame_seconds, scheduler.tick_seconds)
+        if view_entered or st.session_state.live_feed is None:
+            # A new live_race component knows no driver styles yet
+            st.session_state.live_feed = LiveRaceFeed(frame_seconds)
 
-        while (st.session_state.race_started and 
-               any(value < 100 for value in st.session_state.progress_values) and 
-               not st.session_state.race_finished):
-            
-            for i in range(20):
-                if st.session_state.progress_values[i] < 100:
-                    increment = random.randint(0, 4)
-                    st.session_state.progress_values[i] = min(100, st.session_state.progress_values[i] + increment)
-                    if st.session_state.progress_values[i] == 100 and drivers[i]['driver'] not in [d['driver'] for d in st.session_state.finish_order]:
-                        st.session_state.finish_order.append(drivers[i])
-            
-            current_leaderboard = get_current_leaderboard()
-            
-            for idx, (placeholder, _) in enumerate(progress_placeholders):
-                if idx < len(current_leaderboard):
-                    driver_info = current_leaderboard[idx]
-                    pos = idx + 1
-                    progress = driver_info['progress']
-                    driver = driver_info['driver']
-                    team = driver_info['team']
-                    is_finished = driver_info.get('finished', False)
-                    
-                    base_color = driver_colors.get(driver, '#3498db')
-                    if base_color.startswith('hsl'):
-                        hsl_parts = base_color.replace('hsl(', '').replace(')', '').split(',')
-                        hue = hsl_parts[0].strip()
-                        saturation = hsl_parts[1].strip()
-                        lightness = float(hsl_parts[2].replace('%', '').strip())
-                        lighter_lightness = min(95, lightness + 20)
-                        light_color = f"hsl({hue}, {saturation}, {lighter_lightness}%)"
-                    else:
-                        light_color = base_color
-                    
-                    position_emoji = "🥇" if pos == 1 else "🥈" if pos == 2 else "🥉" if pos == 3 else f"P{pos}"
-                    
-                    if is_finished:
-                        status_text = "🏁 FINISHED"
-                        status_subtext = "Race Complete"
-                        row_class = "finished-row"
-                        animation_class = ""
-                    else:
-                        status_text = f"{progress:.1f}%"
-                        status_subtext = "Racing..."
-                        row_class = ""
-                        animation_class = "racing-animation" if progress > 70 else ""
-                    
-                    speed_kmh = int(max(180, min(350, 200 + (progress / 100) * 150 + (pos * -3) + random.randint(-10, 10))))
-                    
-                    progress_html = f'''
-                    <div class="driver-row {row_class} {animation_class}" 
-                         style="--driver-color: {base_color}; --driver-color-light: {light_color};">
-                        <div class="position-indicator">{position_emoji}</div>
-                        <div class="driver-info">
-                            <div class="driver-name">{driver}</div>
-                            <div class="team-name">{team}</div>
-                        </div>
-                        <div class="progress-container">
-                            <div class="custom-progress-bar">
-                                <div class="progress-fill" style="width: {progress}%;">
-                                    <div class="speed-indicator">{speed_kmh} km/h</div>
-                                </div>
-                                <div class="progress-text">{progress:.1f}%</div>
-                            </div>
-                        </div>
-                        <div class="progress-status">
-                            <div class="status-text">{status_text}</div>
-                            <div class="status-subtext">{status_subtext}</div>
-                        </div>
-                    </div>
-                    '''
-                    
-                    placeholder.markdown(progress_html, unsafe_allow_html=True)
-            
-            if len(st.session_state.finish_order) == 20:
-                st.session_state.race_finished = True
-                st.session_state.races_completed += 1
-                st.session_state.race_started = False
-                
-                # CRITICAL: Store complete race results BEFORE they get lost
-                if 'complete_race_history' not in st.session_state:
-                    st.session_state.complete_race_history = []
-                
-                complete_race_results = {
-                    "race_number": st.session_state.races_completed,
-                    "results": [(pos + 1, driver_info['driver'], driver_info['team']) 
-                               for pos, driver_info in enumerate(st.session_state.finish_order)]
-                }
-                st.session_state.complete_race_history.append(complete_race_results)
-                
-                for idx, (placeholder, _) in enumerate(progress_placeholders):
-                    if idx < len(current_leaderboard):
-                        driver_info = current_leaderboard[idx]
-                        pos = idx + 1
-                        driver = driver_info['driver']
-                        team = driver_info['team']
-                        base_color = driver_colors.get(driver, '#3498db')
-                        
-                        position_emoji = "🥇" if pos == 1 else "🥈" if pos == 2 else "🥉" if pos == 3 else f"P{pos}"
-                        
-                        points = points_system.get(pos, 0)
-                        status_text = f"🏁 FINISHED"
-                        status_subtext = f"{points} points" if pos <= 10 else "0 points"
-                        
-                        progress_html = f'''
-                        <div class="driver-row finished-row">
-                            <div class="position-indicator">{position_emoji}</div>
-                            <div class="driver-info">
-                                <div class="driver-name">{driver}</div>
-                                <div class="team-name">{team}</div>
-                            </div>
-                            <div class="progress-container">
-                                <div class="custom-progress-bar">
-                                    <div class="progress-fill" style="width: 100%;">
-                                    </div>
-                                    <div class="progress-text">100%</div>
-                                </div>
-                            </div>
-                            <div class="progress-status">
-                                <div class="status-text">{status_text}</div>
-                                <div class="status-subtext">{status_subtext}</div>
-                            </div>
-                        </div>
-                        '''
-                        
-                        placeholder.markdown(progress_html, unsafe_allow_html=True)
-                
-                for position, driver_info in enumerate(st.session_state.finish_order, 1):
-                    if position <= 10:
-                        points = points_system.get(position, 0)
-                        st.session_state.total_driver_points[driver_info['driver']] += points
-                        st.session_state.total_team_points[driver_info['team']] += points
-                    if position == 1:
-                        st.session_state.driver_wins[driver_info['driver']] += 1
-                        st.session_state.team_wins[driver_info['team']] += 1
-                    if position <= 3:
-                        st.session_state.driver_podiums[driver_info['driver']] += 1
-                        st.session_state.team_podiums[driver_info['team']] += 1
-                
-                if len(st.session_state.finish_order) >= 3:
-                    race_summary = {
-                        "Race": st.session_state.races_completed,
-                        "P1": f"{st.session_state.finish_order[0]['driver']} ({st.session_state.finish_order[0]['team']})",
-                        "P2": f"{st.session_state.finish_order[1]['driver']} ({st.session_state.finish_order[1]['team']})",
-                        "P3": f"{st.session_state.finish_order[2]['driver']} ({st.session_state.finish_order[2]['team']})"
-                    }
-                    st.session_state.race_summaries.append(race_summary)
-                break
-            
-            time.sleep(1)
+        # Re-runs on its own once per frame without re-running the page; the
+        # rows live in the browser and each frame only sends the running order
+        # and progress of the visible rows
+        @st.fragment(run_every=frame_seconds)
+        def live_race_frame():
+            race_state = st.session_state.race_state
+            leaderboard = st.session_state.live_leaderboard
+            scheduler = st.session_state.live_scheduler
+
+            for _ in range(scheduler.ticks_due()):
+                # One vectorized step; crossed is the mask of drivers that
+                # reached the line on this tick, already in grid order
+                crossed = race_state.step(st.session_state.race_rng)
+                leaderboard.finish(np.flatnonzero(crossed))
+                scheduler.tick_done()
+                if race_state.done:
+                    break
+
+            if race_state.done:
+                commit_race_results(race_state.finish_order().tolist(), st.session_state.race_headstarts, instant=False)
+                st.rerun()
+
+            # A new frame only when ticks were simulated since the last one
+            # or the component asked for its styles again; otherwise it is
+            # drawn again with the same payload
+            feed = st.session_state.live_feed
+            report = st.session_state.get("live_race")
+            if feed.last is None or scheduler.pending or report != feed.report:
+                leaderboard.update(race_state.progress)
+                feed.frame(leaderboard, race_state.progress, live_row_style, report)
+                scheduler.frame_rendered()
+            live_race(feed.last, key="live_race")
+
+        live_race_frame()
 
     if st.session_state.race_finished:
         st.markdown("---")
@@ -623,14 +662,14 @@ with tab1:
                 (st.session_state.finish_order[2], 3, "🥉", "rating-card-bronze", "3rd")
             ]
             
-            for driver_info, position, medal, card_class, position_text in podium_positions:
-                points = points_system.get(position, 0)
-                driver_name = driver_info['driver']
-                team_name = driver_info['team']
+            for d, position, medal, card_class, position_text in podium_positions:
+                points = standings.points_for(position)
+                driver_name = roster.drivers[d]
+                team_name = roster.driver_team_names[d]
                 
-                total_points = st.session_state.total_driver_points[driver_name]
-                total_wins = st.session_state.driver_wins[driver_name]
-                total_podiums = st.session_state.driver_podiums[driver_name]
+                total_points = standings.driver_points[d]
+                total_wins = standings.driver_wins[d]
+                total_podiums = standings.driver_podiums[d]
                 
                 st.markdown(f'''
                 <div class="rating-card {card_class}">
@@ -656,10 +695,10 @@ with tab1:
         race_summary_data = []
         for summary in st.session_state.race_summaries:
             race_summary_data.append({
-                "Race": summary["Race"],
-                "P1": summary["P1"],
-                "P2": summary["P2"],
-                "P3": summary["P3"]
+                "Race": summary.race,
+                "P1": roster.label(summary.drivers[0]),
+                "P2": roster.label(summary.drivers[1]),
+                "P3": roster.label(summary.drivers[2])
             })
         if race_summary_data:
             st.markdown('<div class="leaderboard">', unsafe_allow_html=True)
@@ -680,24 +719,25 @@ with tab1:
 
 # Tab 2: Enhanced Drivers' Championship with Actual Race Results
 # Tab 2: Enhanced Drivers' Championship with Actual Race Results
-with tab2:
+if view == VIEWS[1]:
     st.markdown('<div class="race-container">', unsafe_allow_html=True)
     st.markdown("### 🏆 Drivers' Championship Hub")
     st.markdown(f"**Races Completed: {st.session_state.races_completed}**")
     
     if st.session_state.races_completed > 0:
-        # Prepare data
-        sorted_driver_standings = sorted(st.session_state.total_driver_points.items(), key=lambda x: x[1], reverse=True)
+        # Prepare data: (driver ID, points) of the leading drivers
+        sorted_driver_standings = standings.ranked_drivers(STANDINGS_MAX_ROWS)
         
         # Championship Leadership Section
         st.markdown("#### 👑 Championship Leadership")
         leader_col1, leader_col2, leader_col3 = st.columns(3)
         
-        for pos, (driver, points) in enumerate(sorted_driver_standings[:3], 1):
-            team = next(d['team'] for d in drivers if d['driver'] == driver)
-            wins = st.session_state.driver_wins[driver]
-            podiums = st.session_state.driver_podiums[driver]
-            rating = calculate_driver_rating(driver)
+        for pos, (d, points) in enumerate(sorted_driver_standings[:3], 1):
+            driver = roster.drivers[d]
+            team = roster.driver_team_names[d]
+            wins = standings.driver_wins[d]
+            podiums = standings.driver_podiums[d]
+            rating = standings.ratings[d]
             
             card_class = "rating-card-gold" if pos == 1 else "rating-card-silver" if pos == 2 else "rating-card-bronze"
             medal = "🥇" if pos == 1 else "🥈" if pos == 2 else "🥉"
@@ -727,97 +767,8 @@ with tab2:
         # Championship Battle Visualization - ENHANCED STYLING
         st.markdown("#### 📊 Championship Battle")
         
-        # Create enhanced horizontal bar chart
-        top_drivers = sorted_driver_standings[:20]  # Show top 15 for better visibility
-        driver_chart_data = []
-        for pos, (driver, points) in enumerate(top_drivers, 1):
-            team = next(d['team'] for d in drivers if d['driver'] == driver)
-            wins = st.session_state.driver_wins[driver]
-            podiums = st.session_state.driver_podiums[driver]
-            driver_chart_data.append({
-                "Driver": f"{driver}",
-                "Full_Name": f"P{pos} - {driver}",
-                "Points": points,
-                "Team": team,
-                "Wins": wins,
-                "Podiums": podiums,
-                "Position": pos,
-                "Championship_Gap": sorted_driver_standings[0][1] - points
-            })
-        
-        if driver_chart_data:
-            driver_df_chart = pd.DataFrame(driver_chart_data)
-            
-            # Create enhanced horizontal bar chart
-            fig = px.bar(
-                driver_df_chart,
-                x="Points",
-                y="Full_Name",
-                color="Team",
-                text="Points",
-                color_discrete_map=team_colors,
-                orientation='h',
-                title="Championship Standings - Points Battle"
-            )
-            
-            # Enhanced styling with better layout - DEFAULT FONT
-            fig.update_traces(
-                textposition="outside", 
-                texttemplate="%{text} pts",
-                marker_line_width=3,
-                marker_line_color="rgba(0,0,0,0.4)",
-                textfont=dict(size=12, color="black")
-            #     hovertemplate="%{customdata[1]}<br>" +
-            #                   "Points: %{x}<br>" +
-            #                   "Team: %{customdata[3]}<br>" +
-            #                   "Wins: %{customdata[0]}<br>" +
-            #                   "Podiums: %{customdata[1]}<br>" +
-            #                   "Gap to Leader: %{customdata[2]} pts<br>" +
-            #                   "<extra></extra>",
-            #     customdata=driver_df_chart[['Wins', 'Podiums', 'Championship_Gap', 'Team']].values
-             )
-            
-            # Enhanced layout with better proportions and styling - DEFAULT FONT
-            fig.update_layout(
-                height=650,  # Increased height for better visibility
-                width=None,   # Let it use full container width
-                xaxis_title="Championship Points",
-                yaxis_title="",
-                title={
-                    'text': "Championship Standings - Points Battle",
-                    'x': 0.5,
-                    'xanchor': 'center',
-                    'font': {'size': 18, 'color': '#2c3e50'}
-                },
-                plot_bgcolor='rgba(248, 249, 250, 0.95)',
-                paper_bgcolor='rgba(248, 249, 250, 0.95)',
-                xaxis=dict(
-                    gridcolor='rgba(128, 128, 128, 0.2)',
-                    gridwidth=1,
-                    showgrid=True,
-                    zeroline=True,
-                    zerolinecolor='rgba(128, 128, 128, 0.4)',
-                    zerolinewidth=2,
-                    tickfont=dict(size=11, color='#2c3e50'),
-                    title_font=dict(size=14, color='#2c3e50')
-                ),
-                yaxis=dict(
-                    categoryorder='total ascending',
-                    tickfont=dict(size=11, color='#2c3e50'),
-                    showgrid=False
-                ),
-                margin=dict(l=20, r=60, t=60, b=40),
-                showlegend=False
-            )
-            
-            # Add subtle animations and interactions
-            fig.update_traces(
-                marker=dict(
-                    line=dict(width=2),
-                    opacity=0.85
-                )
-            )
-            
+        fig = cached_figure("points_battle", points_battle_figure)
+        if fig is not None:
             st.plotly_chart(fig, use_container_width=True, config={
                 'displayModeBar': True,
                 'displaylogo': False,
@@ -836,7 +787,7 @@ with tab2:
             stats_col1, stats_col2, stats_col3, stats_col4 = st.columns(4)
             
             with stats_col1:
-                total_points = sum(st.session_state.total_driver_points.values())
+                total_points = int(standings.driver_points.sum())
                 st.metric(
                     "🏆 Total Points", 
                     total_points,
@@ -844,7 +795,7 @@ with tab2:
                 )
             
             with stats_col2:
-                total_winners = len([d for d in st.session_state.driver_wins.values() if d > 0])
+                total_winners = int(np.count_nonzero(standings.driver_wins))
                 st.metric(
                     "🏁 Race Winners", 
                     total_winners,
@@ -869,95 +820,104 @@ with tab2:
         
         st.markdown("---")
         
+        # Title Probability - Monte Carlo over the remaining races of the season
+        st.markdown("#### 🎯 Title Probability")
+        season_length = st.number_input(
+            "Season length (races)",
+            min_value=st.session_state.races_completed,
+            value=max(st.session_state.season_length, st.session_state.races_completed),
+            step=1,
+            key="season_length_input"
+        )
+        st.session_state.season_length = season_length
+        races_remaining = season_length - st.session_state.races_completed
+        
+        # Standings only change when a race completes, so the sampled odds are
+        # reused until races_completed, the headstarts or the season length move
+        headstart_vector = tuple(st.session_state.driver_headstarts.get(driver, 1) for driver in roster.drivers)
+        odds_samples = min(TITLE_ODDS_SAMPLES, max(1_000, TITLE_ODDS_CELLS // (N_DRIVERS * max(1, races_remaining))))
+        odds_key = (st.session_state.races_completed, headstart_vector, season_length, st.session_state.season_seed)
+        if st.session_state.title_odds_cache.get('key') != odds_key:
+            st.session_state.title_odds_cache = {
+                'key': odds_key,
+                'odds': title_odds(
+                    standings.driver_points,
+                    standings.driver_wins,
+                    headstart_vector,
+                    races_remaining,
+                    points_system,
+                    n_samples=odds_samples,
+                    rng=stream_rng(st.session_state.season_seed, TITLE_ODDS_STREAM, st.session_state.races_completed)
+                )
+            }
+        odds = st.session_state.title_odds_cache['odds']
+        
+        odds_df = pd.DataFrame({
+            "Driver": roster.drivers,
+            "Team": roster.driver_team_names,
+            "Title %": np.round(odds['title'] * 100, 1),
+            "Top 3 %": np.round(odds['top3'] * 100, 1),
+            "Points %": np.round(odds['points'] * 100, 1)
+        }).sort_values(["Title %", "Top 3 %", "Points %"], ascending=False)
+        st.caption(f"{odds_samples:,} simulated seasons • {races_remaining} races remaining")
+        st.dataframe(odds_df, use_container_width=True, hide_index=True)
+        
+        st.markdown("---")
+        
         # Race Results Table - Using ACTUAL race results
-        if (st.session_state.races_completed > 0 and 
-            hasattr(st.session_state, 'complete_race_history') and 
-            len(st.session_state.complete_race_history) > 0):
+        if len(st.session_state.race_history) > 0:
             
             st.markdown("#### 📋 Race Results Table")
             st.markdown("*Complete finishing positions for all drivers in all races*")
             
-            # Create table with actual race results
+            # Create table with actual race results: driver rows x race columns,
+            # the transpose of the history matrix. The pivot is kept between
+            # reruns in driver ID order and only the new race columns are added.
             def create_actual_results_table():
-                table_data = []
-                
-                # Initialize data for all drivers
-                for driver_info in drivers:
-                    driver = driver_info['driver']
-                    team = driver_info['team']
-                    row_data = {
-                        'Driver': driver,
-                        'Team': team
-                    }
-                    
-                    # For each completed race, get the actual finishing position
-                    for race_data in st.session_state.complete_race_history:
-                        race_num = race_data['race_number']
-                        race_results = race_data['results']  # List of (position, driver, team) tuples
-                        
-                        # Find this driver's actual position in this race
-                        position = None
-                        for pos, race_driver, _ in race_results:
-                            if race_driver == driver:
-                                position = pos
-                                break
-                        
-                        # If driver not found in results (shouldn't happen), mark as DNF
-                        row_data[f'Race {race_num}'] = position if position is not None else "DNF"
-                    
-                    table_data.append(row_data)
-                
-                # Sort by current championship position
-                final_standings = sorted(st.session_state.total_driver_points.items(), key=lambda x: x[1], reverse=True)
-                driver_order = [d for d, _ in final_standings]
-                
-                # Reorder table_data to match championship standings
-                ordered_table_data = []
-                for driver in driver_order:
-                    driver_data = next((d for d in table_data if d['Driver'] == driver), None)
-                    if driver_data:
-                        ordered_table_data.append(driver_data)
+                history = st.session_state.race_history
+                table = st.session_state.results_table
+                if table is None or table.shape[1] - 2 > len(history):
+                    table = pd.DataFrame({'Driver': roster.drivers, 'Team': roster.driver_team_names})
+                n_cached = table.shape[1] - 2
+                if n_cached < len(history):
+                    new_races = pd.DataFrame(
+                        history.slice(n_cached).T,
+                        columns=[f'Race {race_num}' for race_num in history.race_numbers[n_cached:].tolist()]
+                    )
+                    table = pd.concat([table, new_races], axis=1)
+                    st.session_state.results_table = table
                 
-                return ordered_table_data
+                # Sort by current championship position (points, ties in grid order)
+                return table.take(standings.driver_ranking).reset_index(drop=True)
             
-            table_data = create_actual_results_table()
+            # Cell class for every finishing position (index 0 unused), so the
+            # classes of the whole table are one lookup into the position matrix
+            position_classes = np.array(
+                ['', 'pos-1', 'pos-2', 'pos-3']
+                + ['pos-points'] * 7  # Light pale blue
+                + ['pos-none'] * max(0, N_DRIVERS - 10),  # Light pale orange
+                dtype=object
+            )
             
-            # Create and display the results table
-            if table_data:
-                import pandas as pd
-                df = pd.DataFrame(table_data)
-                
+            # The table only changes when a race is added, so it is rendered
+            # once per history version (to HTML while it is small enough to
+            # colour) and reused as is on other reruns
+            history = st.session_state.race_history
+            results_view = st.session_state.results_table_view
+            if results_view.get('version') != len(history):
+                df = create_actual_results_table()
                 # Reset index to start from 1 instead of 0
                 df.index = df.index + 1
-                
-                # Style the DataFrame based on actual positions
-                def style_position(val):
-                    if isinstance(val, int):
-                        if val == 1:
-                            return 'background-color: #FFD700; color: #000000; font-weight: bold;'
-                        elif val == 2:
-                            return 'background-color: #C0C0C0; color: #000000; font-weight: bold;'
-                        elif val == 3:
-                            return 'background-color: #CD7F32; color: #000000; font-weight: bold;'
-                        elif val <= 10:
-                            return 'background-color: #E6F3FF; color: #000000;'  # Light pale blue
-                        else:
-                            return 'background-color: #FFF0E6; color: #000000;'  # Light pale orange
-                    elif val == "DNF":
-                        return 'background-color: #FF6B6B; color: #000000; font-weight: bold;'
-                    return ''
-                
-                # Apply styling to race columns only
-                race_columns = [col for col in df.columns if col.startswith('Race ')]
-                if race_columns:
-                    styled_df = df.style.applymap(style_position, subset=race_columns)
-                    
-                    # Display table with exact height to avoid extra rows
-                    table_height = len(df) * 35 + 50  # Exact height: rows * row_height + header
-                    st.dataframe(styled_df, use_container_width=True, height=table_height)
-                else:
-                    table_height = len(df) * 35 + 50  # Exact height: rows * row_height + header
-                    st.dataframe(df, use_container_width=True, height=table_height)
+                html = None
+                if len(df) * len(history) <= RESULTS_TABLE_STYLED_CELLS:
+                    html = results_table_html(df, position_classes)
+                results_view = {'version': len(history), 'df': df, 'html': html}
+                st.session_state.results_table_view = results_view
+            df = results_view['df']
+            
+            # Create and display the results table
+            if len(df) and results_view['html'] is not None:
+                st.markdown(results_view['html'], unsafe_allow_html=True)
                 
                 # Add legend with updated colors
                 st.markdown('''
@@ -982,7 +942,7 @@ with tab2:
                         </div>
                         <div style="display: flex; align-items: center; gap: 8px; padding: 5px;">
                             <div style="width: 25px; height: 25px; background: #FFF0E6; border-radius: 4px;"></div>
-                            <span style="color: #000000;">No Points (11-20)</span>
+                            <span style="color: #000000;">No Points (11+)</span>
                         </div>
                         <div style="display: flex; align-items: center; gap: 8px; padding: 5px;">
                             <div style="width: 25px; height: 25px; background: #FF6B6B; border-radius: 4px;"></div>
@@ -991,6 +951,10 @@ with tab2:
                     </div>
                 </div>
                 ''', unsafe_allow_html=True)
+            elif len(df):
+                st.caption(f"Positions are coloured for tables of up to {RESULTS_TABLE_STYLED_CELLS:,} cells")
+                table_height = min(len(df), STANDINGS_MAX_ROWS) * 35 + 50  # rows * row_height + header
+                st.dataframe(df, use_container_width=True, height=table_height)
             else:
                 st.warning("No race data available. Complete some races first!")
         else:
@@ -1005,25 +969,30 @@ with tab2:
         teams_processed = set()
         col_idx = 0
         
-        for team, team_drivers in teams_drivers.items():
+        battle_teams = range(roster.n_teams)
+        if roster.n_teams > BATTLE_MAX_TEAMS:
+            battle_teams = standings.team_ranking[:BATTLE_MAX_TEAMS].tolist()
+        
+        for t in battle_teams:
+            team = roster.teams[t]
             if team not in teams_processed and col_idx < len(battle_cols):
-                driver1, driver2 = team_drivers
-                driver1_points = st.session_state.total_driver_points[driver1]
-                driver2_points = st.session_state.total_driver_points[driver2]
-                driver1_wins = st.session_state.driver_wins[driver1]
-                driver2_wins = st.session_state.driver_wins[driver2]
-                driver1_podiums = st.session_state.driver_podiums[driver1]
-                driver2_podiums = st.session_state.driver_podiums[driver2]
+                driver1, driver2 = roster.team_drivers[t]
+                driver1_points = standings.driver_points[driver1]
+                driver2_points = standings.driver_points[driver2]
+                driver1_wins = standings.driver_wins[driver1]
+                driver2_wins = standings.driver_wins[driver2]
+                driver1_podiums = standings.driver_podiums[driver1]
+                driver2_podiums = standings.driver_podiums[driver2]
                 
                 # Determine leader
                 if driver1_points >= driver2_points:
-                    leader = driver1
-                    trailer = driver2
+                    leader = roster.drivers[driver1]
+                    trailer = roster.drivers[driver2]
                     leader_stats = {'points': driver1_points, 'wins': driver1_wins, 'podiums': driver1_podiums}
                     trailer_stats = {'points': driver2_points, 'wins': driver2_wins, 'podiums': driver2_podiums}
                 else:
-                    leader = driver2
-                    trailer = driver1
+                    leader = roster.drivers[driver2]
+                    trailer = roster.drivers[driver1]
                     leader_stats = {'points': driver2_points, 'wins': driver2_wins, 'podiums': driver2_podiums}
                     trailer_stats = {'points': driver1_points, 'wins': driver1_wins, 'podiums': driver1_podiums}
                 
@@ -1099,15 +1068,34 @@ with tab2:
                     battle_cols = st.columns(2)
                     col_idx = 0
         
+        if len(teams_drivers) > BATTLE_MAX_TEAMS:
+            # Every other team's battle as one table
+            pairs = np.array(roster.team_drivers)[standings.team_ranking[BATTLE_MAX_TEAMS:]]
+            pair_points = standings.driver_points[pairs]
+            leader_slot = np.where(pair_points[:, 1] > pair_points[:, 0], 1, 0)
+            rows = np.arange(len(pairs))
+            driver_names = np.array(roster.drivers, dtype=object)
+            st.caption(f"Battles of the leading {BATTLE_MAX_TEAMS} of {len(teams_drivers):,} teams above; the rest below")
+            st.dataframe(pd.DataFrame({
+                "Team": np.array(roster.teams, dtype=object)[standings.team_ranking[BATTLE_MAX_TEAMS:]],
+                "Leader": driver_names[pairs[rows, leader_slot]],
+                "Leader Points": pair_points[rows, leader_slot],
+                "Trailer": driver_names[pairs[rows, 1 - leader_slot]],
+                "Trailer Points": pair_points[rows, 1 - leader_slot],
+                "Gap": np.abs(pair_points[:, 0] - pair_points[:, 1]),
+                "Team Total": pair_points.sum(axis=1),
+            }), use_container_width=True, hide_index=True)
+        
         # Full Championship Table
         st.markdown("---")
         st.markdown("#### 📋 Complete Championship Standings")
         
         st.markdown('<div class="leaderboard">', unsafe_allow_html=True)
-        for pos, (driver, points) in enumerate(sorted_driver_standings, 1):
-            team = next(d['team'] for d in drivers if d['driver'] == driver)
-            wins = st.session_state.driver_wins[driver]
-            podiums = st.session_state.driver_podiums[driver]
+        for pos, (d, points) in enumerate(sorted_driver_standings, 1):
+            driver = roster.drivers[d]
+            team = roster.driver_team_names[d]
+            wins = standings.driver_wins[d]
+            podiums = standings.driver_podiums[d]
             
             # Position styling
             card_class = "position-1" if pos == 1 else "position-2" if pos == 2 else "position-3" if pos == 3 else ""
@@ -1134,6 +1122,17 @@ with tab2:
             </div>
             ''', unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
+        if N_DRIVERS > STANDINGS_MAX_ROWS:
+            rest = standings.driver_ranking[STANDINGS_MAX_ROWS:]
+            st.dataframe(pd.DataFrame({
+                "Position": np.arange(STANDINGS_MAX_ROWS + 1, N_DRIVERS + 1),
+                "Driver": np.array(roster.drivers, dtype=object)[rest],
+                "Team": np.array(roster.driver_team_names, dtype=object)[rest],
+                "Points": standings.driver_points[rest],
+                "Gap": sorted_driver_standings[0][1] - standings.driver_points[rest],
+                "Wins": standings.driver_wins[rest],
+                "Podiums": standings.driver_podiums[rest],
+            }), use_container_width=True, hide_index=True)
         
     else:
         # No races completed yet
@@ -1148,20 +1147,23 @@ with tab2:
     st.markdown('</div>', unsafe_allow_html=True)
 
 # Tab 3: Constructors' Championship Standings and Chart - REMOVED team member contribution section
-with tab3:
+if view == VIEWS[2]:
     st.markdown('<div class="race-container">', unsafe_allow_html=True)
     st.markdown("### 🏗️ Constructors' Championship Standings")
     st.markdown(f"**Races Completed: {st.session_state.races_completed}**")
     
-    sorted_team_standings = sorted(st.session_state.total_team_points.items(), key=lambda x: x[1], reverse=True)
+    # (team ID, points) of the leading teams
+    sorted_team_standings = standings.ranked_teams(STANDINGS_MAX_ROWS)
     if sorted_team_standings and st.session_state.races_completed > 0:
         st.markdown("#### 🥇 Top 3 Constructors")
-        for pos, (team, points) in enumerate(sorted_team_standings[:3], 1):
-            wins = st.session_state.team_wins[team]
-            podiums = st.session_state.team_podiums[team]
-            driver1, driver2 = teams_drivers[team]
-            driver1_points = st.session_state.total_driver_points[driver1]
-            driver2_points = st.session_state.total_driver_points[driver2]
+        for pos, (t, points) in enumerate(sorted_team_standings[:3], 1):
+            team = roster.teams[t]
+            wins = standings.team_wins[t]
+            podiums = standings.team_podiums[t]
+            d1, d2 = roster.team_drivers[t]
+            driver1, driver2 = roster.drivers[d1], roster.drivers[d2]
+            driver1_points = standings.driver_points[d1]
+            driver2_points = standings.driver_points[d2]
             card_class = "rating-card-gold" if pos == 1 else "rating-card-silver" if pos == 2 else "rating-card-bronze"
             medal = "🥇" if pos == 1 else "🥈" if pos == 2 else "🥉"
             position = "1st" if pos == 1 else "2nd" if pos == 2 else "3rd"
@@ -1192,94 +1194,32 @@ with tab3:
     
     st.markdown('<div class="leaderboard">', unsafe_allow_html=True)
     st.markdown("#### 📊 Complete Constructors' Standings")
-    team_standings_data = []
-    for pos, (team, points) in enumerate(sorted_team_standings, 1):
-        team_standings_data.append({"Position": pos, "Team": team, "Total Points": points})
+    for pos, (t, points) in enumerate(sorted_team_standings, 1):
         card_class = "position-1" if pos == 1 else "position-2" if pos == 2 else "position-3" if pos == 3 else ""
         st.markdown(f'''
         <div class="leaderboard-item {card_class}">
-            <span>{pos}. {team}</span>
+            <span>{pos}. {roster.teams[t]}</span>
             <span>{points} pts</span>
         </div>
         ''', unsafe_allow_html=True)
     
     st.markdown('</div>', unsafe_allow_html=True)
+    if roster.n_teams > STANDINGS_MAX_ROWS:
+        rest = standings.team_ranking[STANDINGS_MAX_ROWS:]
+        st.dataframe(pd.DataFrame({
+            "Position": np.arange(STANDINGS_MAX_ROWS + 1, roster.n_teams + 1),
+            "Team": np.array(roster.teams, dtype=object)[rest],
+            "Total Points": standings.team_points[rest],
+        }), use_container_width=True, hide_index=True)
     
     st.markdown("---")
     st.markdown("#### 🥧 Constructors' Points Distribution")
-    team_chart_data = [
-        {"value": points, "name": team, "itemStyle": {"color": team_colors[team]}}
-        for team, points in sorted_team_standings if points > 0
-    ]
-    if team_chart_data:
-        team_df_chart = pd.DataFrame([
-            {"Team": item["name"], "Points": item["value"], "Color": item["itemStyle"]["color"]}
-            for item in team_chart_data
-        ])
-        fig = px.pie(
-            team_df_chart,
-            values="Points",
-            names="Team",
-            color="Team",
-            color_discrete_map={row["Team"]: row["Color"] for _, row in team_df_chart.iterrows()}
-        )
-        fig.update_traces(textposition="outside", textinfo="label+value")
-        fig.update_layout(
-            height=600,
-            legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5),
-            font=dict(color="#000000"),
-            plot_bgcolor='rgba(240, 242, 246, 0.95)',
-            paper_bgcolor='rgba(240, 242, 246, 0.95)'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+    if standings.team_points.any():
+        st.plotly_chart(cached_figure("constructors_pie", constructors_pie_figure), use_container_width=True)
         
         st.markdown("---")
         st.markdown("#### 👥 Team Member Contributions")
-        team_contribution_data = []
-        for team, team_points in sorted_team_standings:
-            if team_points > 0:
-                driver1, driver2 = teams_drivers[team]
-                driver1_points = st.session_state.total_driver_points[driver1]
-                driver2_points = st.session_state.total_driver_points[driver2]
-                
-                team_contribution_data.append({
-                    "Team": team,
-                    driver1: driver1_points,
-                    driver2: driver2_points,
-                    "Total": team_points
-                })
-        
-        if team_contribution_data:
-            contrib_df = pd.DataFrame(team_contribution_data)
-            fig_bar = px.bar(
-                contrib_df,
-                x="Team",
-                y=[col for col in contrib_df.columns if col not in ["Team", "Total"]],
-                title="Points Contribution by Team Members",
-                labels={"value": "Points", "variable": "Driver"},
-                text_auto=True
-            )
-            
-            for i, trace in enumerate(fig_bar.data):
-                team_idx = i // 2
-                driver_idx = i % 2
-                team = contrib_df.iloc[team_idx]["Team"]
-                driver = teams_drivers[team][driver_idx]
-                trace.marker.color = driver_colors[driver]
-                trace.name = driver
-            
-            fig_bar.update_layout(
-                height=500,
-                xaxis_title="Team",
-                yaxis_title="Points",
-                legend_title="Driver",
-                barmode="stack",
-                font=dict(color="#000000"),
-                plot_bgcolor='rgba(240, 242, 246, 0.95)',
-                paper_bgcolor='rgba(240, 242, 246, 0.95)'
-            )
-            fig_bar.update_traces(textposition="inside", textfont_size=10)
-            st.plotly_chart(fig_bar, use_container_width=True)
+        st.plotly_chart(cached_figure("team_contributions", team_contributions_figure), use_container_width=True)
     else:
         st.markdown('<div class="rating-card">', unsafe_allow_html=True)
         st.write("No points data available yet. Please complete a race in the 'Race & Results' tab.")
@@ -1288,21 +1228,16 @@ with tab3:
     st.markdown('</div>', unsafe_allow_html=True)
 
 # Tab 4: Constructors' and Drivers' Stats
-with tab4:
+if view == VIEWS[3]:
     st.markdown('<div class="race-container">', unsafe_allow_html=True)
     st.markdown("### 🏆 Constructor Statistics")
     st.markdown(f"**Races Completed: {st.session_state.races_completed}**")
     
     st.markdown('<div class="leaderboard">', unsafe_allow_html=True)
-    constructor_stats_data = []
-    sorted_team_stats = sorted(
-        st.session_state.team_wins.items(),
-        key=lambda x: (st.session_state.team_wins[x[0]], st.session_state.team_podiums[x[0]]),
-        reverse=True
-    )
-    for pos, (team, wins) in enumerate(sorted_team_stats, 1):
-        podiums = st.session_state.team_podiums[team]
-        constructor_stats_data.append({"Position": pos, "Team": team, "Wins": wins, "Podiums": podiums})
+    for pos, t in enumerate(standings.team_wins_ranking[:STANDINGS_MAX_ROWS].tolist(), 1):
+        team = roster.teams[t]
+        wins = standings.team_wins[t]
+        podiums = standings.team_podiums[t]
         card_class = "position-1" if pos == 1 else "position-2" if pos == 2 else "position-3" if pos == 3 else ""
         st.markdown(f'''
         <div class="leaderboard-item {card_class}">
@@ -1311,22 +1246,25 @@ with tab4:
         </div>
         ''', unsafe_allow_html=True)
     st.markdown('</div>', unsafe_allow_html=True)
+    if roster.n_teams > STANDINGS_MAX_ROWS:
+        rest = standings.team_wins_ranking[STANDINGS_MAX_ROWS:]
+        st.dataframe(pd.DataFrame({
+            "Position": np.arange(STANDINGS_MAX_ROWS + 1, roster.n_teams + 1),
+            "Team": np.array(roster.teams, dtype=object)[rest],
+            "Wins": standings.team_wins[rest],
+            "Podiums": standings.team_podiums[rest],
+        }), use_container_width=True, hide_index=True)
     
     st.markdown("---")
     st.markdown("### 🏆 Driver Statistics")
     st.markdown(f"**Races Completed: {st.session_state.races_completed}**")
     
     st.markdown('<div class="leaderboard">', unsafe_allow_html=True)
-    driver_stats_data = []
-    sorted_driver_stats = sorted(
-        st.session_state.driver_wins.items(),
-        key=lambda x: (st.session_state.driver_wins[x[0]], st.session_state.driver_podiums[x[0]]),
-        reverse=True
-    )
-    for pos, (driver, wins) in enumerate(sorted_driver_stats, 1):
-        team = next(d['team'] for d in drivers if d['driver'] == driver)
-        podiums = st.session_state.driver_podiums[driver]
-        driver_stats_data.append({"Position": pos, "Driver": driver, "Team": team, "Wins": wins, "Podiums": podiums})
+    for pos, d in enumerate(standings.driver_wins_ranking[:STANDINGS_MAX_ROWS].tolist(), 1):
+        driver = roster.drivers[d]
+        team = roster.driver_team_names[d]
+        wins = standings.driver_wins[d]
+        podiums = standings.driver_podiums[d]
         card_class = "position-1" if pos == 1 else "position-2" if pos == 2 else "position-3" if pos == 3 else ""
         st.markdown(f'''
         <div class="leaderboard-item {card_class}">
@@ -1335,12 +1273,21 @@ with tab4:
         </div>
         ''', unsafe_allow_html=True)
     st.markdown('</div>', unsafe_allow_html=True)
+    if N_DRIVERS > STANDINGS_MAX_ROWS:
+        rest = standings.driver_wins_ranking[STANDINGS_MAX_ROWS:]
+        st.dataframe(pd.DataFrame({
+            "Position": np.arange(STANDINGS_MAX_ROWS + 1, N_DRIVERS + 1),
+            "Driver": np.array(roster.drivers, dtype=object)[rest],
+            "Team": np.array(roster.driver_team_names, dtype=object)[rest],
+            "Wins": standings.driver_wins[rest],
+            "Podiums": standings.driver_podiums[rest],
+        }), use_container_width=True, hide_index=True)
     
     st.markdown('</div>', unsafe_allow_html=True)
 
 # Tab 5: Driver Upgrades
 # Tab 5: Driver Upgrades
-with tab5:
+if view == VIEWS[4]:
     st.markdown('<div class="race-container">', unsafe_allow_html=True)
     st.markdown("### 🛠️ Driver Performance Tuning Center")
     st.markdown("Fine-tune each driver's starting advantage with interactive sliders. Higher values give drivers better race starts!")
@@ -1351,37 +1298,42 @@ with tab5:
     
     with preset_col1:
         if st.button("🟰 Equal Field (All 5%)", use_container_width=True):
-            for driver_info in drivers:
-                st.session_state.driver_headstarts[driver_info['driver']] = 5
+            for driver in roster.drivers:
+                st.session_state.driver_headstarts[driver] = 5
             st.rerun()
     
     with preset_col2:
         if st.button("🎲 Randomize All", use_container_width=True):
-            import random
-            for driver_info in drivers:
-                st.session_state.driver_headstarts[driver_info['driver']] = random.randint(1, 9)
+            st.session_state.preset_draws += 1
+            preset_rng = stream_rng(st.session_state.season_seed, PRESET_STREAM, st.session_state.preset_draws)
+            for driver, headstart in zip(roster.drivers, preset_rng.integers(1, 10, size=N_DRIVERS)):
+                st.session_state.driver_headstarts[driver] = int(headstart)
             st.rerun()
     
     with preset_col3:
         if st.button("🔄 Reset to Default (All 1%)", use_container_width=True):
-            for driver_info in drivers:
-                st.session_state.driver_headstarts[driver_info['driver']] = 1
+            for driver in roster.drivers:
+                st.session_state.driver_headstarts[driver] = 1
             st.rerun()
     
     with preset_col4:
         if st.button("⚡ Boost Mode (All 9%)", use_container_width=True):
-            for driver_info in drivers:
-                st.session_state.driver_headstarts[driver_info['driver']] = 9
+            for driver in roster.drivers:
+                st.session_state.driver_headstarts[driver] = 9
             st.rerun()
     
     st.markdown("---")
     st.markdown("#### 🏎️ Individual Driver Tuning")
     
     # Group drivers by team for better organization
+    tuned_teams = range(roster.n_teams)
+    if roster.n_teams > TUNING_MAX_TEAMS:
+        tuned_team = st.selectbox("Team", roster.teams, key="tuning_team")
+        tuned_teams = [roster.team_ids[tuned_team]]
     team_columns = st.columns(2)
-    team_list = list(teams_drivers.keys())
     
-    for i, (team, team_drivers) in enumerate(teams_drivers.items()):
+    for i, t in enumerate(tuned_teams):
+        team = roster.teams[t]
         with team_columns[i % 2]:
             st.markdown(f'''
             <div class="rating-card" style="background: linear-gradient(135deg, {team_colors[team]}, {team_colors[team]}40); margin-bottom: 20px;">
@@ -1393,7 +1345,8 @@ with tab5:
             </div>
             ''', unsafe_allow_html=True)
             
-            for driver in team_drivers:
+            for d in roster.team_drivers[t]:
+                driver = roster.drivers[d]
                 current_headstart = st.session_state.driver_headstarts.get(driver, 1)
                 
                 # Create a unique key for each slider
@@ -1425,7 +1378,7 @@ with tab5:
                         <span style="font-size: 12px; color: #000000;">{boost_level}</span>
                     </div>
                     <div style="background-color: #f0f0f0; border-radius: 15px; height: 20px; overflow: hidden; box-shadow: inset 0 2px 4px rgba(0, 0, 0, 0.1);">
-                        <div style="background: linear-gradient(90deg, {driver_colors.get(driver, '#3498db')}, {driver_colors.get(driver, '#3498db')}80); height: 100%; width: {progress_width}%; border-radius: 15px; position: relative; transition: width 0.3s ease;">
+                        <div style="background: linear-gradient(90deg, {palette.base_hex[d]}, {palette.base_hex[d]}80); height: 100%; width: {progress_width}%; border-radius: 15px; position: relative; transition: width 0.3s ease;">
                             <div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); font-size: 11px; font-weight: bold; color: #000000;">
                                 {new_headstart}% Boost
                             </div>
@@ -1477,14 +1430,60 @@ with tab5:
             help="Difference between highest and lowest headstart"
         )
     
+    # Exact per-race outcome for the current headstarts (no sampling)
+    st.markdown("---")
+    st.markdown("#### 🎯 Expected Race Outcome")
+    headstart_vector = tuple(st.session_state.driver_headstarts.get(driver, 1) for driver in roster.drivers)
+    # Only the headstarts (and, for the sampled estimate, the season seed)
+    # change the outcome, so it is reused across reruns until they move
+    outcome_key = (headstart_vector, st.session_state.season_seed)
+    if st.session_state.outcome_cache.get('key') != outcome_key:
+        if N_DRIVERS <= EXACT_OUTCOME_MAX_DRIVERS:
+            position_probabilities = finish_position_probabilities(headstart_vector)
+            position_points = points_lookup(points_system, N_DRIVERS)
+            win_rate = position_probabilities[:, 0]
+            podium_rate = position_probabilities[:, :3].sum(axis=1)
+            points_rate = position_probabilities[:, position_points > 0].sum(axis=1)
+            expected = position_probabilities @ position_points
+            outcome_caption = "Exact probabilities per race, including the grid-order tie-break for drivers finishing on the same tick"
+        else:
+            outcome_samples = max(100, OUTCOME_SAMPLE_CELLS // N_DRIVERS)
+            points, wins, podiums = simulate_season_totals(
+                headstart_vector, 1, outcome_samples, points_system,
+                rng=stream_rng(st.session_state.season_seed, OUTCOME_STREAM)
+            )
+            win_rate = wins.mean(axis=0)
+            podium_rate = podiums.mean(axis=0)
+            points_rate = (points > 0).mean(axis=0)
+            expected = points.mean(axis=0)
+            outcome_caption = f"Estimated from {outcome_samples:,} sampled races (the exact solver is limited to {EXACT_OUTCOME_MAX_DRIVERS} drivers)"
+        st.session_state.outcome_cache = {
+            'key': outcome_key,
+            'rates': (win_rate, podium_rate, points_rate, expected),
+            'caption': outcome_caption
+        }
+    win_rate, podium_rate, points_rate, expected = st.session_state.outcome_cache['rates']
+    outcome_caption = st.session_state.outcome_cache['caption']
+    outcome_df = pd.DataFrame({
+        "Driver": roster.drivers,
+        "Team": roster.driver_team_names,
+        "Headstart (%)": headstart_vector,
+        "Win %": np.round(win_rate * 100, 1),
+        "Podium %": np.round(podium_rate * 100, 1),
+        "Points Finish %": np.round(points_rate * 100, 1),
+        "Expected Points": np.round(expected, 2)
+    }).sort_values("Expected Points", ascending=False)
+    st.caption(outcome_caption)
+    st.dataframe(outcome_df, use_container_width=True, hide_index=True)
+    
     # Top boosted drivers
     st.markdown("---")
     #st.markdown("#### 🏆 Most Boosted Drivers")
     
     # Sort drivers by headstart
     sorted_headstarts = sorted(
-        [(driver, headstart, next(d['team'] for d in drivers if d['driver'] == driver)) 
-         for driver, headstart in st.session_state.driver_headstarts.items()],
+        [(roster.drivers[d], headstart, roster.driver_team_names[d])
+         for d, headstart in enumerate(headstart_vector)],
         key=lambda x: x[1],
         reverse=True
     )
@@ -1653,7 +1652,7 @@ with tab5:
     st.markdown('</div>', unsafe_allow_html=True)
 
 # Tab 6: Season Summary - Enhanced with More Awards
-with tab6:
+if view == VIEWS[5]:
     st.markdown('<div class="race-container">', unsafe_allow_html=True)
     st.markdown("### 🏁 Season Summary")
     st.markdown(f"**Races Completed: {st.session_state.races_completed}**")
@@ -1663,11 +1662,12 @@ with tab6:
         
         with col1:
             st.markdown("#### 🏆 Drivers' Championship Leaders")
-            sorted_driver_standings = sorted(st.session_state.total_driver_points.items(), key=lambda x: x[1], reverse=True)
-            for i, (driver, points) in enumerate(sorted_driver_standings[:3]):
-                team = next(d['team'] for d in drivers if d['driver'] == driver)
-                wins = st.session_state.driver_wins[driver]
-                podiums = st.session_state.driver_podiums[driver]
+            sorted_driver_standings = standings.ranked_drivers(3)
+            for i, (d, points) in enumerate(sorted_driver_standings):
+                driver = roster.drivers[d]
+                team = roster.driver_team_names[d]
+                wins = standings.driver_wins[d]
+                podiums = standings.driver_podiums[d]
                 
                 card_class = "rating-card-gold" if i == 0 else "rating-card-silver" if i == 1 else "rating-card-bronze"
                 medal = "🥇" if i == 0 else "🥈" if i == 1 else "🥉"
@@ -1692,13 +1692,15 @@ with tab6:
         
         with col2:
             st.markdown("#### 🏗️ Constructors' Championship Leaders")
-            sorted_team_standings = sorted(st.session_state.total_team_points.items(), key=lambda x: x[1], reverse=True)
-            for i, (team, points) in enumerate(sorted_team_standings[:3]):
-                wins = st.session_state.team_wins[team]
-                podiums = st.session_state.team_podiums[team]
-                driver1, driver2 = teams_drivers[team]
-                driver1_points = st.session_state.total_driver_points[driver1]
-                driver2_points = st.session_state.total_driver_points[driver2]
+            sorted_team_standings = standings.ranked_teams(3)
+            for i, (t, points) in enumerate(sorted_team_standings):
+                team = roster.teams[t]
+                wins = standings.team_wins[t]
+                podiums = standings.team_podiums[t]
+                d1, d2 = roster.team_drivers[t]
+                driver1, driver2 = roster.drivers[d1], roster.drivers[d2]
+                driver1_points = standings.driver_points[d1]
+                driver2_points = standings.driver_points[d2]
                 
                 card_class = "rating-card-gold" if i == 0 else "rating-card-silver" if i == 1 else "rating-card-bronze"
                 medal = "🥇" if i == 0 else "🥈" if i == 1 else "🥉"
@@ -1733,8 +1735,9 @@ with tab6:
         
         with col2:
             if sorted_driver_standings:
-                most_successful_driver = sorted_driver_standings[0][0]
-                driver_team = next(d['team'] for d in drivers if d['driver'] == most_successful_driver)
+                d = sorted_driver_standings[0][0]
+                most_successful_driver = roster.drivers[d]
+                driver_team = roster.driver_team_names[d]
                 st.metric(
                     label="🏆 Championship Leader",
                     value=f"{most_successful_driver}",
@@ -1743,7 +1746,7 @@ with tab6:
         
         with col3:
             if sorted_team_standings:
-                most_successful_team = sorted_team_standings[0][0]
+                most_successful_team = roster.teams[sorted_team_standings[0][0]]
                 st.metric(
                     label="🏗️ Constructor Leader",
                     value=f"{most_successful_team}",
@@ -1751,7 +1754,7 @@ with tab6:
                 )
         
         with col4:
-            total_points_awarded = sum(st.session_state.total_driver_points.values())
+            total_points_awarded = int(standings.driver_points.sum())
             st.metric(
                 label="💯 Total Points Awarded",
                 value=total_points_awarded
@@ -1763,10 +1766,10 @@ with tab6:
             winners_data = []
             for summary in st.session_state.race_summaries:
                 winners_data.append({
-                    "Race": summary["Race"],
-                    "Winner": summary["P1"],
-                    "2nd Place": summary["P2"],
-                    "3rd Place": summary["P3"]
+                    "Race": summary.race,
+                    "Winner": roster.label(summary.drivers[0]),
+                    "2nd Place": roster.label(summary.drivers[1]),
+                    "3rd Place": roster.label(summary.drivers[2])
                 })
             
             st.markdown('<div class="leaderboard">', unsafe_allow_html=True)
@@ -1787,25 +1790,37 @@ with tab6:
         st.markdown("---")
         st.markdown("#### 🎖️ Major Awards & Recognitions")
         
+        # Every award in one pass over the standings arrays; reused until a
+        # race completes or the headstarts change
+        headstart_vector = tuple(st.session_state.driver_headstarts.get(driver, 1) for driver in roster.drivers)
+        awards_key = (st.session_state.races_completed, headstart_vector)
+        if st.session_state.awards_cache.get('key') != awards_key:
+            st.session_state.awards_cache = {
+                'key': awards_key,
+                'awards': evaluate_awards(season_stats(
+                    standings, headstart_vector, st.session_state.race_summaries, roster.team_drivers))
+            }
+        season_awards = st.session_state.awards_cache['awards']
+        
         # Row 1: Top Performance Awards
         award_col1, award_col2, award_col3 = st.columns(3)
         
         with award_col1:
-            most_wins_driver = max(st.session_state.driver_wins.items(), key=lambda x: x[1])
-            if most_wins_driver[1] > 0:
-                driver_team = next(d['team'] for d in drivers if d['driver'] == most_wins_driver[0])
+            most_wins_driver = season_awards["Race Winner King"]
+            if most_wins_driver:
+                driver_team = roster.driver_team_names[most_wins_driver[0]]
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%); color: #000000;">
                     <div class="rating-header">
                         <div>
                             <div class="driver-name">🏆 Race Winner King</div>
-                            <div class="team-name">{most_wins_driver[0]} ({driver_team})</div>
+                            <div class="team-name">{roster.drivers[most_wins_driver[0]]} ({driver_team})</div>
                         </div>
                         <div class="rating-score">{most_wins_driver[1]}</div>
                     </div>
                     <div class="rating-details">
                         <span>Win Rate: {(most_wins_driver[1]/st.session_state.races_completed)*100:.1f}%</span>
-                        <span>Total Points: {st.session_state.total_driver_points[most_wins_driver[0]]}</span>
+                        <span>Total Points: {most_wins_driver[2]}</span>
                     </div>
                 </div>
                 ''', unsafe_allow_html=True)
@@ -1823,21 +1838,21 @@ with tab6:
                 ''', unsafe_allow_html=True)
         
         with award_col2:
-            most_podiums_driver = max(st.session_state.driver_podiums.items(), key=lambda x: x[1])
-            if most_podiums_driver[1] > 0:
-                driver_team = next(d['team'] for d in drivers if d['driver'] == most_podiums_driver[0])
+            most_podiums_driver = season_awards["Podium Master"]
+            if most_podiums_driver:
+                driver_team = roster.driver_team_names[most_podiums_driver[0]]
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #9b59b6 0%, #8e44ad 100%); color: #000000;">
                     <div class="rating-header">
                         <div>
                             <div class="driver-name">🥇 Podium Master</div>
-                            <div class="team-name">{most_podiums_driver[0]} ({driver_team})</div>
+                            <div class="team-name">{roster.drivers[most_podiums_driver[0]]} ({driver_team})</div>
                         </div>
                         <div class="rating-score">{most_podiums_driver[1]}</div>
                     </div>
                     <div class="rating-details">
                         <span>Podium Rate: {(most_podiums_driver[1]/st.session_state.races_completed)*100:.1f}%</span>
-                        <span>Total Points: {st.session_state.total_driver_points[most_podiums_driver[0]]}</span>
+                        <span>Total Points: {most_podiums_driver[2]}</span>
                     </div>
                 </div>
                 ''', unsafe_allow_html=True)
@@ -1855,20 +1870,20 @@ with tab6:
                 ''', unsafe_allow_html=True)
         
         with award_col3:
-            best_constructor = max(st.session_state.total_team_points.items(), key=lambda x: x[1])
-            if best_constructor[1] > 0:
+            best_constructor = season_awards["Constructor Champion"]
+            if best_constructor:
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #f39c12 0%, #e67e22 100%); color: #000000;">
                     <div class="rating-header">
                         <div>
                             <div class="driver-name">🏗️ Constructor Champion</div>
-                            <div class="team-name">{best_constructor[0]}</div>
+                            <div class="team-name">{roster.teams[best_constructor[0]]}</div>
                         </div>
                         <div class="rating-score">{best_constructor[1]} pts</div>
                     </div>
                     <div class="rating-details">
-                        <span>Wins: {st.session_state.team_wins[best_constructor[0]]}</span>
-                        <span>Podiums: {st.session_state.team_podiums[best_constructor[0]]}</span>
+                        <span>Wins: {best_constructor[2]}</span>
+                        <span>Podiums: {best_constructor[3]}</span>
                     </div>
                 </div>
                 ''', unsafe_allow_html=True)
@@ -1891,16 +1906,11 @@ with tab6:
         
         with award_col4:
             # Most Consistent Driver (no wins but points)
-            consistent_driver = None
-            consistent_points = 0
-            for driver, points in sorted_driver_standings:
-                if st.session_state.driver_wins[driver] == 0 and points > consistent_points:
-                    consistent_driver = driver
-                    consistent_points = points
-            
-            if consistent_driver:
-                driver_team = next(d['team'] for d in drivers if d['driver'] == consistent_driver)
-                podiums = st.session_state.driver_podiums[consistent_driver]
+            mr_reliable = season_awards["Mr. Reliable"]
+            if mr_reliable:
+                consistent_driver = roster.drivers[mr_reliable[0]]
+                driver_team = roster.driver_team_names[mr_reliable[0]]
+                consistent_points, podiums = mr_reliable[1:]
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #27ae60 0%, #229954 100%); color: #000000;">
                     <div class="rating-header">
@@ -1931,20 +1941,16 @@ with tab6:
         
         with award_col5:
             # Highest Rated Driver
-            highest_rated_driver = max(
-                [(d['driver'], calculate_driver_rating(d['driver'])) for d in drivers],
-                key=lambda x: x[1]
-            )
-            driver_team = next(d['team'] for d in drivers if d['driver'] == highest_rated_driver[0])
-            rating = highest_rated_driver[1]
-            points = st.session_state.total_driver_points[highest_rated_driver[0]]
+            highest_rated_driver = season_awards["Highest Rated"]
+            driver_team = roster.driver_team_names[highest_rated_driver[0]]
+            rating, points = highest_rated_driver[1:]
             
             st.markdown(f'''
             <div class="rating-card" style="background: linear-gradient(135deg, #3498db 0%, #2980b9 100%); color: #000000;">
                 <div class="rating-header">
                     <div>
                         <div class="driver-name">⭐ Highest Rated</div>
-                        <div class="team-name">{highest_rated_driver[0]} ({driver_team})</div>
+                        <div class="team-name">{roster.drivers[highest_rated_driver[0]]} ({driver_team})</div>
                     </div>
                     <div class="rating-score">{rating:.1f}/10</div>
                 </div>
@@ -1957,16 +1963,15 @@ with tab6:
         
         with award_col6:
             # Best Rookie (driver with least experience/points but still competitive)
-            rookie_candidates = [(driver, points) for driver, points in sorted_driver_standings if points < 50 and points > 0]
-            if rookie_candidates:
-                best_rookie = max(rookie_candidates, key=lambda x: x[1])
-                driver_team = next(d['team'] for d in drivers if d['driver'] == best_rookie[0])
+            best_rookie = season_awards["Rising Star"]
+            if best_rookie:
+                driver_team = roster.driver_team_names[best_rookie[0]]
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #e67e22 0%, #d35400 100%); color: #000000;">
                     <div class="rating-header">
                         <div>
                             <div class="driver-name">🌱 Rising Star</div>
-                            <div class="team-name">{best_rookie[0]} ({driver_team})</div>
+                            <div class="team-name">{roster.drivers[best_rookie[0]]} ({driver_team})</div>
                         </div>
                         <div class="rating-score">{best_rookie[1]} pts</div>
                     </div>
@@ -1995,42 +2000,24 @@ with tab6:
         
         with award_col7:
             # Most Improved Team (based on recent performance)
-            if len(st.session_state.race_summaries) >= 3:
-                recent_winners = [summary["P1"].split(' (')[1].replace(')', '') for summary in st.session_state.race_summaries[-3:]]
-                team_recent_wins = {}
-                for team_name in recent_winners:
-                    team_recent_wins[team_name] = team_recent_wins.get(team_name, 0) + 1
-                
-                if team_recent_wins:
-                    most_improved_team = max(team_recent_wins.items(), key=lambda x: x[1])
-                    team_total_wins = st.session_state.team_wins[most_improved_team[0]]
-                    st.markdown(f'''
-                    <div class="rating-card" style="background: linear-gradient(135deg, #16a085 0%, #138d75 100%); color: #000000;">
-                        <div class="rating-header">
-                            <div>
-                                <div class="driver-name">📈 Most Improved Team</div>
-                                <div class="team-name">{most_improved_team[0]}</div>
-                            </div>
-                            <div class="rating-score">{most_improved_team[1]}/3</div>
-                        </div>
-                        <div class="rating-details">
-                            <span>Recent Form</span>
-                            <span>Total Wins: {team_total_wins}</span>
+            most_improved_team = season_awards["Most Improved Team"]
+            if most_improved_team:
+                team_total_wins = most_improved_team[2]
+                st.markdown(f'''
+                <div class="rating-card" style="background: linear-gradient(135deg, #16a085 0%, #138d75 100%); color: #000000;">
+                    <div class="rating-header">
+                        <div>
+                            <div class="driver-name">📈 Most Improved Team</div>
+                            <div class="team-name">{roster.teams[most_improved_team[0]]}</div>
                         </div>
+                        <div class="rating-score">{most_improved_team[1]}/3</div>
                     </div>
-                    ''', unsafe_allow_html=True)
-                else:
-                    st.markdown(f'''
-                    <div class="rating-card" style="background: linear-gradient(135deg, #16a085 0%, #138d75 100%); color: #000000;">
-                        <div class="rating-header">
-                            <div>
-                                <div class="driver-name">📈 Most Improved Team</div>
-                                <div class="team-name">Need more races</div>
-                            </div>
-                            <div class="rating-score">0</div>
-                        </div>
+                    <div class="rating-details">
+                        <span>Recent Form</span>
+                        <span>Total Wins: {team_total_wins}</span>
                     </div>
-                    ''', unsafe_allow_html=True)
+                </div>
+                ''', unsafe_allow_html=True)
             else:
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #16a085 0%, #138d75 100%); color: #000000;">
@@ -2046,18 +2033,11 @@ with tab6:
         
         with award_col8:
             # Point Scoring Machine (most points per race average)
-            best_avg_driver = None
-            best_avg = 0
-            for driver, points in sorted_driver_standings:
-                if points > 0:
-                    avg = points / st.session_state.races_completed
-                    if avg > best_avg:
-                        best_avg = avg
-                        best_avg_driver = driver
-            
-            if best_avg_driver:
-                driver_team = next(d['team'] for d in drivers if d['driver'] == best_avg_driver)
-                total_points = st.session_state.total_driver_points[best_avg_driver]
+            scoring_machine = season_awards["Point Scoring Machine"]
+            if scoring_machine:
+                best_avg_driver = roster.drivers[scoring_machine[0]]
+                driver_team = roster.driver_team_names[scoring_machine[0]]
+                best_avg, total_points = scoring_machine[1:]
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #8e44ad 0%, #7d3c98 100%); color: #000000;">
                     <div class="rating-header">
@@ -2088,24 +2068,15 @@ with tab6:
         
         with award_col9:
             # Underdog Hero (lowest headstart but good performance)
-            underdog_candidates = []
-            for driver_info in drivers:
-                driver = driver_info['driver']
-                headstart = st.session_state.driver_headstarts.get(driver, 1)
-                points = st.session_state.total_driver_points[driver]
-                if points > 0:
-                    efficiency_score = points / headstart
-                    underdog_candidates.append((driver, efficiency_score, points, headstart))
-            
-            if underdog_candidates:
-                best_underdog = max(underdog_candidates, key=lambda x: x[1])
-                driver_team = next(d['team'] for d in drivers if d['driver'] == best_underdog[0])
+            best_underdog = season_awards["Underdog Hero"]
+            if best_underdog:
+                driver_team = roster.driver_team_names[best_underdog[0]]
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #d35400 0%, #ba4a00 100%); color: #000000;">
                     <div class="rating-header">
                         <div>
                             <div class="driver-name">🦾 Underdog Hero</div>
-                            <div class="team-name">{best_underdog[0]} ({driver_team})</div>
+                            <div class="team-name">{roster.drivers[best_underdog[0]]} ({driver_team})</div>
                         </div>
                         <div class="rating-score">{best_underdog[1]:.1f}</div>
                     </div>
@@ -2134,26 +2105,14 @@ with tab6:
         
         with award_col10:
             # Best Teammate Partnership (smallest gap between teammates)
-            best_partnership = None
-            smallest_gap = float('inf')
-            for team, team_drivers in teams_drivers.items():
-                driver1, driver2 = team_drivers
-                driver1_points = st.session_state.total_driver_points[driver1]
-                driver2_points = st.session_state.total_driver_points[driver2]
-                gap = abs(driver1_points - driver2_points)
-                total_team_points = driver1_points + driver2_points
-                
-                if total_team_points > 0 and gap < smallest_gap:
-                    smallest_gap = gap
-                    best_partnership = (team, gap, total_team_points)
-            
+            best_partnership = season_awards["Best Partnership"]
             if best_partnership:
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #2ecc71 0%, #27ae60 100%); color: #000000;">
                     <div class="rating-header">
                         <div>
                             <div class="driver-name">🤝 Best Partnership</div>
-                            <div class="team-name">{best_partnership[0]}</div>
+                            <div class="team-name">{roster.teams[best_partnership[0]]}</div>
                         </div>
                         <div class="rating-score">{best_partnership[1]} pts</div>
                     </div>
@@ -2178,39 +2137,20 @@ with tab6:
         
         with award_col11:
             # Giant Killer (driver who beats highly rated teammates)
-            giant_killer = None
-            best_teammate_beating_ratio = 0
-            for team, team_drivers in teams_drivers.items():
-                driver1, driver2 = team_drivers
-                driver1_points = st.session_state.total_driver_points[driver1]
-                driver2_points = st.session_state.total_driver_points[driver2]
-                driver1_headstart = st.session_state.driver_headstarts.get(driver1, 1)
-                driver2_headstart = st.session_state.driver_headstarts.get(driver2, 1)
-                
-                if driver1_headstart < driver2_headstart and driver1_points > driver2_points:
-                    ratio = driver1_points / driver2_points if driver2_points > 0 else 1
-                    if ratio > best_teammate_beating_ratio:
-                        best_teammate_beating_ratio = ratio
-                        giant_killer = (driver1, team, driver1_points, driver2_points)
-                elif driver2_headstart < driver1_headstart and driver2_points > driver1_points:
-                    ratio = driver2_points / driver1_points if driver1_points > 0 else 1
-                    if ratio > best_teammate_beating_ratio:
-                        best_teammate_beating_ratio = ratio
-                        giant_killer = (driver2, team, driver2_points, driver1_points)
-            
+            giant_killer = season_awards["Giant Killer"]
             if giant_killer:
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #e74c3c 0%, #cb4335 100%); color: #000000;">
                     <div class="rating-header">
                         <div>
                             <div class="driver-name">🗡️ Giant Killer</div>
-                            <div class="team-name">{giant_killer[0]} ({giant_killer[1]})</div>
+                            <div class="team-name">{roster.drivers[giant_killer[0]]} ({roster.teams[giant_killer[1]]})</div>
                         </div>
-                        <div class="rating-score">{best_teammate_beating_ratio:.1f}x</div>
+                        <div class="rating-score">{giant_killer[2]:.1f}x</div>
                     </div>
                     <div class="rating-details">
                         <span>Beat Favored Teammate</span>
-                        <span>{giant_killer[2]} vs {giant_killer[3]} pts</span>
+                        <span>{giant_killer[3]} vs {giant_killer[4]} pts</span>
                     </div>
                 </div>
                 ''', unsafe_allow_html=True)
@@ -2229,49 +2169,25 @@ with tab6:
         
         with award_col12:
             # Comeback King (driver who improved most from last position)
-            if st.session_state.race_summaries:
-                comeback_scores = {}
-                for summary in st.session_state.race_summaries:
-                    # Count podium finishes for comeback calculation
-                    p1_driver = summary["P1"].split(' (')[0]
-                    p2_driver = summary["P2"].split(' (')[0]
-                    p3_driver = summary["P3"].split(' (')[0]
-                    
-                    comeback_scores[p1_driver] = comeback_scores.get(p1_driver, 0) + 3
-                    comeback_scores[p2_driver] = comeback_scores.get(p2_driver, 0) + 2
-                    comeback_scores[p3_driver] = comeback_scores.get(p3_driver, 0) + 1
-                
-                if comeback_scores:
-                    comeback_king = max(comeback_scores.items(), key=lambda x: x[1])
-                    driver_team = next(d['team'] for d in drivers if d['driver'] == comeback_king[0])
-                    driver_wins = st.session_state.driver_wins[comeback_king[0]]
-                    st.markdown(f'''
-                    <div class="rating-card" style="background: linear-gradient(135deg, #f1c40f 0%, #f39c12 100%); color: #000000;">
-                        <div class="rating-header">
-                            <div>
-                                <div class="driver-name">👑 Comeback King</div>
-                                <div class="team-name">{comeback_king[0]} ({driver_team})</div>
-                            </div>
-                            <div class="rating-score">{comeback_king[1]}</div>
-                        </div>
-                        <div class="rating-details">
-                            <span>Podium Score</span>
-                            <span>Wins: {driver_wins}</span>
+            comeback_king = season_awards["Comeback King"]
+            if comeback_king:
+                driver_team = roster.driver_team_names[comeback_king[0]]
+                driver_wins = comeback_king[2]
+                st.markdown(f'''
+                <div class="rating-card" style="background: linear-gradient(135deg, #f1c40f 0%, #f39c12 100%); color: #000000;">
+                    <div class="rating-header">
+                        <div>
+                            <div class="driver-name">👑 Comeback King</div>
+                            <div class="team-name">{roster.drivers[comeback_king[0]]} ({driver_team})</div>
                         </div>
+                        <div class="rating-score">{comeback_king[1]}</div>
                     </div>
-                    ''', unsafe_allow_html=True)
-                else:
-                    st.markdown(f'''
-                    <div class="rating-card" style="background: linear-gradient(135deg, #f1c40f 0%, #f39c12 100%); color: #000000;">
-                        <div class="rating-header">
-                            <div>
-                                <div class="driver-name">👑 Comeback King</div>
-                                <div class="team-name">No comebacks yet</div>
-                            </div>
-                            <div class="rating-score">0</div>
-                        </div>
+                    <div class="rating-details">
+                        <span>Podium Score</span>
+                        <span>Wins: {driver_wins}</span>
                     </div>
-                    ''', unsafe_allow_html=True)
+                </div>
+                ''', unsafe_allow_html=True)
             else:
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #f1c40f 0%, #f39c12 100%); color: #000000;">
@@ -2291,23 +2207,15 @@ with tab6:
         
         with award_col13:
             # Speed Demon (driver with highest headstart who still performs well)
-            speed_demons = []
-            for driver_info in drivers:
-                driver = driver_info['driver']
-                headstart = st.session_state.driver_headstarts.get(driver, 1)
-                points = st.session_state.total_driver_points[driver]
-                if headstart >= 7 and points > 20:
-                    speed_demons.append((driver, headstart, points))
-            
-            if speed_demons:
-                best_speed_demon = max(speed_demons, key=lambda x: x[2])
-                driver_team = next(d['team'] for d in drivers if d['driver'] == best_speed_demon[0])
+            best_speed_demon = season_awards["Speed Demon"]
+            if best_speed_demon:
+                driver_team = roster.driver_team_names[best_speed_demon[0]]
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #ff6b6b 0%, #ee5a52 100%); color: #000000;">
                     <div class="rating-header">
                         <div>
                             <div class="driver-name">💨 Speed Demon</div>
-                            <div class="team-name">{best_speed_demon[0]} ({driver_team})</div>
+                            <div class="team-name">{roster.drivers[best_speed_demon[0]]} ({driver_team})</div>
                         </div>
                         <div class="rating-score">{best_speed_demon[2]} pts</div>
                     </div>
@@ -2332,24 +2240,15 @@ with tab6:
         
         with award_col14:
             # Dark Horse (surprising performer with low expectations)
-            dark_horses = []
-            for driver_info in drivers:
-                driver = driver_info['driver']
-                headstart = st.session_state.driver_headstarts.get(driver, 1)
-                points = st.session_state.total_driver_points[driver]
-                wins = st.session_state.driver_wins[driver]
-                if headstart <= 3 and (points > 30 or wins > 0):
-                    dark_horses.append((driver, points, wins, headstart))
-            
-            if dark_horses:
-                best_dark_horse = max(dark_horses, key=lambda x: (x[2], x[1]))
-                driver_team = next(d['team'] for d in drivers if d['driver'] == best_dark_horse[0])
+            best_dark_horse = season_awards["Dark Horse"]
+            if best_dark_horse:
+                driver_team = roster.driver_team_names[best_dark_horse[0]]
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #34495e 0%, #2c3e50 100%); color: #ffffff;">
                     <div class="rating-header">
                         <div>
                             <div class="driver-name" style="color: #ffffff;">🐎 Dark Horse</div>
-                            <div class="team-name" style="color: #ffffff;">{best_dark_horse[0]} ({driver_team})</div>
+                            <div class="team-name" style="color: #ffffff;">{roster.drivers[best_dark_horse[0]]} ({driver_team})</div>
                         </div>
                         <div class="rating-score" style="color: #ffffff;">{best_dark_horse[1]} pts</div>
                     </div>
@@ -2374,23 +2273,15 @@ with tab6:
         
         with award_col15:
             # Veteran Excellence (consistent points without being championship leader)
-            veterans = []
-            championship_leader = sorted_driver_standings[0][0] if sorted_driver_standings else None
-            for driver, points in sorted_driver_standings[1:6]:  # Top 2-6 drivers
-                if points > 0:
-                    consistency_score = points / st.session_state.races_completed
-                    podiums = st.session_state.driver_podiums[driver]
-                    veterans.append((driver, consistency_score, points, podiums))
-            
-            if veterans:
-                best_veteran = max(veterans, key=lambda x: x[1])
-                driver_team = next(d['team'] for d in drivers if d['driver'] == best_veteran[0])
+            best_veteran = season_awards["Veteran Excellence"]
+            if best_veteran:
+                driver_team = roster.driver_team_names[best_veteran[0]]
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #9c88ff 0%, #8c7ae6 100%); color: #000000;">
                     <div class="rating-header">
                         <div>
                             <div class="driver-name">🎖️ Veteran Excellence</div>
-                            <div class="team-name">{best_veteran[0]} ({driver_team})</div>
+                            <div class="team-name">{roster.drivers[best_veteran[0]]} ({driver_team})</div>
                         </div>
                         <div class="rating-score">{best_veteran[1]:.1f}</div>
                     </div>
@@ -2419,24 +2310,15 @@ with tab6:
         
         with award_col16:
             # Lucky Charm (driver who gets points despite low performance indicators)
-            lucky_charms = []
-            for driver_info in drivers:
-                driver = driver_info['driver']
-                points = st.session_state.total_driver_points[driver]
-                wins = st.session_state.driver_wins[driver]
-                podiums = st.session_state.driver_podiums[driver]
-                if points > 15 and wins == 0 and podiums <= 1:
-                    lucky_charms.append((driver, points))
-            
-            if lucky_charms:
-                luckiest_driver = max(lucky_charms, key=lambda x: x[1])
-                driver_team = next(d['team'] for d in drivers if d['driver'] == luckiest_driver[0])
+            luckiest_driver = season_awards["Lucky Charm"]
+            if luckiest_driver:
+                driver_team = roster.driver_team_names[luckiest_driver[0]]
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #00d2d3 0%, #00a8cc 100%); color: #000000;">
                     <div class="rating-header">
                         <div>
                             <div class="driver-name">🍀 Lucky Charm</div>
-                            <div class="team-name">{luckiest_driver[0]} ({driver_team})</div>
+                            <div class="team-name">{roster.drivers[luckiest_driver[0]]} ({driver_team})</div>
                         </div>
                         <div class="rating-score">{luckiest_driver[1]} pts</div>
                     </div>
@@ -2461,25 +2343,14 @@ with tab6:
         
         with award_col17:
             # Perfect Storm (team with both drivers performing well)
-            perfect_storms = []
-            for team, team_drivers in teams_drivers.items():
-                driver1, driver2 = team_drivers
-                driver1_points = st.session_state.total_driver_points[driver1]
-                driver2_points = st.session_state.total_driver_points[driver2]
-                min_points = min(driver1_points, driver2_points)
-                total_points = driver1_points + driver2_points
-                
-                if min_points > 20 and total_points > 60:
-                    perfect_storms.append((team, total_points, min_points))
-            
-            if perfect_storms:
-                best_storm = max(perfect_storms, key=lambda x: x[2])
+            best_storm = season_awards["Perfect Storm"]
+            if best_storm:
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #ff9ff3 0%, #f368e0 100%); color: #000000;">
                     <div class="rating-header">
                         <div>
                             <div class="driver-name">⛈️ Perfect Storm</div>
-                            <div class="team-name">{best_storm[0]}</div>
+                            <div class="team-name">{roster.teams[best_storm[0]]}</div>
                         </div>
                         <div class="rating-score">{best_storm[1]} pts</div>
                     </div>
@@ -2504,24 +2375,15 @@ with tab6:
         
         with award_col18:
             # Overachiever (best points-to-headstart ratio)
-            overachievers = []
-            for driver_info in drivers:
-                driver = driver_info['driver']
-                headstart = st.session_state.driver_headstarts.get(driver, 1)
-                points = st.session_state.total_driver_points[driver]
-                if points > 0:
-                    ratio = points / headstart
-                    overachievers.append((driver, ratio, points, headstart))
-            
-            if overachievers:
-                best_overachiever = max(overachievers, key=lambda x: x[1])
-                driver_team = next(d['team'] for d in drivers if d['driver'] == best_overachiever[0])
+            best_overachiever = season_awards["Overachiever"]
+            if best_overachiever:
+                driver_team = roster.driver_team_names[best_overachiever[0]]
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #48dbfb 0%, #0abde3 100%); color: #000000;">
                     <div class="rating-header">
                         <div>
                             <div class="driver-name">🚀 Overachiever</div>
-                            <div class="team-name">{best_overachiever[0]} ({driver_team})</div>
+                            <div class="team-name">{roster.drivers[best_overachiever[0]]} ({driver_team})</div>
                         </div>
                         <div class="rating-score">{best_overachiever[1]:.1f}</div>
                     </div>
@@ -2550,46 +2412,26 @@ with tab6:
         
         with award_col19:
             # Breakthrough Driver (first win of the season)
-            if st.session_state.race_summaries:
-                first_time_winners = []
-                seen_winners = set()
-                for summary in st.session_state.race_summaries:
-                    winner = summary["P1"].split(' (')[0]
-                    if winner not in seen_winners:
-                        first_time_winners.append(winner)
-                        seen_winners.add(winner)
-                
-                if first_time_winners:
-                    breakthrough_driver = first_time_winners[0]  # First unique winner
-                    driver_team = next(d['team'] for d in drivers if d['driver'] == breakthrough_driver)
-                    total_wins = st.session_state.driver_wins[breakthrough_driver]
-                    st.markdown(f'''
-                    <div class="rating-card" style="background: linear-gradient(135deg, #ff6348 0%, #ff3838 100%); color: #000000;">
-                        <div class="rating-header">
-                            <div>
-                                <div class="driver-name">💥 Breakthrough Driver</div>
-                                <div class="team-name">{breakthrough_driver} ({driver_team})</div>
-                            </div>
-                            <div class="rating-score">{total_wins}</div>
-                        </div>
-                        <div class="rating-details">
-                            <span>First Season Winner</span>
-                            <span>Made History</span>
+            breakthrough = season_awards["Breakthrough Driver"]
+            if breakthrough:
+                breakthrough_driver = roster.drivers[breakthrough[0]]
+                driver_team = roster.driver_team_names[breakthrough[0]]
+                total_wins = breakthrough[1]
+                st.markdown(f'''
+                <div class="rating-card" style="background: linear-gradient(135deg, #ff6348 0%, #ff3838 100%); color: #000000;">
+                    <div class="rating-header">
+                        <div>
+                            <div class="driver-name">💥 Breakthrough Driver</div>
+                            <div class="team-name">{breakthrough_driver} ({driver_team})</div>
                         </div>
+                        <div class="rating-score">{total_wins}</div>
                     </div>
-                    ''', unsafe_allow_html=True)
-                else:
-                    st.markdown(f'''
-                    <div class="rating-card" style="background: linear-gradient(135deg, #ff6348 0%, #ff3838 100%); color: #000000;">
-                        <div class="rating-header">
-                            <div>
-                                <div class="driver-name">💥 Breakthrough Driver</div>
-                                <div class="team-name">No breakthroughs yet</div>
-                            </div>
-                            <div class="rating-score">0</div>
-                        </div>
+                    <div class="rating-details">
+                        <span>First Season Winner</span>
+                        <span>Made History</span>
                     </div>
-                    ''', unsafe_allow_html=True)
+                </div>
+                ''', unsafe_allow_html=True)
             else:
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #ff6348 0%, #ff3838 100%); color: #000000;">
@@ -2605,25 +2447,14 @@ with tab6:
         
         with award_col20:
             # Team Harmony (team with most balanced driver contributions)
-            harmony_teams = []
-            for team, team_drivers in teams_drivers.items():
-                driver1, driver2 = team_drivers
-                driver1_points = st.session_state.total_driver_points[driver1]
-                driver2_points = st.session_state.total_driver_points[driver2]
-                total_points = driver1_points + driver2_points
-                
-                if total_points > 0:
-                    balance_score = min(driver1_points, driver2_points) / max(driver1_points, driver2_points) if max(driver1_points, driver2_points) > 0 else 0
-                    harmony_teams.append((team, balance_score, total_points, min(driver1_points, driver2_points)))
-            
-            if harmony_teams:
-                most_harmonious = max(harmony_teams, key=lambda x: (x[1], x[3]))
+            most_harmonious = season_awards["Team Harmony"]
+            if most_harmonious:
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #ffa726 0%, #ff9800 100%); color: #000000;">
                     <div class="rating-header">
                         <div>
                             <div class="driver-name">🎵 Team Harmony</div>
-                            <div class="team-name">{most_harmonious[0]}</div>
+                            <div class="team-name">{roster.teams[most_harmonious[0]]}</div>
                         </div>
                         <div class="rating-score">{most_harmonious[1]:.2f}</div>
                     </div>
@@ -2648,23 +2479,15 @@ with tab6:
         
         with award_col21:
             # Championship Contender (top 3 in points with multiple podiums)
-            contenders = []
-            for driver, points in sorted_driver_standings[:5]:
-                podiums = st.session_state.driver_podiums[driver]
-                wins = st.session_state.driver_wins[driver]
-                if points > 25 and podiums >= 2:
-                    championship_score = (wins * 3) + (podiums * 2) + (points * 0.1)
-                    contenders.append((driver, championship_score, points, wins, podiums))
-            
-            if contenders:
-                top_contender = max(contenders, key=lambda x: x[1])
-                driver_team = next(d['team'] for d in drivers if d['driver'] == top_contender[0])
+            top_contender = season_awards["Championship Contender"]
+            if top_contender:
+                driver_team = roster.driver_team_names[top_contender[0]]
                 st.markdown(f'''
                 <div class="rating-card" style="background: linear-gradient(135deg, #a55eea 0%, #8854d0 100%); color: #000000;">
                     <div class="rating-header">
                         <div>
                             <div class="driver-name">🏁 Championship Contender</div>
-                            <div class="team-name">{top_contender[0]} ({driver_team})</div>
+                            <div class="team-name">{roster.drivers[top_contender[0]]} ({driver_team})</div>
                         </div>
                         <div class="rating-score">{top_contender[1]:.0f}</div>
                     </div>
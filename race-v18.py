@@ -1,8 +1,14 @@
 import streamlit as st
-import random
-import time
 import pandas as pd
 import plotly.express as px
+import numpy as np
+
+from figure_spec import figure_spec
+from live_view import LIVE_VIEW_ROWS, RACE_SPEEDS, FrameScheduler, Leaderboard
+from race_engine import RaceState, new_season_seed, race_rng
+from palette import Palette
+from roster import GRID_SIZES, Roster, stress_grid
+from standings import Standings
 
 st.title("Formula 1 Racing 🏎️🏁🚥🏆")
 st.set_page_config(page_title="Formula 1", layout="wide")
@@ -67,42 +73,35 @@ team_colors = {
     "Williams": "hsl(201, 99.6%, 32.2%)"
 }
 
-# Driver colors with slight variation (±5% lightness)
-driver_colors = {}
-for team, drivers in teams_drivers.items():
-    color_parts = team_colors[team].replace('hsl(', '').replace(')', '').split(',')
-    hue = float(color_parts[0])
-    saturation = float(color_parts[1].replace('%', ''))
-    lightness = float(color_parts[2].replace('%', ''))
-    driver_colors[drivers[0]] = f"hsl({hue}, {saturation}%, {min(100, lightness + 5)}%)"
-    driver_colors[drivers[1]] = f"hsl({hue}, {saturation}%, {max(0, lightness - 5)}%)"
-
-# Flatten drivers list with team association
-drivers = []
-for team, driver_list in teams_drivers.items():
-    for driver in driver_list:
-        drivers.append({"driver": driver, "team": team})
+# Larger synthetic fields for stress-testing replace the F1 grid
+grid_size = GRID_SIZES[st.session_state.get("grid_size", next(iter(GRID_SIZES)))]
+if grid_size:
+    teams_drivers, team_colors = stress_grid(grid_size)
+
+# Driver colors (±5% lightness around the team color): each team color is
+# parsed once per grid and every variant is kept by driver ID
+if 'palette' not in st.session_state:
+    st.session_state.palette = Palette(teams_drivers, team_colors)
+palette = st.session_state.palette
+driver_colors = palette.driver_colors
+
+# Integer IDs for every driver and team; driver IDs are grid indices
+roster = Roster(teams_drivers)
+N_DRIVERS = len(roster)
+
+# Individual headstart inputs show one team at a time above this many teams
+TUNING_MAX_TEAMS = 10
 
 # Points system (1-10 only)
 points_system = {1: 25, 2: 18, 3: 15, 4: 12, 5: 10, 6: 8, 7: 6, 8: 4, 9: 2, 10: 1}
 
 # Initialize session state
-if 'progress_values' not in st.session_state:
-    st.session_state.progress_values = [0] * 20
+if 'race_state' not in st.session_state:
+    st.session_state.race_state = RaceState([0] * N_DRIVERS)
 if 'finish_order' not in st.session_state:
     st.session_state.finish_order = []
-if 'total_team_points' not in st.session_state:
-    st.session_state.total_team_points = {team: 0 for team in teams_drivers}
-if 'total_driver_points' not in st.session_state:
-    st.session_state.total_driver_points = {driver['driver']: 0 for driver in drivers}
-if 'team_wins' not in st.session_state:
-    st.session_state.team_wins = {team: 0 for team in teams_drivers}
-if 'team_podiums' not in st.session_state:
-    st.session_state.team_podiums = {team: 0 for team in teams_drivers}
-if 'driver_wins' not in st.session_state:
-    st.session_state.driver_wins = {driver['driver']: 0 for driver in drivers}
-if 'driver_podiums' not in st.session_state:
-    st.session_state.driver_podiums = {driver['driver']: 0 for driver in drivers}
+if 'standings' not in st.session_state:
+    st.session_state.standings = Standings(points_system, roster.driver_team, roster.n_teams)
 if 'race_finished' not in st.session_state:
     st.session_state.race_finished = False
 if 'races_completed' not in st.session_state:
@@ -112,34 +111,182 @@ if 'race_summaries' not in st.session_state:
 if 'race_started' not in st.session_state:
     st.session_state.race_started = False
 if 'driver_headstarts' not in st.session_state:
-    st.session_state.driver_headstarts = {driver['driver']: 1 for driver in drivers}
+    st.session_state.driver_headstarts = {driver: 1 for driver in roster.drivers}
+if 'figure_cache' not in st.session_state:
+    st.session_state.figure_cache = {}
+if 'season_seed' not in st.session_state:
+    st.session_state.season_seed = new_season_seed()
+
+# Points, wins, podiums and rankings by driver/team ID; updated in place
+standings = st.session_state.standings
+
+def reset_season():
+    # A new field invalidates every per-driver entry, so start over
+    for key in list(st.session_state):
+        if key != "grid_size":
+            del st.session_state[key]
 
-# Function to get current leaderboard
-def get_current_leaderboard():
-    finished_drivers = []
-    racing_drivers = []
+# Highlight class and medal of the podium places in the leaderboard
+PODIUM_STYLES = {1: ("position-1", "🥇 "), 2: ("position-2", "🥈 "), 3: ("position-3", "🥉 ")}
+
+def leaderboard_markdown(title, rows):
+    # The whole leaderboard as one markdown block, so a frame is a single
+    # message; rows are (position, grid index, status text)
+    items = []
+    for pos, i, status in rows:
+        position_class, medal = PODIUM_STYLES.get(pos, ("", ""))
+        items.append(
+            f'<div class="leaderboard-item {position_class}">'
+            f'<span><strong>{medal}P{pos}: {roster.drivers[i]}</strong> ({roster.driver_team_names[i]})</span>'
+            f'<span><strong>{status}</strong></span></div>'
+        )
+    return f'### {title}\n\n<div class="leaderboard">{"".join(items)}</div>'
+
+def driver_points_figure():
+    # Both drivers of every scoring team side by side
+    complete_chart_data = []
+    for team, (driver1, driver2) in zip(roster.teams, roster.team_drivers):
+        points1 = int(standings.driver_points[driver1])
+        points2 = int(standings.driver_points[driver2])
+        
+        # Only include teams where at least one driver has points
+        if points1 > 0 or points2 > 0:
+            complete_chart_data.append({
+                "Team": team,
+                "Driver": roster.drivers[driver1],
+                "Points": points1,
+                "Color": palette.base[driver1]
+            })
+            complete_chart_data.append({
+                "Team": team,
+                "Driver": roster.drivers[driver2],
+                "Points": points2,
+                "Color": palette.base[driver2]
+            })
+    
+    complete_df = pd.DataFrame(complete_chart_data)
+    
+    # Create grouped bar chart by team
+    fig = px.bar(
+        complete_df,
+        x="Team",
+        y="Points",
+        color="Driver",
+        title="Driver Points by Team",
+        labels={"Points": "Points", "Team": "Team"},
+        color_discrete_map=palette.driver_colors
+    )
+    
+    # Update layout for better visibility
+    fig.update_layout(
+        height=600,
+        width=1000,
+        xaxis_title="Team",
+        yaxis_title="Points",
+        legend_title="Driver",
+        barmode="group",
+        bargap=0.3,  # Gap between team groups
+        bargroupgap=0.1,  # Gap between bars within a group
+        font=dict(size=12),
+        title_font_size=16
+    )
     
-    for driver_info in st.session_state.finish_order:
-        finished_drivers.append({
-            'driver': driver_info['driver'],
-            'team': driver_info['team'],
-            'progress': 100,
-            'finished': True
-        })
+    # Add driver name and points labels on bars
+    for trace in fig.data:
+        driver_name = trace.name
+        custom_text = []
+        for value in trace.y:
+            if value > 0:
+                custom_text.append(f"{driver_name}<br>{int(value)}")
+            else:
+                custom_text.append("")
+        
+        trace.text = custom_text
+        trace.textposition = "outside"
+        trace.textfont = dict(size=11, color="black")
     
-    finished_driver_names = [d['driver'] for d in st.session_state.finish_order]
-    for i, driver_info in enumerate(drivers):
-        if driver_info['driver'] not in finished_driver_names:
-            racing_drivers.append({
-                'driver': driver_info['driver'],
-                'team': driver_info['team'],
-                'progress': st.session_state.progress_values[i],
-                'finished': False,
-                'index': i
+    # Update bar width
+    fig.update_traces(width=0.4)
+    return fig
+
+def constructors_pie_figure():
+    # Constructors' points share of the scoring teams
+    team_df_chart = pd.DataFrame([
+        {"Team": roster.teams[t], "Points": points}
+        for t, points in standings.ranked_teams() if points > 0
+    ])
+    fig = px.pie(
+        team_df_chart,
+        values="Points",
+        names="Team",
+        color="Team",
+        color_discrete_map=palette.team_colors
+    )
+    fig.update_traces(textposition="outside", textinfo="label+value")
+    fig.update_layout(height=600, legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5))
+    return fig
+
+def team_contributions_figure():
+    # Points of each scoring team stacked by driver
+    team_contribution_data = []
+    for t, team_points in standings.ranked_teams():
+        if team_points > 0:
+            driver1, driver2 = roster.team_drivers[t]
+            team_contribution_data.append({
+                "Team": roster.teams[t],
+                roster.drivers[driver1]: standings.driver_points[driver1],
+                roster.drivers[driver2]: standings.driver_points[driver2],
+                "Total": team_points
             })
     
-    racing_drivers.sort(key=lambda x: x['progress'], reverse=True)
-    return finished_drivers + racing_drivers
+    contrib_df = pd.DataFrame(team_contribution_data)
+    
+    # Create stacked bar chart
+    fig_bar = px.bar(
+        contrib_df,
+        x="Team",
+        y=[col for col in contrib_df.columns if col not in ["Team", "Total"]],
+        title="Points Contribution by Team Members",
+        labels={"value": "Points", "variable": "Driver"},
+        text_auto=True
+    )
+    
+    # Update colors and add driver name labels
+    for i, trace in enumerate(fig_bar.data):
+        driver_name = trace.name
+        trace.marker.color = driver_colors[driver_name]
+        
+        # Create custom text labels showing driver name and points
+        custom_text = []
+        for j, value in enumerate(trace.y):
+            if value > 0:  # Only show label if driver has points
+                custom_text.append(f"{driver_name}<br>{value}")
+            else:
+                custom_text.append("")
+        
+        trace.text = custom_text
+        trace.textposition = "inside"
+        trace.textfont = dict(size=10, color="white")
+    
+    fig_bar.update_layout(
+        height=500,
+        xaxis_title="Team",
+        yaxis_title="Points",
+        legend_title="Driver",
+        barmode="stack",
+        showlegend=True
+    )
+    return fig_bar
+
+def cached_figure(name, build):
+    # Chart figures only change when a race is committed, so each one is
+    # kept, already serialised, with the standings version (races applied)
+    # it was built from
+    cached = st.session_state.figure_cache.get(name)
+    if cached is None or cached[0] != standings.n_races:
+        cached = (standings.n_races, figure_spec(build()))
+        st.session_state.figure_cache[name] = cached
+    return cached[1]
 
 # Create tabs
 tab1, tab2, tab3, tab4, tab5 = st.tabs([
@@ -156,17 +303,60 @@ with tab1:
     
     with col1:
         if st.button("🏁 Start Race"):
-            # Initialize progress with individual driver headstarts
-            st.session_state.progress_values = [0] * 20
-            for i, driver_info in enumerate(drivers):
-                driver = driver_info['driver']
-                headstart = st.session_state.driver_headstarts.get(driver, 1)
-                st.session_state.progress_values[i] = min(100, headstart)
+            # Initialize progress with individual driver headstarts; the race
+            # state holds progress, the finished mask and finish ticks as arrays
+            st.session_state.race_state = RaceState(
+                [st.session_state.driver_headstarts.get(driver, 1) for driver in roster.drivers]
+            )
             st.session_state.finish_order = []
             st.session_state.race_finished = False
             st.session_state.race_started = True
+            # Each race draws from its own stream of the season seed, so it can be
+            # replayed on its own with race_engine.replay_race()
+            st.session_state.race_rng = race_rng(st.session_state.season_seed, st.session_state.races_completed + 1)
             st.rerun()
 
+        with st.expander("🎲 Season Seed"):
+            season_seed = st.number_input(
+                "Season seed",
+                min_value=0,
+                max_value=2**32 - 1,
+                value=st.session_state.season_seed,
+                step=1,
+                key="season_seed_input"
+            )
+            st.session_state.season_seed = int(season_seed)
+            st.caption(f"Race {st.session_state.races_completed + 1} will run on stream (seed {st.session_state.season_seed}, race {st.session_state.races_completed + 1}).")
+
+        with st.expander("🏟️ Grid"):
+            st.selectbox(
+                "Field size",
+                list(GRID_SIZES),
+                key="grid_size",
+                on_change=reset_season,
+                help="Larger synthetic fields for stress-testing; changing the field starts a new season"
+            )
+            st.caption(f"{N_DRIVERS:,} drivers in {len(teams_drivers):,} teams")
+
+        speed_col, fps_col = st.columns(2)
+        with speed_col:
+            st.radio(
+                "Simulation speed",
+                list(RACE_SPEEDS),
+                horizontal=True,
+                key="race_speed",
+                help="Ticks per second of the animated race (1× is one tick per second)"
+            )
+        with fps_col:
+            st.slider(
+                "Max render FPS",
+                min_value=1,
+                max_value=30,
+                value=5,
+                key="max_fps",
+                help="Frames are skipped when ticks arrive faster than this"
+            )
+
         # Display initial headstarts before race simulation
         if st.session_state.race_started and not st.session_state.race_finished:
             # st.markdown("### Initial Headstarts")
@@ -177,171 +367,93 @@ with tab1:
             # st.dataframe(pd.DataFrame(headstart_display), use_container_width=True, hide_index=True)
             # st.markdown("---")
 
-            cols = [st.columns([1, 3]) for _ in range(20)]
+            # Bars for the first LIVE_VIEW_ROWS grid slots; the leaderboard
+            # covers the leading LIVE_VIEW_ROWS drivers of larger fields
+            live_rows = min(N_DRIVERS, LIVE_VIEW_ROWS)
+            race_state = st.session_state.race_state
+            cols = [st.columns([1, 3]) for _ in range(live_rows)]
             progress_bars = []
-            for i in range(20):
+            for i in range(live_rows):
                 with cols[i][0]:
-                    st.write(f"**{drivers[i]['driver']} ({drivers[i]['team']})**")
+                    st.write(f"**{roster.drivers[i]} ({roster.driver_team_names[i]})**")
                 with cols[i][1]:
-                    progress_bars.append(st.progress(st.session_state.progress_values[i] / 100))
+                    progress_bars.append(st.progress(race_state.progress[i] / 100))
+            if N_DRIVERS > LIVE_VIEW_ROWS:
+                st.caption(f"Showing {LIVE_VIEW_ROWS} of {N_DRIVERS:,} drivers")
 
             leaderboard_placeholder = col2.empty()
             
-            current_leaderboard = get_current_leaderboard()
-            with leaderboard_placeholder.container():
-                st.markdown("### 🏁 Live Leaderboard")
-                st.markdown('<div class="leaderboard">', unsafe_allow_html=True)
-                
-                for pos, driver_info in enumerate(current_leaderboard, 1):
-                    progress = driver_info['progress']
-                    driver = driver_info['driver']
-                    team = driver_info['team']
-                    is_finished = driver_info.get('finished', False)
-                    
-                    position_class = ""
-                    medal = ""
-                    if pos == 1:
-                        position_class = "position-1"
-                        medal = "🥇 "
-                    elif pos == 2:
-                        position_class = "position-2"
-                        medal = "🥈 "
-                    elif pos == 3:
-                        position_class = "position-3"
-                        medal = "🥉 "
-                    
-                    if is_finished:
-                        progress_display = "FINISHED"
-                        if st.session_state.race_finished:
-                            points = points_system.get(pos, 0)
-                            if pos <= 10:
-                                progress_display = f"FINISHED ({points} pts)"
-                    else:
-                        progress_display = f"{progress:.1f}%"
-                    
-                    st.markdown(f'''
-                    <div class="leaderboard-item {position_class}">
-                        <span><strong>{medal}P{pos}: {driver}</strong> ({team})</span>
-                        <span><strong>{progress_display}</strong></span>
-                    </div>
-                    ''', unsafe_allow_html=True)
-                
-                st.markdown('</div>', unsafe_allow_html=True)
+            # Running order as grid indices, maintained from tick to tick
+            leaderboard = Leaderboard(N_DRIVERS)
+            leaderboard.update(race_state.progress)
+            # Last values sent: a frame only re-sends bars that moved and
+            # the leaderboard block when its text changed
+            bar_values = race_state.progress[:live_rows].copy()
+            board = leaderboard_markdown("🏁 Live Leaderboard", (
+                (pos, i, "FINISHED" if is_finished else f"{int(race_state.progress[i]):.1f}%")
+                for pos, i, is_finished in leaderboard.rows(LIVE_VIEW_ROWS)
+            ))
+            leaderboard_placeholder.markdown(board, unsafe_allow_html=True)
 
-            # Brief pause to show initial headstarts
-            time.sleep(1)
+            # Simulation ticks run at the chosen speed; frames are drawn at most
+            # max_fps times per second and skipped while rendering falls behind
+            scheduler = FrameScheduler(
+                speed=RACE_SPEEDS[st.session_state.race_speed],
+                max_fps=st.session_state.max_fps
+            )
 
             while (st.session_state.race_started and 
-                   any(value < 100 for value in st.session_state.progress_values) and 
+                   not race_state.done and 
                    not st.session_state.race_finished):
                 
-                for i in range(20):
-                    if st.session_state.progress_values[i] < 100:
-                        increment = random.randint(0, 4)
-                        st.session_state.progress_values[i] = min(100, st.session_state.progress_values[i] + increment)
-                        if st.session_state.progress_values[i] == 100 and drivers[i]['driver'] not in [d['driver'] for d in st.session_state.finish_order]:
-                            st.session_state.finish_order.append(drivers[i])
-                        progress_bars[i].progress(st.session_state.progress_values[i] / 100)
-                
-                    current_leaderboard = get_current_leaderboard()
-                    with leaderboard_placeholder.container():
-                        st.markdown("### 🏁 Live Leaderboard")
-                        st.markdown('<div class="leaderboard">', unsafe_allow_html=True)
-                        
-                        for pos, driver_info in enumerate(current_leaderboard, 1):
-                            progress = driver_info['progress']
-                            driver = driver_info['driver']
-                            team = driver_info['team']
-                            is_finished = driver_info.get('finished', False)
-                            
-                            position_class = ""
-                            medal = ""
-                            if pos == 1:
-                                position_class = "position-1"
-                                medal = "🥇 "
-                            elif pos == 2:
-                                position_class = "position-2"
-                                medal = "🥈 "
-                            elif pos == 3:
-                                position_class = "position-3"
-                                medal = "🥉 "
-                            
-                            if is_finished:
-                                progress_display = "🏁 FINISHED"
-                            else:
-                                progress_display = f"{progress:.1f}%"
-                            
-                            st.markdown(f'''
-                            <div class="leaderboard-item {position_class}">
-                                <span><strong>{medal}P{pos}: {driver}</strong> ({team})</span>
-                                <span><strong>{progress_display}</strong></span>
-                            </div>
-                            ''', unsafe_allow_html=True)
-                        
-                        st.markdown('</div>', unsafe_allow_html=True)
+                for _ in range(scheduler.ticks_due()):
+                    # One vectorized step; crossed is the mask of drivers that
+                    # reached the line on this tick, already in grid order
+                    crossed = race_state.step(st.session_state.race_rng)
+                    leaderboard.finish(np.flatnonzero(crossed))
+                    scheduler.tick_done()
+                    if race_state.done:
+                        break
                 
-                if len(st.session_state.finish_order) == 20:
+                if race_state.done:
+                    # Driver IDs in finishing order
+                    st.session_state.finish_order = race_state.finish_order().tolist()
                     st.session_state.race_finished = True
                     st.session_state.races_completed += 1
                     st.session_state.race_started = False
                     
-                    current_leaderboard = get_current_leaderboard()
-                    with leaderboard_placeholder.container():
-                        st.markdown("### 🏁 Leaderboard")
-                        st.markdown('<div class="leaderboard">', unsafe_allow_html=True)
-                        
-                        for pos, driver_info in enumerate(current_leaderboard, 1):
-                            driver = driver_info['driver']
-                            team = driver_info['team']
-                            points = points_system.get(pos, 0)
-                            
-                            position_class = ""
-                            medal = ""
-                            if pos == 1:
-                                position_class = "position-1"
-                                medal = "🥇 "
-                            elif pos == 2:
-                                position_class = "position-2"
-                                medal = "🥈 "
-                            elif pos == 3:
-                                position_class = "position-3"
-                                medal = "🥉 "
-                            
-                            if pos <= 10:
-                                progress_display = f"{points} pts"
-                            else:
-                                progress_display = "0 pts"
-                            
-                            st.markdown(f'''
-                            <div class="leaderboard-item {position_class}">
-                                <span><strong>{medal}P{pos}: {driver}</strong> ({team})</span>
-                                <span><strong>{progress_display}</strong></span>
-                            </div>
-                            ''', unsafe_allow_html=True)
-                        
-                        st.markdown('</div>', unsafe_allow_html=True)
+                    for i in np.flatnonzero(race_state.progress[:live_rows] != bar_values).tolist():
+                        progress_bars[i].progress(race_state.progress[i] / 100)
+                    leaderboard_placeholder.markdown(leaderboard_markdown("🏁 Leaderboard", (
+                        (pos, i, f"{standings.points_for(pos)} pts" if pos <= 10 else "0 pts")
+                        for pos, i, _ in leaderboard.rows(LIVE_VIEW_ROWS)
+                    )), unsafe_allow_html=True)
                     
-                    for position, driver_info in enumerate(st.session_state.finish_order, 1):
-                        if position <= 10:
-                            points = points_system.get(position, 0)
-                            st.session_state.total_driver_points[driver_info['driver']] += points
-                            st.session_state.total_team_points[driver_info['team']] += points
-                        if position == 1:
-                            st.session_state.driver_wins[driver_info['driver']] += 1
-                            st.session_state.team_wins[driver_info['team']] += 1
-                        if position <= 3:
-                            st.session_state.driver_podiums[driver_info['driver']] += 1
-                            st.session_state.team_podiums[driver_info['team']] += 1
+                    standings.apply(st.session_state.finish_order)
                     if len(st.session_state.finish_order) >= 3:
-                        race_summary = {
-                            "Race": st.session_state.races_completed,
-                            "P1": f"{st.session_state.finish_order[0]['driver']} ({st.session_state.finish_order[0]['team']})",
-                            "P2": f"{st.session_state.finish_order[1]['driver']} ({st.session_state.finish_order[1]['team']})",
-                            "P3": f"{st.session_state.finish_order[2]['driver']} ({st.session_state.finish_order[2]['team']})"
-                        }
-                        st.session_state.race_summaries.append(race_summary)
+                        st.session_state.race_summaries.append(
+                            roster.summary(st.session_state.races_completed, st.session_state.finish_order))
                     break
-                time.sleep(1)
+                
+                if scheduler.frame_due():
+                    # Collect the frame first (bars that moved, the new
+                    # leaderboard text), then send it
+                    leaderboard.update(race_state.progress)
+                    moved = np.flatnonzero(race_state.progress[:live_rows] != bar_values)
+                    bar_values[moved] = race_state.progress[moved]
+                    frame_board = leaderboard_markdown("🏁 Live Leaderboard", (
+                        (pos, i, "🏁 FINISHED" if is_finished else f"{int(race_state.progress[i]):.1f}%")
+                        for pos, i, is_finished in leaderboard.rows(LIVE_VIEW_ROWS)
+                    ))
+                    
+                    for i in moved.tolist():
+                        progress_bars[i].progress(bar_values[i] / 100)
+                    if frame_board != board:
+                        board = frame_board
+                        leaderboard_placeholder.markdown(board, unsafe_allow_html=True)
+                    scheduler.frame_rendered()
+                
+                scheduler.wait()
 
     with col2:
         if not st.session_state.race_started and not st.session_state.race_finished:
@@ -351,10 +463,10 @@ with tab1:
     if st.session_state.race_finished:
         st.markdown("---")
         st.subheader("🏆 Podium")
-        for position, driver_info in enumerate(st.session_state.finish_order, 1):
-            points = points_system.get(position, 0)
-            driver = driver_info['driver']
-            team = driver_info['team']
+        for position, d in enumerate(st.session_state.finish_order, 1):
+            points = standings.points_for(position)
+            driver = roster.drivers[d]
+            team = roster.driver_team_names[d]
             if position == 1:
                 st.write(f"🥇 **P1: {driver} ({team})** - {points} points")
             elif position == 2:
@@ -373,10 +485,10 @@ with tab1:
         race_summary_data = []
         for summary in st.session_state.race_summaries:
             race_summary_data.append({
-                "Race": summary["Race"],
-                "P1": summary["P1"],
-                "P2": summary["P2"],
-                "P3": summary["P3"]
+                "Race": summary.race,
+                "P1": roster.label(summary.drivers[0]),
+                "P2": roster.label(summary.drivers[1]),
+                "P3": roster.label(summary.drivers[2])
             })
         if race_summary_data:
             race_summary_df = pd.DataFrame(race_summary_data)
@@ -389,10 +501,10 @@ with tab2:
     st.subheader("🏆 Drivers' Championship Standings")
     st.write(f"**Races Completed: {st.session_state.races_completed}**")
     st.markdown("")
-    sorted_driver_standings = sorted(st.session_state.total_driver_points.items(), key=lambda x: x[1], reverse=True)
+    sorted_driver_standings = [(roster.drivers[d], points) for d, points in standings.ranked_drivers()]
     st.write("**Top 3 Drivers**")
     for pos, (driver, points) in enumerate(sorted_driver_standings[:3], 1):
-        team = next(d['team'] for d in drivers if d['driver'] == driver)
+        team = roster.team_of(driver)
         if pos == 1:
             st.write(f"🥇 **P1: {driver} ({team})** - {points} points")
         elif pos == 2:
@@ -402,105 +514,14 @@ with tab2:
     st.markdown("")
     driver_standings_data = []
     for pos, (driver, points) in enumerate(sorted_driver_standings, 1):
-        team = next(d['team'] for d in drivers if d['driver'] == driver)
+        team = roster.team_of(driver)
         driver_standings_data.append({"Position": pos, "Driver": driver, "Team": team, "Total Points": points})
     driver_df = pd.DataFrame(driver_standings_data)
     st.dataframe(driver_df, use_container_width=True, hide_index=True)
 
     st.markdown("### Drivers' Points Distribution")
-    driver_chart_data = []
-    for driver, points in sorted_driver_standings:
-        if points > 0:
-            team = next(d['team'] for d in drivers if d['driver'] == driver)
-            driver_chart_data.append({
-                "Driver": driver,
-                "Team": team,
-                "Points": points,
-                "Color": driver_colors[driver]
-            })
-    
-    if driver_chart_data:
-        driver_df_chart = pd.DataFrame(driver_chart_data)
-        
-        # Ensure all teams have both drivers (fill missing with 0 points)
-        complete_chart_data = []
-        for team in teams_drivers.keys():
-            driver1, driver2 = teams_drivers[team]
-            
-            # Get points for driver1
-            driver1_data = driver_df_chart[driver_df_chart['Driver'] == driver1]
-            if not driver1_data.empty:
-                points1 = driver1_data.iloc[0]['Points']
-            else:
-                points1 = 0
-                
-            # Get points for driver2
-            driver2_data = driver_df_chart[driver_df_chart['Driver'] == driver2]
-            if not driver2_data.empty:
-                points2 = driver2_data.iloc[0]['Points']
-            else:
-                points2 = 0
-            
-            # Only include teams where at least one driver has points
-            if points1 > 0 or points2 > 0:
-                complete_chart_data.append({
-                    "Team": team,
-                    "Driver": driver1,
-                    "Points": points1,
-                    "Color": driver_colors[driver1]
-                })
-                complete_chart_data.append({
-                    "Team": team,
-                    "Driver": driver2,
-                    "Points": points2,
-                    "Color": driver_colors[driver2]
-                })
-        
-        complete_df = pd.DataFrame(complete_chart_data)
-        
-        # Create grouped bar chart by team
-        fig = px.bar(
-            complete_df,
-            x="Team",
-            y="Points",
-            color="Driver",
-            title="Driver Points by Team",
-            labels={"Points": "Points", "Team": "Team"},
-            color_discrete_map={row["Driver"]: row["Color"] for _, row in complete_df.iterrows()}
-        )
-        
-        # Update layout for better visibility
-        fig.update_layout(
-            height=600,
-            width=1000,
-            xaxis_title="Team",
-            yaxis_title="Points",
-            legend_title="Driver",
-            barmode="group",
-            bargap=0.3,  # Gap between team groups
-            bargroupgap=0.1,  # Gap between bars within a group
-            font=dict(size=12),
-            title_font_size=16
-        )
-        
-        # Add driver name and points labels on bars
-        for trace in fig.data:
-            driver_name = trace.name
-            custom_text = []
-            for value in trace.y:
-                if value > 0:
-                    custom_text.append(f"{driver_name}<br>{int(value)}")
-                else:
-                    custom_text.append("")
-            
-            trace.text = custom_text
-            trace.textposition = "outside"
-            trace.textfont = dict(size=11, color="black")
-        
-        # Update bar width
-        fig.update_traces(width=0.4)
-        
-        st.plotly_chart(fig, use_container_width=True)
+    if standings.driver_points.any():
+        st.plotly_chart(cached_figure("driver_points_by_team", driver_points_figure), use_container_width=True)
     else:
         st.write("No points data available yet. Please complete a race in the 'Race & Results' tab.")
 
@@ -509,7 +530,7 @@ with tab3:
     st.subheader("🏆 Constructors' Championship Standings")
     st.write(f"**Races Completed: {st.session_state.races_completed}**")
     st.markdown("")
-    sorted_team_standings = sorted(st.session_state.total_team_points.items(), key=lambda x: x[1], reverse=True)
+    sorted_team_standings = [(roster.teams[t], points) for t, points in standings.ranked_teams()]
     st.write("**Top 3 Constructors**")
     for pos, (team, points) in enumerate(sorted_team_standings[:3], 1):
         if pos == 1:
@@ -526,83 +547,11 @@ with tab3:
     st.dataframe(team_df, use_container_width=True, hide_index=True)
 
     st.markdown("### Constructors' Points Distribution")
-    team_chart_data = [
-        {"value": points, "name": team, "itemStyle": {"color": team_colors[team]}}
-        for team, points in sorted_team_standings if points > 0
-    ]
-    if team_chart_data:
-        team_df_chart = pd.DataFrame([
-            {"Team": item["name"], "Points": item["value"], "Color": item["itemStyle"]["color"]}
-            for item in team_chart_data
-        ])
-        fig = px.pie(
-            team_df_chart,
-            values="Points",
-            names="Team",
-            color="Team",
-            color_discrete_map={row["Team"]: row["Color"] for _, row in team_df_chart.iterrows()}
-        )
-        fig.update_traces(textposition="outside", textinfo="label+value")
-        fig.update_layout(height=600, legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5))
-        st.plotly_chart(fig, use_container_width=True)
+    if standings.team_points.any():
+        st.plotly_chart(cached_figure("constructors_pie", constructors_pie_figure), use_container_width=True)
         
         st.markdown("### Team Member Contributions")
-        # Create stacked bar chart data
-        team_contribution_data = []
-        for team, team_points in sorted_team_standings:
-            if team_points > 0:
-                driver1, driver2 = teams_drivers[team]
-                driver1_points = st.session_state.total_driver_points[driver1]
-                driver2_points = st.session_state.total_driver_points[driver2]
-                
-                team_contribution_data.append({
-                    "Team": team,
-                    driver1: driver1_points,
-                    driver2: driver2_points,
-                    "Total": team_points
-                })
-        
-        if team_contribution_data:
-            contrib_df = pd.DataFrame(team_contribution_data)
-            
-            # Create stacked bar chart
-            fig_bar = px.bar(
-                contrib_df,
-                x="Team",
-                y=[col for col in contrib_df.columns if col not in ["Team", "Total"]],
-                title="Points Contribution by Team Members",
-                labels={"value": "Points", "variable": "Driver"},
-                text_auto=True
-            )
-            
-            # Update colors and add driver name labels
-            for i, trace in enumerate(fig_bar.data):
-                driver_name = trace.name
-                trace.marker.color = driver_colors[driver_name]
-                
-                # Create custom text labels showing driver name and points
-                custom_text = []
-                for j, value in enumerate(trace.y):
-                    if value > 0:  # Only show label if driver has points
-                        custom_text.append(f"{driver_name}<br>{value}")
-                    else:
-                        custom_text.append("")
-                
-                trace.text = custom_text
-                trace.textposition = "inside"
-                trace.textfont = dict(size=10, color="white")
-            
-            fig_bar.update_layout(
-                height=500,
-                xaxis_title="Team",
-                yaxis_title="Points",
-                legend_title="Driver",
-                barmode="stack",
-                showlegend=True
-            )
-            st.plotly_chart(fig_bar, use_container_width=True)
-        else:
-            st.write("No team contribution data available yet.")
+        st.plotly_chart(cached_figure("team_contributions", team_contributions_figure), use_container_width=True)
     else:
         st.write("No points data available yet. Please complete a race in the 'Race & Results' tab.")
 
@@ -611,33 +560,27 @@ with tab4:
     st.subheader("🏆 Constructor Statistics")
     st.write(f"**Races Completed: {st.session_state.races_completed}**")
     st.markdown("")
-    constructor_stats_data = []
-    sorted_team_stats = sorted(
-        st.session_state.team_wins.items(),
-        key=lambda x: (st.session_state.team_wins[x[0]], st.session_state.team_podiums[x[0]]),
-        reverse=True
-    )
-    for pos, (team, wins) in enumerate(sorted_team_stats, 1):
-        podiums = st.session_state.team_podiums[team]
-        constructor_stats_data.append({"Position": pos, "Team": team, "Wins": wins, "Podiums": podiums})
-    constructor_stats_df = pd.DataFrame(constructor_stats_data)
+    ranking = standings.team_wins_ranking
+    constructor_stats_df = pd.DataFrame({
+        "Position": np.arange(1, len(ranking) + 1),
+        "Team": np.array(roster.teams)[ranking],
+        "Wins": standings.team_wins[ranking],
+        "Podiums": standings.team_podiums[ranking]
+    })
     st.dataframe(constructor_stats_df, use_container_width=True, hide_index=True)
 
     st.markdown("---")
     st.subheader("🏆 Driver Statistics")
     st.write(f"**Races Completed: {st.session_state.races_completed}**")
     st.markdown("")
-    driver_stats_data = []
-    sorted_driver_stats = sorted(
-        st.session_state.driver_wins.items(),
-        key=lambda x: (st.session_state.driver_wins[x[0]], st.session_state.driver_podiums[x[0]]),
-        reverse=True
-    )
-    for pos, (driver, wins) in enumerate(sorted_driver_stats, 1):
-        team = next(d['team'] for d in drivers if d['driver'] == driver)
-        podiums = st.session_state.driver_podiums[driver]
-        driver_stats_data.append({"Position": pos, "Driver": driver, "Team": team, "Wins": wins, "Podiums": podiums})
-    driver_stats_df = pd.DataFrame(driver_stats_data)
+    ranking = standings.driver_wins_ranking
+    driver_stats_df = pd.DataFrame({
+        "Position": np.arange(1, len(ranking) + 1),
+        "Driver": np.array(roster.drivers)[ranking],
+        "Team": np.array(roster.driver_team_names)[ranking],
+        "Wins": standings.driver_wins[ranking],
+        "Podiums": standings.driver_podiums[ranking]
+    })
     st.dataframe(driver_stats_df, use_container_width=True, hide_index=True)
 
 # Tab 5: Driver Upgrades
@@ -646,10 +589,14 @@ with tab5:
     st.markdown("Set a headstart percentage (1-9%) for each driver at the start of a race.")
     st.markdown("")
     
-    headstart_data = []
-    for driver_info in drivers:
-        driver = driver_info['driver']
-        team = driver_info['team']
+    tuned_drivers = range(N_DRIVERS)
+    if roster.n_teams > TUNING_MAX_TEAMS:
+        tuned_team = st.selectbox("Team", roster.teams, key="tuning_team")
+        tuned_drivers = roster.team_drivers[roster.team_ids[tuned_team]]
+    
+    for d in tuned_drivers:
+        driver = roster.drivers[d]
+        team = roster.driver_team_names[d]
         st.write(f"**{driver} ({team})**")
         headstart = st.number_input(
             f"Headstart for {driver}",
@@ -660,9 +607,12 @@ with tab5:
             key=f"headstart_{driver}"
         )
         st.session_state.driver_headstarts[driver] = headstart
-        headstart_data.append({"Driver": driver, "Team": team, "Headstart (%)": headstart})
     
     st.markdown("---")
     st.subheader("Current Headstart Settings")
-    headstart_df = pd.DataFrame(headstart_data)
+    headstart_df = pd.DataFrame({
+        "Driver": roster.drivers,
+        "Team": roster.driver_team_names,
+        "Headstart (%)": [st.session_state.driver_headstarts.get(driver, 1) for driver in roster.drivers]
+    })
     st.dataframe(headstart_df, use_container_width=True, hide_index=True)
@@ -0,0 +1,318 @@
+# Headless race engine: the same tick rules as the Tab 1 loop in race-v17.py /
+# race-v18.py, but with the whole grid held as NumPy arrays and no Streamlit.
+#
+# Tick rules (unchanged from the UI loop):
+#   * every driver starts at min(100, headstart)
+#   * each tick every unfinished driver gains a uniform integer in [0, 4]
+#   * progress is capped at 100; reaching 100 finishes the driver
+#   * drivers finishing on the same tick are ordered by grid index
+from functools import lru_cache
+
+import numpy as np
+
+FINISH_LINE = 100
+MAX_INCREMENT = 4
+
+# Seeded streams. Every random stream is a child of the season's SeedSequence
+# addressed by a spawn key, e.g. (RACE_STREAM, race_number) for races.
+# Children are independent of each other, so any race can be regenerated on
+# its own, in any order and on any worker, with bit-identical results.
+RACE_STREAM = 0
+PRESET_STREAM = 1
+TITLE_ODDS_STREAM = 2
+OUTCOME_STREAM = 3
+
+
+def new_season_seed():
+    return int(np.random.SeedSequence().generate_state(1)[0])
+
+
+def stream_rng(season_seed, *key):
+    return np.random.default_rng(np.random.SeedSequence(season_seed, spawn_key=key))
+
+
+def race_rng(season_seed, race_number):
+    return stream_rng(season_seed, RACE_STREAM, race_number)
+
+
+def tick_increments(rng, shape):
+    # The per-tick draw shared by the engine and the live race loop; both
+    # must consume the stream identically for replays to match.
+    return rng.integers(0, MAX_INCREMENT + 1, size=shape, dtype=np.int16)
+
+
+class RaceState:
+    # progress / finished / finish_tick have shape (n_drivers,) for a single
+    # race or (n_races, n_drivers) when races are simulated side by side.
+    __slots__ = ("progress", "finished", "finish_tick", "tick")
+
+    def __init__(self, headstarts):
+        headstarts = np.asarray(headstarts)
+        self.progress = np.minimum(FINISH_LINE, headstarts).astype(np.int16)
+        self.finished = self.progress >= FINISH_LINE
+        self.finish_tick = np.where(self.finished, 0, -1).astype(np.int32)
+        self.tick = 0
+
+    @property
+    def n_drivers(self):
+        return self.progress.shape[-1]
+
+    @property
+    def done(self):
+        return bool(self.finished.all())
+
+    def step(self, rng):
+        # One tick for the whole grid; returns the mask of drivers that
+        # crossed the line on this tick.
+        self.tick += 1
+        increments = tick_increments(rng, self.progress.shape)
+        racing = ~self.finished
+        self.progress = np.where(racing, np.minimum(FINISH_LINE, self.progress + increments), self.progress)
+        newly_finished = racing & (self.progress >= FINISH_LINE)
+        self.finish_tick[newly_finished] = self.tick
+        self.finished |= newly_finished
+        return newly_finished
+
+    def finish_order(self):
+        # Finished drivers sorted by (finish tick, grid index).
+        if self.progress.ndim == 1:
+            finished_idx = np.flatnonzero(self.finished)
+            return finished_idx[np.argsort(self.finish_tick[finished_idx], kind="stable")]
+        return np.argsort(self.finish_tick, axis=-1, kind="stable")
+
+
+def run_race(headstarts, rng=None, max_ticks=10_000):
+    # Run a single race to completion and return the finish order as grid indices.
+    rng = np.random.default_rng() if rng is None else rng
+    state = RaceState(headstarts)
+    while not state.done and state.tick < max_ticks:
+        state.step(rng)
+    return state.finish_order()
+
+
+def run_races(headstarts, n_races, rng=None, max_ticks=10_000):
+    # Run n_races independent races in lockstep. Returns an
+    # (n_races, n_drivers) matrix of finish orders (grid indices).
+    rng = np.random.default_rng() if rng is None else rng
+    headstarts = np.broadcast_to(np.asarray(headstarts), (n_races, np.shape(headstarts)[-1]))
+    state = RaceState(headstarts)
+    while not state.done and state.tick < max_ticks:
+        state.step(rng)
+    return state.finish_order()
+
+
+def replay_race(headstarts, season_seed, race_number, instant=False):
+    # Regenerate a single race of a seeded season without replaying the others.
+    # Instant and tick-by-tick races consume the stream differently, so a race
+    # must be replayed in the mode it was run in.
+    rng = race_rng(season_seed, race_number)
+    return instant_race(headstarts, rng) if instant else run_race(headstarts, rng)
+
+
+def run_season(headstarts, season_seed, race_numbers, instant=False):
+    # Finish orders for the given races of a seeded season, one row per race.
+    return np.stack([replay_race(headstarts, season_seed, race_number, instant) for race_number in race_numbers])
+
+
+# Finish-tick distributions. A driver's progress is a sum of independent
+# uniform [0, 4] steps, so the tick on which they reach 100 depends only on
+# their headstart and can be computed by repeated convolution. Sampling
+# finish ticks from these tables gives races with exactly the same
+# distribution as stepping the tick loop, at the cost of one draw per driver.
+PMF_TOLERANCE = 1e-12
+
+
+@lru_cache(maxsize=None)
+def finish_tick_pmf(headstart):
+    # P(finish tick == t) for t = 0, 1, 2, ...; the (tiny) mass left after
+    # PMF_TOLERANCE is folded into the last tick so the table sums to 1.
+    start = min(FINISH_LINE, int(headstart))
+    step = np.full(MAX_INCREMENT + 1, 1.0 / (MAX_INCREMENT + 1))
+    racing = np.zeros(FINISH_LINE)
+    pmf = [0.0]
+    if start >= FINISH_LINE:
+        pmf[0] = 1.0
+    else:
+        racing[start] = 1.0
+    while racing.sum() > PMF_TOLERANCE:
+        moved = np.convolve(racing, step)
+        pmf.append(moved[FINISH_LINE:].sum())
+        racing = moved[:FINISH_LINE]
+    pmf[-1] += racing.sum()
+    pmf = np.asarray(pmf)
+    pmf.flags.writeable = False
+    return pmf
+
+
+@lru_cache(maxsize=None)
+def finish_tick_cdf(headstart):
+    cdf = np.cumsum(finish_tick_pmf(headstart))
+    cdf[-1] = 1.0
+    cdf.flags.writeable = False
+    return cdf
+
+
+# Inverse-CDF lookup on 32-bit uniform draws: the top 16 bits pick a bucket.
+# Buckets that lie entirely inside one tick resolve with a single table read;
+# the few buckets straddling a CDF step (marked -1) fall back to searchsorted.
+UNIFORM_BITS = 32
+BUCKET_BITS = 16
+
+
+def _uniform_draws(rng, shape):
+    # Same values as rng.integers(0, 1 << 32, size=shape, dtype=np.uint32).
+    # 64-bit bit generators hand out 32-bit draws as the low then the high
+    # half of each raw output, so with no half-output pending the raw stream
+    # can be read directly, skipping the per-value bounded-integer path.
+    size = int(np.prod(shape))
+    bit_generator = rng.bit_generator
+    if np.little_endian and size % 2 == 0 and bit_generator.state.get("has_uint32") == 0:
+        return bit_generator.random_raw(size // 2).view(np.uint32).reshape(shape)
+    return rng.integers(0, 1 << UNIFORM_BITS, size=shape, dtype=np.uint32)
+
+
+@lru_cache(maxsize=None)
+def _bucket_ticks(headstart):
+    cdf = finish_tick_cdf(headstart)
+    edges = np.arange((1 << BUCKET_BITS) + 1) / (1 << BUCKET_BITS)
+    ticks = np.minimum(np.searchsorted(cdf, edges, side="right"), len(cdf) - 1).astype(np.int16)
+    table = np.where(ticks[:-1] == ticks[1:], ticks[:-1], -1).astype(np.int16)
+    table.flags.writeable = False
+    return table
+
+
+def sample_finish_ticks(headstarts, size=(), rng=None):
+    # Draw finish ticks for every driver; the result has shape size + (n_drivers,).
+    rng = np.random.default_rng() if rng is None else rng
+    headstarts = np.asarray(headstarts)
+    shape = (size,) if np.isscalar(size) else tuple(size)
+    values, column_ids = np.unique(headstarts, return_inverse=True)
+    table = np.concatenate([_bucket_ticks(int(value)) for value in values])
+
+    draws = _uniform_draws(rng, shape + headstarts.shape)
+    # Table indices as intp, so take() does not convert them again
+    lookup = np.right_shift(draws, UNIFORM_BITS - BUCKET_BITS, dtype=np.intp)
+    lookup += (column_ids.reshape(headstarts.shape) << BUCKET_BITS).astype(np.intp)
+    ticks = table.take(lookup)
+    straddling = np.flatnonzero(ticks < 0)
+    if straddling.size:
+        flat_ticks = ticks.reshape(-1)
+        u = draws.reshape(-1)[straddling] / float(1 << UNIFORM_BITS)
+        value_ids = (lookup.reshape(-1)[straddling] >> BUCKET_BITS).astype(np.intp)
+        for value_id, value in enumerate(values):
+            hits = value_ids == value_id
+            cdf = finish_tick_cdf(int(value))
+            flat_ticks[straddling[hits]] = np.minimum(
+                np.searchsorted(cdf, u[hits], side="right"), len(cdf) - 1)
+    return ticks
+
+
+def finish_order_from_ticks(ticks):
+    # Order by (finish tick, grid index), exactly as the tick loop does.
+    # Packing both into one integer key lets a plain (SIMD) sort do the work.
+    n_drivers = ticks.shape[-1]
+    shift = max(1, (n_drivers - 1).bit_length())
+    max_key = (int(ticks.max(initial=0)) + 1) << shift
+    key_dtype = np.int16 if max_key <= np.iinfo(np.int16).max else np.int64
+    keys = ticks.astype(key_dtype) << key_dtype(shift)
+    keys |= np.arange(n_drivers, dtype=key_dtype)
+    keys.sort(axis=-1)
+    keys &= key_dtype((1 << shift) - 1)
+    return keys
+
+
+def points_lookup(points_system, n_drivers):
+    # points_system is {position: points}; returns points indexed by
+    # 0-based finishing position.
+    lookup = np.zeros(n_drivers, dtype=np.int32)
+    for position, points in points_system.items():
+        if position <= n_drivers:
+            lookup[position - 1] = points
+    return lookup
+
+
+# Batch races are processed in chunks of about this many (race, driver)
+# cells so the intermediate tick and key arrays stay bounded.
+BATCH_CELLS = 4_000_000
+
+
+def position_dtype(n_drivers):
+    # Smallest unsigned type that holds positions 1..n_drivers: uint8 for
+    # any real grid, uint16 for the stress-test fields.
+    return np.uint8 if n_drivers <= np.iinfo(np.uint8).max else np.uint16
+
+
+def run_race_batch(headstarts, points_system, n_races=None, rng=None):
+    # Many independent races in one call. headstarts is either an
+    # (n_races, n_drivers) matrix or one vector broadcast over n_races.
+    # Returns a dict with
+    #   positions  (n_races, n_drivers) finishing position (1-based) of every driver
+    #   points / wins / podiums  per-driver totals over all races
+    rng = np.random.default_rng() if rng is None else rng
+    headstarts = np.asarray(headstarts)
+    if headstarts.ndim == 1:
+        if n_races is None:
+            raise ValueError("n_races is required for a single headstart vector")
+        headstarts = np.broadcast_to(headstarts, (n_races, headstarts.shape[0]))
+    n_races, n_drivers = headstarts.shape
+    dtype = position_dtype(n_drivers)
+    # Indexed directly by position, so slot 0 (never used) stays zero
+    position_points = np.concatenate([[0], points_lookup(points_system, n_drivers)])
+
+    positions = np.empty((n_races, n_drivers), dtype=dtype)
+    points = np.zeros(n_drivers, dtype=np.int64)
+    slots = np.arange(1, n_drivers + 1, dtype=dtype)
+    chunk = max(1, BATCH_CELLS // n_drivers)
+    for start in range(0, n_races, chunk):
+        stop = min(n_races, start + chunk)
+        order = finish_order_from_ticks(sample_finish_ticks(headstarts[start:stop], rng=rng))
+        block = positions[start:stop]
+        np.put_along_axis(block, order.astype(np.intp), np.broadcast_to(slots, block.shape), axis=1)
+        points += position_points.take(block).sum(axis=0)
+    return {
+        "positions": positions,
+        "points": points,
+        "wins": np.count_nonzero(positions == 1, axis=0),
+        "podiums": np.count_nonzero(positions <= 3, axis=0),
+    }
+
+
+def finish_position_probabilities(headstarts):
+    # Exact P(position == k + 1) for every driver, shape (n_drivers, n_drivers).
+    # Conditioned on driver i finishing on tick t, each rival j is ahead of i
+    # independently with probability P(T_j < t), plus P(T_j == t) when j has
+    # the lower grid index (the loop's tie-break). The number of rivals ahead
+    # is then a Poisson-binomial, built one rival at a time for every (i, t).
+    headstarts = np.asarray(headstarts)
+    n_drivers = headstarts.shape[-1]
+    pmfs = {int(h): finish_tick_pmf(int(h)) for h in np.unique(headstarts)}
+    n_ticks = max(len(pmf) for pmf in pmfs.values())
+    pmf = np.zeros((n_drivers, n_ticks))
+    for i, h in enumerate(headstarts):
+        pmf[i, :len(pmfs[int(h)])] = pmfs[int(h)]
+    before = np.cumsum(pmf, axis=1) - pmf
+
+    ahead_counts = np.zeros((n_drivers, n_ticks, n_drivers))
+    ahead_counts[:, :, 0] = 1.0
+    drivers = np.arange(n_drivers)
+    for j in range(n_drivers):
+        p = before[j] + (drivers > j)[:, None] * pmf[j]
+        p[j] = 0.0
+        p = p[:, :, None]
+        shifted = ahead_counts[:, :, :-1] * p
+        ahead_counts *= 1.0 - p
+        ahead_counts[:, :, 1:] += shifted
+    return np.einsum("it,itk->ik", pmf, ahead_counts)
+
+
+def expected_points(headstarts, points_system):
+    # Exact expected points per race for every driver.
+    probabilities = finish_position_probabilities(headstarts)
+    return probabilities @ points_lookup(points_system, probabilities.shape[0])
+
+
+def instant_race(headstarts, rng=None):
+    # A whole race in one draw: sample every driver's finish tick from the
+    # distribution for their headstart and sort. Same finish-order
+    # distribution as run_race(), without stepping ticks.
+    return finish_order_from_ticks(sample_finish_ticks(headstarts, rng=rng))
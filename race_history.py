@@ -0,0 +1,110 @@
+# Columnar store of every completed race in a session.
+# One row per race holds the finishing position of every driver (by driver
+# ID), so a long season costs races x drivers bytes instead of a list of
+# (position, driver, team) tuples per race.
+from collections import namedtuple
+
+import numpy as np
+
+from race_engine import position_dtype, replay_race
+
+# Podium of one race as driver IDs and team IDs, (P1, P2, P3) each; names
+# are only looked up when a summary is displayed
+RaceSummary = namedtuple("RaceSummary", ["race", "drivers", "teams"])
+
+
+class RaceHistory:
+    # positions       (races, drivers) finishing position, 1-based
+    # race_numbers    race number of each row
+    # seeds           season seed each race was drawn from
+    # instant         whether each race was run instant (True) or tick by tick
+    # headstart_ids   row of headstart_sets each race was run with
+    # headstart_sets  distinct headstart vectors by driver ID; consecutive
+    #                 races with unchanged headstarts share one
+    # Storage grows by doubling, so appends are amortised O(drivers).
+    __slots__ = ("_positions", "_race_numbers", "_seeds", "_instant", "_headstart_ids",
+                 "headstart_sets", "n_races")
+
+    def __init__(self, n_drivers, capacity=32):
+        self._positions = np.zeros((capacity, n_drivers), dtype=position_dtype(n_drivers))
+        self._race_numbers = np.zeros(capacity, dtype=np.int32)
+        self._seeds = np.zeros(capacity, dtype=np.uint32)
+        self._instant = np.zeros(capacity, dtype=bool)
+        self._headstart_ids = np.zeros(capacity, dtype=np.int32)
+        self.headstart_sets = []
+        self.n_races = 0
+
+    def __len__(self):
+        return self.n_races
+
+    @property
+    def n_drivers(self):
+        return self._positions.shape[1]
+
+    def _grow(self):
+        capacity = 2 * len(self._race_numbers)
+        positions = np.zeros((capacity, self.n_drivers), dtype=self._positions.dtype)
+        positions[:self.n_races] = self._positions[:self.n_races]
+        self._positions = positions
+        self._race_numbers = np.resize(self._race_numbers, capacity)
+        self._seeds = np.resize(self._seeds, capacity)
+        self._instant = np.resize(self._instant, capacity)
+        self._headstart_ids = np.resize(self._headstart_ids, capacity)
+
+    def append(self, finish_order, race_number, seed, headstarts, instant):
+        # finish_order is the driver IDs in finishing order, headstarts the
+        # headstart of every driver ID the race was run with
+        if self.n_races == len(self._race_numbers):
+            self._grow()
+        row = self._positions[self.n_races]
+        row[np.asarray(finish_order)] = np.arange(1, self.n_drivers + 1)
+        self._race_numbers[self.n_races] = race_number
+        self._seeds[self.n_races] = seed
+        self._instant[self.n_races] = instant
+        headstarts = np.asarray(headstarts, dtype=np.uint8)
+        if not self.headstart_sets or not np.array_equal(self.headstart_sets[-1], headstarts):
+            self.headstart_sets.append(headstarts)
+        self._headstart_ids[self.n_races] = len(self.headstart_sets) - 1
+        self.n_races += 1
+
+    @property
+    def positions(self):
+        return self._positions[:self.n_races]
+
+    @property
+    def race_numbers(self):
+        return self._race_numbers[:self.n_races]
+
+    @property
+    def seeds(self):
+        return self._seeds[:self.n_races]
+
+    @property
+    def instant(self):
+        return self._instant[:self.n_races]
+
+    @property
+    def headstart_ids(self):
+        return self._headstart_ids[:self.n_races]
+
+    def headstarts(self, race):
+        # Headstart of every driver ID in one race (row)
+        return self.headstart_sets[self._headstart_ids[race]]
+
+    def replay(self, race):
+        # Regenerate the finish order of one race (row) from its seed,
+        # headstarts and mode
+        return replay_race(self.headstarts(race), int(self._seeds[race]),
+                           int(self._race_numbers[race]), bool(self._instant[race]))
+
+    def slice(self, start=None, stop=None):
+        # Positions for a range of races (rows), e.g. slice(-3) for the last three
+        return self.positions[start:stop]
+
+    def column(self, driver):
+        # Every finishing position of one driver ID, in race order
+        return self.positions[:, driver]
+
+    def finish_order(self, race):
+        # Driver IDs in finishing order for one race (row)
+        return np.argsort(self.positions[race], kind="stable")
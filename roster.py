@@ -0,0 +1,74 @@
+# Grid definitions shared by race-v17.py / race-v18.py.
+# The real F1 grid lives in each script; this module builds the larger
+# synthetic fields used for stress-testing and karting-style leagues, and
+# the Roster registry that gives every driver and team an integer ID.
+import numpy as np
+
+from race_history import RaceSummary
+
+# Field sizes offered in the UI; None keeps the script's own F1 grid
+GRID_SIZES = {"F1 (20)": None, "100": 100, "1,000": 1_000, "10,000": 10_000}
+DRIVERS_PER_TEAM = 2
+
+# Golden-angle hue steps keep neighbouring teams visually distinct
+HUE_STEP = 137.508
+
+
+def stress_grid(n_drivers):
+    # Returns (teams_drivers, team_colors) for a field of n_drivers entrants
+    # (a multiple of DRIVERS_PER_TEAM), in the same shapes as the
+    # hand-written F1 grid.
+    n_teams = n_drivers // DRIVERS_PER_TEAM
+    width = len(str(n_drivers))
+    teams_drivers = {}
+    team_colors = {}
+    for t in range(n_teams):
+        team = f"Team {t + 1:0{width}d}"
+        first = t * DRIVERS_PER_TEAM
+        teams_drivers[team] = [f"D{d + 1:0{width}d}" for d in range(first, first + DRIVERS_PER_TEAM)]
+        team_colors[team] = f"hsl({t * HUE_STEP % 360:.0f}, 70%, {35 + (t % 3) * 10}%)"
+    return teams_drivers, team_colors
+
+
+class Roster:
+    # Integer IDs for every driver and team. Driver IDs follow grid order
+    # (team by team, as listed in teams_drivers), which is also the index
+    # the race engine uses, so engine results index the roster directly.
+    #   drivers / teams           ID -> display name
+    #   driver_ids / team_ids     display name -> ID
+    #   driver_team               driver ID -> team ID (array)
+    #   team_drivers              team ID -> tuple of driver IDs
+    #   driver_team_names         driver ID -> team name
+    __slots__ = ("drivers", "teams", "driver_ids", "team_ids", "driver_team", "team_drivers",
+                 "driver_team_names")
+
+    def __init__(self, teams_drivers):
+        self.teams = tuple(teams_drivers)
+        self.drivers = tuple(driver for team_drivers in teams_drivers.values() for driver in team_drivers)
+        self.team_ids = {team: t for t, team in enumerate(self.teams)}
+        self.driver_ids = {driver: d for d, driver in enumerate(self.drivers)}
+        self.driver_team = np.repeat(
+            np.arange(len(self.teams)), [len(team_drivers) for team_drivers in teams_drivers.values()])
+        self.team_drivers = tuple(
+            tuple(self.driver_ids[driver] for driver in team_drivers) for team_drivers in teams_drivers.values())
+        self.driver_team_names = tuple(self.teams[t] for t in self.driver_team)
+
+    def __len__(self):
+        return len(self.drivers)
+
+    @property
+    def n_teams(self):
+        return len(self.teams)
+
+    def team_of(self, driver):
+        # Team name for a driver name
+        return self.driver_team_names[self.driver_ids[driver]]
+
+    def label(self, driver_id):
+        # Display form "Driver (Team)" for a driver ID
+        return f"{self.drivers[driver_id]} ({self.driver_team_names[driver_id]})"
+
+    def summary(self, race, finish_order):
+        # RaceSummary (driver and team IDs of the podium) for a finish order
+        podium = tuple(int(d) for d in finish_order[:3])
+        return RaceSummary(race, podium, tuple(int(self.driver_team[d]) for d in podium))
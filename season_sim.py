@@ -0,0 +1,201 @@
+# Season-level Monte Carlo built on the finish-tick tables in race_engine.
+# Every sampled season is a (races x drivers) block of finish ticks, so a
+# whole batch of seasons is one (samples x races x drivers) computation.
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from race_engine import finish_order_from_ticks, points_lookup, sample_finish_ticks
+
+# Samples are processed in chunks so memory stays bounded for long seasons.
+# About 1M (race, driver) cells keeps a chunk's ticks and sort keys in
+# cache; 4M was about 10% slower for title_odds().
+CHUNK_CELLS = 1_000_000
+
+
+def simulate_season_totals(headstarts, n_races, n_samples, points_system, rng=None):
+    # Points, wins and podiums gained over n_races for n_samples seasons.
+    # Each result has shape (n_samples, n_drivers).
+    rng = np.random.default_rng() if rng is None else rng
+    headstarts = np.asarray(headstarts)
+    n_drivers = headstarts.shape[-1]
+    lookup = points_lookup(points_system, n_drivers)
+    points = np.zeros((n_samples, n_drivers), dtype=np.int32)
+    wins = np.zeros((n_samples, n_drivers), dtype=np.int32)
+    podiums = np.zeros((n_samples, n_drivers), dtype=np.int32)
+    if n_races <= 0:
+        return points, wins, podiums
+
+    # Finishing slots that score or count as a podium
+    scoring = int(np.flatnonzero(lookup)[-1]) + 1 if lookup.any() else 0
+    slots = min(n_drivers, max(3, scoring))
+    chunk = max(1, CHUNK_CELLS // (n_races * n_drivers))
+    # Flat (sample, driver, slot) cell of slot k for driver 0 of each sample
+    offsets = np.arange(chunk)[:, None, None] * (n_drivers * slots) + np.arange(slots)
+    for start in range(0, n_samples, chunk):
+        stop = min(n_samples, start + chunk)
+        order = finish_order_from_ticks(sample_finish_ticks(headstarts, size=(stop - start, n_races), rng=rng))
+        # Flat (sample, driver, slot) cell for every counted finishing slot;
+        # one unweighted bincount gives how often each driver took each
+        # slot, and every statistic is read off those counts.
+        cells = np.multiply(order[..., :slots], slots, dtype=np.intp)
+        cells += offsets[:stop - start]
+        counts = np.bincount(cells.ravel(), minlength=(stop - start) * n_drivers * slots)
+        counts = counts.reshape(stop - start, n_drivers, slots)
+        points[start:stop] = counts @ lookup[:slots]
+        wins[start:stop] = counts[..., 0]
+        podiums[start:stop] = counts[..., :3].sum(axis=-1)
+    return points, wins, podiums
+
+
+def championship_order(points, wins):
+    # Rank drivers by points, then wins, then grid index (axis -1).
+    tie_break = int(wins.max(initial=0)) + 1
+    return np.argsort(-(points.astype(np.int64) * tie_break + wins), axis=-1, kind="stable")
+
+
+def title_odds(current_points, current_wins, headstarts, races_remaining, points_system,
+               n_samples=100_000, rng=None):
+    # Returns per-driver probabilities of winning the title, finishing in the
+    # championship top 3 and ending the season with points.
+    current_points = np.asarray(current_points, dtype=np.int32)
+    current_wins = np.asarray(current_wins, dtype=np.int32)
+    n_drivers = current_points.shape[-1]
+    points, wins, _ = simulate_season_totals(headstarts, races_remaining, n_samples, points_system, rng)
+    points += current_points
+    wins += current_wins
+
+    order = championship_order(points, wins)
+    title = np.bincount(order[:, 0], minlength=n_drivers) / n_samples
+    top3 = np.bincount(order[:, :3].ravel(), minlength=n_drivers) / n_samples
+    scored = (points > 0).mean(axis=0)
+    return {"title": title, "top3": top3, "points": scored}
+
+
+# Large offline studies: seasons are split into fixed-size tasks that run in
+# a process pool. Every task gets its own child of one SeedSequence, so the
+# streams are independent and a seed gives the same histograms no matter how
+# many workers run it. Tasks are small so they far outnumber the workers
+# (100 for the default 1M seasons) and the pool stays evenly loaded on any
+# core count.
+SEASONS_PER_BLOCK = 50_000
+SEASONS_PER_TASK = 10_000
+
+
+def _season_histograms(headstarts, n_races, n_seasons, points_system, seed_seq):
+    # Per-task histograms:
+    #   positions[d, p] seasons driver d finished the championship in place p + 1
+    #   wins[d, k]      seasons driver d won exactly k races
+    #   podiums[d, k]   seasons driver d had exactly k podiums
+    rng = np.random.default_rng(seed_seq)
+    n_drivers = len(headstarts)
+    positions = np.zeros(n_drivers * n_drivers, dtype=np.int64)
+    wins = np.zeros(n_drivers * (n_races + 1), dtype=np.int64)
+    podiums = np.zeros(n_drivers * (n_races + 1), dtype=np.int64)
+    driver_rows = np.arange(n_drivers) * (n_races + 1)
+    for start in range(0, n_seasons, SEASONS_PER_BLOCK):
+        block = min(SEASONS_PER_BLOCK, n_seasons - start)
+        points, season_wins, season_podiums = simulate_season_totals(headstarts, n_races, block, points_system, rng)
+        order = championship_order(points, season_wins)
+        positions += np.bincount((order * n_drivers + np.arange(n_drivers)).ravel(), minlength=positions.size)
+        wins += np.bincount((season_wins + driver_rows).ravel(), minlength=wins.size)
+        podiums += np.bincount((season_podiums + driver_rows).ravel(), minlength=podiums.size)
+    return {
+        "positions": positions.reshape(n_drivers, n_drivers),
+        "wins": wins.reshape(n_drivers, n_races + 1),
+        "podiums": podiums.reshape(n_drivers, n_races + 1),
+    }
+
+
+def simulate_championships(headstarts, n_races, n_seasons, points_system, workers=None, seed=None):
+    # Simulate n_seasons full seasons across a process pool and reduce the
+    # per-task histograms into one result.
+    if n_seasons <= 0:
+        raise ValueError("n_seasons must be positive")
+    headstarts = [int(h) for h in headstarts]
+    workers = workers or os.cpu_count() or 1
+    task_sizes = [min(SEASONS_PER_TASK, n_seasons - start) for start in range(0, n_seasons, SEASONS_PER_TASK)]
+    n_tasks = len(task_sizes)
+    seed_seq = np.random.SeedSequence(seed)
+    streams = seed_seq.spawn(n_tasks)
+
+    started = time.perf_counter()
+    if workers == 1 or n_tasks == 1:
+        parts = [_season_histograms(headstarts, n_races, size, points_system, stream)
+                 for size, stream in zip(task_sizes, streams)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(
+                _season_histograms,
+                [headstarts] * n_tasks, [n_races] * n_tasks, task_sizes,
+                [points_system] * n_tasks, streams
+            ))
+    elapsed = time.perf_counter() - started
+
+    result = {key: sum(part[key] for part in parts) for key in parts[0]}
+    result.update({
+        "seasons": n_seasons,
+        "races": n_races,
+        "seed": seed_seq.entropy,
+        "workers": workers,
+        "elapsed": elapsed,
+        "seasons_per_second": n_seasons / elapsed if elapsed > 0 else float("inf"),
+    })
+    return result
+
+
+# Grid used by the command line entry point (mirrors race-v17.py)
+teams_drivers = {
+    "Alpine": ["Gas", "Doo"],
+    "Aston Martin": ["Alo", "Str"],
+    "Ferrari": ["Lec", "Ham"],
+    "Haas": ["Oco", "Bea"],
+    "McLaren": ["Nor", "Pia"],
+    "Mercedes": ["Rus", "Ant"],
+    "Racing Bulls": ["Had", "Law"],
+    "Red Bull": ["Ver", "Tsu"],
+    "Sauber": ["Hul", "Bor"],
+    "Williams": ["Sai", "Alb"]
+}
+points_system = {1: 25, 2: 18, 3: 15, 4: 12, 5: 10, 6: 8, 7: 6, 8: 4, 9: 2, 10: 1}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate many F1 seasons across a process pool.")
+    parser.add_argument("--seasons", type=int, default=1_000_000)
+    parser.add_argument("--races", type=int, default=24)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--headstarts", default="1",
+                        help="one headstart for every driver, or a comma-separated value per driver")
+    args = parser.parse_args(argv)
+
+    grid = [(driver, team) for team, team_drivers in teams_drivers.items() for driver in team_drivers]
+    headstarts = [int(h) for h in args.headstarts.split(",")]
+    if len(headstarts) == 1:
+        headstarts = headstarts * len(grid)
+    if len(headstarts) != len(grid):
+        parser.error(f"expected 1 or {len(grid)} headstarts, got {len(headstarts)}")
+
+    result = simulate_championships(headstarts, args.races, args.seasons, points_system,
+                                    workers=args.workers, seed=args.seed)
+    positions = result["positions"]
+    expected_wins = (result["wins"] * np.arange(args.races + 1)).sum(axis=1) / args.seasons
+    expected_podiums = (result["podiums"] * np.arange(args.races + 1)).sum(axis=1) / args.seasons
+    average_position = (positions * np.arange(1, len(grid) + 1)).sum(axis=1) / args.seasons
+
+    print(f"{args.seasons:,} seasons x {args.races} races on {result['workers']} workers "
+          f"in {result['elapsed']:.2f}s ({result['seasons_per_second']:,.0f} seasons/s, seed {result['seed']})")
+    print(f"{'Driver':<8}{'Team':<14}{'Title %':>9}{'Top 3 %':>9}{'Avg Pos':>9}{'Wins':>7}{'Podiums':>9}")
+    for i in np.argsort(-positions[:, 0], kind="stable"):
+        driver, team = grid[i]
+        print(f"{driver:<8}{team:<14}{positions[i, 0] / args.seasons * 100:>9.2f}"
+              f"{positions[i, :3].sum() / args.seasons * 100:>9.2f}{average_position[i]:>9.2f}"
+              f"{expected_wins[i]:>7.2f}{expected_podiums[i]:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# Championship standings for race-v17.py / race-v18.py.
+# Points, wins and podiums are arrays indexed by driver ID and team ID (see
+# roster.Roster). Applying a race is one fancy-indexed add per statistic
+# plus a bincount up to team level, and the rankings every tab reads are
+# kept sorted as races come in instead of being re-sorted on each rerun.
+import numpy as np
+
+from race_engine import points_lookup
+
+
+def driver_ratings(points, wins, podiums, races):
+    # 0-10 rating for every driver: share of the maximum points (x5), win
+    # rate (x3) and podium rate (x2); everyone starts on 5.0.
+    if races == 0:
+        return np.full(len(points), 5.0)
+    rating = np.minimum(points / (races * 25), 1.0) * 5.0 + (wins / races) * 3.0 + (podiums / races) * 2.0
+    return np.clip(rating, 0.0, 10.0)
+
+
+def _resort(order, primary, secondary=None):
+    # Re-rank a previous ranking by primary (then secondary) descending,
+    # ties by ID. One race moves few entries, so the previous order is
+    # nearly sorted and the stable sort runs close to linear.
+    key = -primary[order].astype(np.int64)
+    if secondary is not None:
+        key = key * (int(secondary.max(initial=0)) + 1) - secondary[order]
+    key = key * len(order) + order
+    return order[np.argsort(key, kind="stable")]
+
+
+class Standings:
+    # driver_points / driver_wins / driver_podiums     indexed by driver ID
+    # team_points / team_wins / team_podiums           indexed by team ID
+    # driver_ranking / team_ranking                    IDs by points
+    # driver_wins_ranking / team_wins_ranking          IDs by wins, then podiums
+    # ratings                                          driver_ratings() after the last race
+    # rating_history                                   (races, drivers) ratings after each race
+    # position_points is points_system as points by 0-based finishing position.
+    __slots__ = ("position_points", "scoring", "driver_team", "n_races", "ratings", "_rating_history",
+                 "driver_points", "driver_wins", "driver_podiums",
+                 "team_points", "team_wins", "team_podiums",
+                 "driver_ranking", "team_ranking", "driver_wins_ranking", "team_wins_ranking")
+
+    def __init__(self, points_system, driver_team, n_teams):
+        n_drivers = len(driver_team)
+        self.position_points = points_lookup(points_system, n_drivers)
+        self.scoring = int(np.flatnonzero(self.position_points)[-1]) + 1 if self.position_points.any() else 0
+        self.driver_team = np.asarray(driver_team)
+        self.n_races = 0
+        self.driver_points = np.zeros(n_drivers, dtype=np.int64)
+        self.driver_wins = np.zeros(n_drivers, dtype=np.int64)
+        self.driver_podiums = np.zeros(n_drivers, dtype=np.int64)
+        self.team_points = np.zeros(n_teams, dtype=np.int64)
+        self.team_wins = np.zeros(n_teams, dtype=np.int64)
+        self.team_podiums = np.zeros(n_teams, dtype=np.int64)
+        self.driver_ranking = np.arange(n_drivers)
+        self.team_ranking = np.arange(n_teams)
+        self.driver_wins_ranking = np.arange(n_drivers)
+        self.team_wins_ranking = np.arange(n_teams)
+        self.ratings = driver_ratings(self.driver_points, self.driver_wins, self.driver_podiums, 0)
+        self._rating_history = np.zeros((8, n_drivers), dtype=np.float32)
+
+    @property
+    def n_drivers(self):
+        return len(self.driver_points)
+
+    @property
+    def n_teams(self):
+        return len(self.team_points)
+
+    @property
+    def rating_history(self):
+        return self._rating_history[:self.n_races]
+
+    def ranked_drivers(self, limit=None):
+        # (driver ID, points) in championship order
+        ids = self.driver_ranking[:limit]
+        return list(zip(ids.tolist(), self.driver_points[ids].tolist()))
+
+    def ranked_teams(self, limit=None):
+        # (team ID, points) in championship order
+        ids = self.team_ranking[:limit]
+        return list(zip(ids.tolist(), self.team_points[ids].tolist()))
+
+    def points_for(self, position):
+        # Points for a 1-based finishing position
+        return int(self.position_points[position - 1]) if 0 < position <= self.n_drivers else 0
+
+    def apply(self, finish_order):
+        # finish_order is the driver IDs in finishing order
+        order = np.asarray(finish_order)
+        scorers = order[:self.scoring]
+        podium = order[:3]
+        self.driver_points[scorers] += self.position_points[:len(scorers)]
+        self.driver_wins[order[0]] += 1
+        self.driver_podiums[podium] += 1
+        self.team_points += np.bincount(
+            self.driver_team[scorers], weights=self.position_points[:len(scorers)],
+            minlength=self.n_teams).astype(np.int64)
+        self.team_wins[self.driver_team[order[0]]] += 1
+        self.team_podiums += np.bincount(self.driver_team[podium], minlength=self.n_teams)
+        self.n_races += 1
+
+        self.driver_ranking = _resort(self.driver_ranking, self.driver_points)
+        self.team_ranking = _resort(self.team_ranking, self.team_points)
+        self.driver_wins_ranking = _resort(self.driver_wins_ranking, self.driver_wins, self.driver_podiums)
+        self.team_wins_ranking = _resort(self.team_wins_ranking, self.team_wins, self.team_podiums)
+
+        # Ratings only move when a race is applied; one row per race, with
+        # the history doubling its capacity as the season grows
+        self.ratings = driver_ratings(self.driver_points, self.driver_wins, self.driver_podiums, self.n_races)
+        if self.n_races > len(self._rating_history):
+            history = np.zeros((2 * len(self._rating_history), self.n_drivers), dtype=np.float32)
+            history[:len(self._rating_history)] = self._rating_history
+            self._rating_history = history
+        self._rating_history[self.n_races - 1] = self.ratings